@@ -1617,6 +1617,38 @@ def import_article(request: Request, article: Dict, authorized: bool = Depends(v
         raise HTTPException(status_code=500, detail=f"Failed to import article: {str(e)}")
 
 
+@app.post("/api/admin/import-articles-batch")
+@limiter.limit("100/minute")
+def import_articles_batch(request: Request, articles: List[Dict], authorized: bool = Depends(verify_admin_token)):
+    """
+    Import a batch of articles in one transaction (for V1 migration)
+
+    Articles already stored (by URL) are skipped. Returns one status per
+    article, in request order.
+
+    Requires: Bearer token in Authorization header
+    Rate limit: 100 requests per minute per IP (up to 500 articles each)
+    """
+    if len(articles) > 500:
+        raise HTTPException(status_code=400, detail="At most 500 articles per batch")
+
+    try:
+        inserted = db.insert_articles(articles)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to import articles: {str(e)}")
+
+    results = []
+    for article in articles:
+        # pop: a URL repeated within the batch is only inserted once
+        article_id = inserted.pop(article.get('url'), None)
+        if article_id is not None:
+            results.append({'status': 'success', 'article_id': article_id})
+        else:
+            results.append({'status': 'skipped', 'reason': 'duplicate'})
+
+    return {'results': results}
+
+
 @app.get("/api/admin/db-status")
 @limiter.limit("20/minute")
 def database_status(request: Request, authorized: bool = Depends(verify_admin_token)):
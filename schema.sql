@@ -27,6 +27,8 @@ CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_date);
 CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
 CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(processing_status);
 CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(article_hash);
+CREATE INDEX IF NOT EXISTS idx_articles_completed_published ON articles(published_date DESC) INCLUDE (id, title) WHERE processing_status = 'completed' AND content IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_articles_pubdate_status ON articles(published_date) WHERE processing_status = 'completed';
 
 
 -- V2 Ensemble Extraction Results
@@ -93,6 +95,25 @@ CREATE INDEX IF NOT EXISTS idx_facts_article ON facts(article_id);
 CREATE INDEX IF NOT EXISTS idx_facts_entity_type ON facts(entity_type);
 CREATE INDEX IF NOT EXISTS idx_facts_confidence ON facts(confidence);
 CREATE INDEX IF NOT EXISTS idx_facts_wikidata ON facts(wikidata_id);
+CREATE INDEX IF NOT EXISTS idx_facts_article_entity_conf ON facts(article_id, entity) INCLUDE (confidence) WHERE confidence >= 0.6;
+
+-- Corpus-wide fact aggregates for relationship generation
+-- (refreshed after each batch run; unique indexes allow REFRESH ... CONCURRENTLY)
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_entity_importance AS
+SELECT entity, COUNT(DISTINCT article_id) as article_count
+FROM facts
+WHERE confidence >= 0.6
+GROUP BY entity;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_entity_importance_entity ON mv_entity_importance(entity);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_article_density AS
+SELECT article_id, COUNT(DISTINCT entity) as entity_count
+FROM facts
+WHERE confidence >= 0.6
+GROUP BY article_id;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_article_density_article ON mv_article_density(article_id);
 
 
 -- Entity Relationships (for network graph)
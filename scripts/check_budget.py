@@ -65,6 +65,11 @@ def get_costs(db):
 
 def check_budgets():
     """Check budgets and return alert level"""
+    # No caps configured - nothing to compare against, skip the database entirely
+    if DAILY_BUDGET <= 0 and MONTHLY_BUDGET <= 0:
+        print("✅ Budget tracking disabled (no daily or monthly cap set)")
+        return 0
+
     try:
         db = VermontSignalDatabase()
         db.connect()
@@ -116,16 +121,17 @@ def check_budgets():
             print(alert)
         print("")
         print("Cost Breakdown by Provider:")
+        pct_scale = 100.0 / monthly_cost if monthly_cost > 0 else 0
         for provider, cost in provider_costs.items():
-            pct = (cost / monthly_cost * 100) if monthly_cost > 0 else 0
-            print(f"  {provider}: ${cost:.2f} ({pct:.1f}%)")
+            print(f"  {provider}: ${cost:.2f} ({cost * pct_scale:.1f}%)")
         print("=" * 60)
     else:
         print(f"✅ Budget OK")
         print(f"   Daily: ${daily_cost:.2f} / ${DAILY_BUDGET:.2f} ({daily_pct:.1f}%)")
         print(f"   Monthly: ${monthly_cost:.2f} / ${MONTHLY_BUDGET:.2f} ({monthly_pct:.1f}%)")
         if provider_costs:
-            print(f"   Top provider: {max(provider_costs, key=provider_costs.get)} (${provider_costs[max(provider_costs, key=provider_costs.get)]:.2f})")
+            top_provider, top_cost = max(provider_costs.items(), key=lambda kv: kv[1])
+            print(f"   Top provider: {top_provider} (${top_cost:.2f})")
 
     return alert_level
 
@@ -16,6 +16,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from vermont_news_analyzer.modules.database import VermontSignalDatabase
 
 
+# Full-width status bar (100% == 50 blocks); rows slice it instead of rebuilding
+_BAR50 = "█" * 50
+
+
 def get_article_stats(db):
     """Get article processing statistics"""
     with db.get_connection() as conn:
@@ -32,18 +36,33 @@ def get_article_stats(db):
             """)
             status_counts = cur.fetchall()
 
-            # Total counts
+            # Total counts, plus average processing time (completed articles
+            # in last 7 days) and the sequential ETA derived from it
             cur.execute("""
-                SELECT
-                    COUNT(*) as total_articles,
-                    COUNT(*) FILTER (WHERE status = 'completed') as completed,
-                    COUNT(*) FILTER (WHERE status = 'pending') as pending,
-                    COUNT(*) FILTER (WHERE status = 'processing') as processing,
-                    COUNT(*) FILTER (WHERE status = 'failed') as failed,
-                    COUNT(*) FILTER (WHERE status = 'duplicate') as duplicate
-                FROM articles
+                WITH counts AS (
+                    SELECT
+                        COUNT(*) as total_articles,
+                        COUNT(*) FILTER (WHERE status = 'completed') as completed,
+                        COUNT(*) FILTER (WHERE status = 'pending') as pending,
+                        COUNT(*) FILTER (WHERE status = 'processing') as processing,
+                        COUNT(*) FILTER (WHERE status = 'failed') as failed,
+                        COUNT(*) FILTER (WHERE status = 'duplicate') as duplicate
+                    FROM articles
+                ),
+                timing AS (
+                    SELECT AVG(EXTRACT(EPOCH FROM (updated_at - created_at)))::float8 as avg_seconds
+                    FROM articles
+                    WHERE status = 'completed'
+                      AND updated_at >= NOW() - INTERVAL '7 days'
+                      AND created_at IS NOT NULL
+                )
+                SELECT counts.*, timing.avg_seconds,
+                       counts.pending * timing.avg_seconds as eta_seconds
+                FROM counts, timing
             """)
-            totals = cur.fetchone()
+            row = cur.fetchone()
+            totals = row[:6]
+            avg_processing_time, sequential_eta = row[6], row[7]
 
             # Recent completions (last 24 hours)
             cur.execute("""
@@ -54,17 +73,6 @@ def get_article_stats(db):
             """)
             recent_completions = cur.fetchone()[0]
 
-            # Average processing time (for completed articles in last 7 days)
-            cur.execute("""
-                SELECT AVG(EXTRACT(EPOCH FROM (updated_at - created_at))) as avg_seconds
-                FROM articles
-                WHERE status = 'completed'
-                  AND updated_at >= NOW() - INTERVAL '7 days'
-                  AND created_at IS NOT NULL
-            """)
-            avg_time_result = cur.fetchone()[0]
-            avg_processing_time = float(avg_time_result) if avg_time_result else None
-
             # Get some sample pending articles
             cur.execute("""
                 SELECT id, title, source, created_at
@@ -98,6 +106,7 @@ def get_article_stats(db):
         'totals': totals,
         'recent_completions': recent_completions,
         'avg_processing_time': avg_processing_time,
+        'sequential_eta': sequential_eta,
         'sample_pending': sample_pending,
         'sample_failed': sample_failed,
         'total_facts': total_facts,
@@ -153,10 +162,11 @@ def main():
 
     # Status breakdown
     print(f"\n📈 STATUS BREAKDOWN:")
-    for status, count, pct in stats['status_counts']:
-        bar_length = int(pct / 2)  # Scale to fit in terminal
-        bar = "█" * bar_length
-        print(f"   {status:12s} {count:5,} ({pct:5.1f}%) {bar}")
+    # Bar is pct/2 wide to fit in terminal
+    print("\n".join(
+        f"   {status:12s} {count:5,} ({pct:5.1f}%) {_BAR50[:int(pct / 2)]}"
+        for status, count, pct in stats['status_counts']
+    ))
 
     # Facts and relationships
     print(f"\n🔍 EXTRACTED DATA:")
@@ -175,7 +185,7 @@ def main():
         print(f"   Avg processing time: {format_time(avg_time)}")
 
         # Sequential ETA
-        sequential_eta_seconds = pending * avg_time
+        sequential_eta_seconds = stats['sequential_eta']
         print(f"\n⏱️  ESTIMATED TIME REMAINING:")
         print(f"   Sequential (1 at a time): {format_time(sequential_eta_seconds)}")
 
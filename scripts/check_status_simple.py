@@ -5,14 +5,20 @@ Simple pipeline status check (no heavy dependencies)
 
 import os
 import psycopg2
+from urllib.parse import quote
 from datetime import datetime, timedelta
 
-# Database connection params
-DB_HOST = os.getenv('DATABASE_HOST', '65.109.160.153')
-DB_PORT = os.getenv('DATABASE_PORT', '5432')
-DB_NAME = os.getenv('DATABASE_NAME', 'vermont_signal')
-DB_USER = os.getenv('DATABASE_USER', 'postgres')
-DB_PASSWORD = os.getenv('DATABASE_PASSWORD', 'O9GjQvXVult0Hx7QwOjgBR3V3ikmIwmfyhjsqtdf85oWfrZG')
+# Database connection string (built once at import; DATABASE_URL takes precedence)
+DSN = os.getenv('DATABASE_URL') or (
+    f"postgresql://{quote(os.getenv('DATABASE_USER', 'postgres'), safe='')}"
+    f":{quote(os.getenv('DATABASE_PASSWORD', ''), safe='')}"
+    f"@{os.getenv('DATABASE_HOST', 'localhost')}:{os.getenv('DATABASE_PORT', '5432')}"
+    f"/{os.getenv('DATABASE_NAME', 'vermont_signal')}"
+)
+
+
+# Full-width status bar (100% == 50 blocks); rows slice it instead of rebuilding
+_BAR50 = "█" * 50
 
 
 def format_time(seconds):
@@ -30,32 +36,39 @@ def format_time(seconds):
 
 def main():
     try:
-        conn = psycopg2.connect(
-            host=DB_HOST,
-            port=DB_PORT,
-            database=DB_NAME,
-            user=DB_USER,
-            password=DB_PASSWORD
-        )
+        conn = psycopg2.connect(DSN)
         cur = conn.cursor()
 
         print("\n" + "=" * 70)
         print("VERMONT SIGNAL - PIPELINE STATUS")
         print("=" * 70)
 
-        # Total counts
+        # Total counts, plus average processing time (completed in last 7 days)
+        # and the sequential ETA derived from it
         cur.execute("""
-            SELECT
-                COUNT(*) as total_articles,
-                COUNT(*) FILTER (WHERE status = 'completed') as completed,
-                COUNT(*) FILTER (WHERE status = 'pending') as pending,
-                COUNT(*) FILTER (WHERE status = 'processing') as processing,
-                COUNT(*) FILTER (WHERE status = 'failed') as failed,
-                COUNT(*) FILTER (WHERE status = 'duplicate') as duplicate
-            FROM articles
+            WITH counts AS (
+                SELECT
+                    COUNT(*) as total_articles,
+                    COUNT(*) FILTER (WHERE status = 'completed') as completed,
+                    COUNT(*) FILTER (WHERE status = 'pending') as pending,
+                    COUNT(*) FILTER (WHERE status = 'processing') as processing,
+                    COUNT(*) FILTER (WHERE status = 'failed') as failed,
+                    COUNT(*) FILTER (WHERE status = 'duplicate') as duplicate
+                FROM articles
+            ),
+            timing AS (
+                SELECT AVG(EXTRACT(EPOCH FROM (updated_at - created_at)))::float8 as avg_seconds
+                FROM articles
+                WHERE status = 'completed'
+                  AND updated_at >= NOW() - INTERVAL '7 days'
+                  AND created_at IS NOT NULL
+            )
+            SELECT counts.*, timing.avg_seconds,
+                   counts.pending * timing.avg_seconds as eta_seconds
+            FROM counts, timing
         """)
-        totals = cur.fetchone()
-        total, completed, pending, processing, failed, duplicate = totals
+        (total, completed, pending, processing, failed, duplicate,
+         avg_processing_time, sequential_eta_seconds) = cur.fetchone()
 
         print(f"\n📊 ARTICLE COUNTS:")
         print(f"   Total Articles:      {total:,}")
@@ -77,10 +90,10 @@ def main():
             ORDER BY count DESC
         """)
         print(f"\n📈 STATUS BREAKDOWN:")
-        for status, count, pct in cur.fetchall():
-            bar_length = int(pct / 2)
-            bar = "█" * bar_length
-            print(f"   {status:12s} {count:5,} ({pct:5.1f}%) {bar}")
+        print("\n".join(
+            f"   {status:12s} {count:5,} ({pct:5.1f}%) {_BAR50[:int(pct / 2)]}"
+            for status, count, pct in cur.fetchall()
+        ))
 
         # Facts and relationships
         cur.execute("SELECT COUNT(*) FROM facts")
@@ -104,17 +117,6 @@ def main():
         """)
         recent_completions = cur.fetchone()[0]
 
-        # Average processing time
-        cur.execute("""
-            SELECT AVG(EXTRACT(EPOCH FROM (updated_at - created_at))) as avg_seconds
-            FROM articles
-            WHERE status = 'completed'
-              AND updated_at >= NOW() - INTERVAL '7 days'
-              AND created_at IS NOT NULL
-        """)
-        avg_time_result = cur.fetchone()[0]
-        avg_processing_time = float(avg_time_result) if avg_time_result else None
-
         print(f"\n⚡ RECENT ACTIVITY:")
         print(f"   Completed (24h):     {recent_completions:,} articles")
 
@@ -123,7 +125,6 @@ def main():
             avg_time = avg_processing_time
             print(f"   Avg processing time: {format_time(avg_time)}")
 
-            sequential_eta_seconds = pending * avg_time
             print(f"\n⏱️  ESTIMATED TIME REMAINING:")
             print(f"   Sequential (1 at a time): {format_time(sequential_eta_seconds)}")
 
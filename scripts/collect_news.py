@@ -128,10 +128,10 @@ Examples:
             logger.info("DRY RUN MODE - articles will NOT be stored")
             total_articles = 0
             for feed_url in feed_list:
-                articles = collector.fetch_feed(feed_url)
-                total_articles += len(articles)
+                found = collector.count_feed(feed_url)
+                total_articles += found
                 print(f"\n{feed_url}")
-                print(f"  Found: {len(articles)} articles")
+                print(f"  Found: {found} articles")
 
             print(f"\nTotal articles that would be collected: {total_articles}")
             print("(Not stored - dry run mode)")
@@ -153,8 +153,7 @@ Examples:
         print("=" * 80)
 
         # Check for unprocessed articles
-        unprocessed = db.get_unprocessed_articles(limit=1)
-        if unprocessed:
+        if db.has_unprocessed_articles():
             print(f"\n✓ Articles ready for processing")
             print(f"  Run: python vermont_news_analyzer/batch_processor.py")
         else:
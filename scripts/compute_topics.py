@@ -6,15 +6,38 @@ Computes BERTopic topics from processed articles and stores in database
 
 import os
 import sys
+import io
+import hashlib
 import logging
 import argparse
+from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional
 
+import numpy as np
+from psycopg2.extras import execute_values
+
+try:
+    import torch
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMER_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMER_AVAILABLE = False
+
+try:
+    from sklearn.decomposition import TruncatedSVD
+    from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+    from sklearn.pipeline import make_pipeline, make_union
+    SKLEARN_AVAILABLE = True
+except ImportError:
+    SKLEARN_AVAILABLE = False
+
 # Add project root to path
 sys.path.append(str(Path(__file__).parent.parent))
 
+from vermont_news_analyzer.config import DATA_DIR, NLPConfig
 from vermont_news_analyzer.modules.database import VermontSignalDatabase
 from vermont_news_analyzer.modules.nlp_tools import TopicModeler
 
@@ -24,23 +47,170 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# On-disk cache of per-document embeddings, reused across runs
+EMBEDDING_CACHE_DIR = DATA_DIR / "cache" / "embeddings"
+
+# Last full run's BERTopic model, reloaded for incremental assignment
+TOPIC_MODEL_DIR = DATA_DIR / "models" / "bertopic"
+
+# Article content is cut to this many characters before leaving the database
+MAX_DOCUMENT_CHARS = 4096
+
+# Rows per mogrified multi-VALUES upsert: one round trip each, well under
+# the server's query size limit
+UPSERT_CHUNK_ROWS = 50_000
+
+# Below this many documents, multi-process pool startup outweighs the speedup
+MULTI_GPU_MIN_DOCUMENTS = 5000
+
 
 class TopicComputer:
     """
     Compute and store topics from article corpus
     """
 
-    def __init__(self, min_topic_size: int = 3):
+    def __init__(self, min_topic_size: int = 3, fast_embeddings: bool = False):
         """
         Initialize topic computer
 
         Args:
             min_topic_size: Minimum documents per topic
+            fast_embeddings: Use a hashing/TF-IDF/SVD pipeline instead of a sentence
+                             transformer (much faster on CPU-only hosts, lower quality)
         """
         self.db = VermontSignalDatabase()
-        self.topic_modeler = TopicModeler(min_topic_size=min_topic_size)
+        self.fast_embeddings = fast_embeddings
+        if fast_embeddings:
+            self.embedding_model = self._build_fast_embedding_pipeline()
+        else:
+            self.embedding_model = self._load_embedding_model()
+        self.topic_modeler = TopicModeler(
+            min_topic_size=min_topic_size,
+            embedding_model=self.embedding_model
+        )
         self.min_topic_size = min_topic_size
 
+    def _load_embedding_model(self):
+        """
+        Load the sentence transformer once, on the fastest available device
+
+        Returns:
+            SentenceTransformer, or None to let BERTopic load its default
+        """
+        if not SENTENCE_TRANSFORMER_AVAILABLE:
+            logger.warning("sentence-transformers not installed, BERTopic will embed documents itself")
+            return None
+
+        if torch.cuda.is_available():
+            device = "cuda"
+        elif torch.backends.mps.is_available():
+            device = "mps"
+        else:
+            device = "cpu"
+
+        logger.info(f"Loading embedding model {NLPConfig.SENTENCE_TRANSFORMER_MODEL} on {device}")
+        return SentenceTransformer(NLPConfig.SENTENCE_TRANSFORMER_MODEL, device=device)
+
+    def _build_fast_embedding_pipeline(self):
+        """
+        Build a scikit-learn pipeline producing BERTopic-compatible embeddings
+
+        Returns:
+            Unfitted HashingVectorizer -> TfidfTransformer -> TruncatedSVD pipeline
+        """
+        if not SKLEARN_AVAILABLE:
+            raise ImportError("scikit-learn not installed (required for --fast-embeddings)")
+
+        logger.info("Using fast hashing/TF-IDF/SVD embeddings")
+        return make_pipeline(
+            make_union(
+                HashingVectorizer(n_features=10_000),
+                HashingVectorizer(n_features=9_000),
+                HashingVectorizer(n_features=8_000)
+            ),
+            TfidfTransformer(),
+            TruncatedSVD(100)
+        )
+
+    def embed_documents(self, documents: List[str]) -> Optional[np.ndarray]:
+        """
+        Encode documents, reusing cached per-document embeddings from earlier runs
+
+        Embeddings are cached on disk keyed by a sha1 of model name + document
+        text, so re-runs only encode new or changed articles.
+
+        Args:
+            documents: Cleaned document texts
+
+        Returns:
+            (n_documents, dim) embedding matrix, or None if no embedding model is loaded
+        """
+        if self.embedding_model is None:
+            return None
+
+        if self.fast_embeddings:
+            # Fitted per corpus (and cheap), so not cached; the fitted pipeline
+            # stays on the BERTopic model for later transform() calls
+            logger.info(f"Fitting fast embeddings for {len(documents)} documents")
+            return self.embedding_model.fit_transform(documents).astype(np.float32)
+
+        model_prefix = NLPConfig.SENTENCE_TRANSFORMER_MODEL.encode('utf-8') + b'\0'
+        cache_paths = []
+        for doc in documents:
+            key = hashlib.sha1(model_prefix + doc.encode('utf-8')).hexdigest()
+            cache_paths.append(EMBEDDING_CACHE_DIR / key[:2] / f"{key}.npy")
+
+        miss_idx = [i for i, path in enumerate(cache_paths) if not path.exists()]
+        miss_set = set(miss_idx)
+
+        dim = self.embedding_model.get_sentence_embedding_dimension()
+        embeddings = np.empty((len(documents), dim), dtype=np.float32)
+
+        for i, path in enumerate(cache_paths):
+            if i not in miss_set:
+                embeddings[i] = np.load(path)
+
+        logger.info(
+            f"Embedding cache: {len(documents) - len(miss_idx)} hits, "
+            f"{len(miss_idx)} documents to encode"
+        )
+
+        if miss_idx:
+            encoded = self._encode([documents[i] for i in miss_idx])
+            for i, vector in zip(miss_idx, encoded):
+                embeddings[i] = vector
+                cache_paths[i].parent.mkdir(parents=True, exist_ok=True)
+                np.save(cache_paths[i], vector)
+
+        return embeddings
+
+    def _encode(self, documents: List[str]) -> np.ndarray:
+        """Encode documents with the sentence transformer, across all GPUs for large batches"""
+        gpu_count = torch.cuda.device_count()
+        if gpu_count > 1 and len(documents) > MULTI_GPU_MIN_DOCUMENTS:
+            logger.info(f"Encoding {len(documents)} documents across {gpu_count} GPUs")
+            pool = self.embedding_model.start_multi_process_pool(
+                target_devices=[f"cuda:{i}" for i in range(gpu_count)]
+            )
+            try:
+                return self.embedding_model.encode_multi_process(
+                    documents,
+                    pool,
+                    batch_size=128,
+                    chunk_size=5000,
+                    normalize_embeddings=True
+                )
+            finally:
+                self.embedding_model.stop_multi_process_pool(pool)
+
+        return self.embedding_model.encode(
+            documents,
+            batch_size=128,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=True
+        )
+
     def connect(self):
         """Connect to database"""
         self.db.connect()
@@ -51,10 +221,26 @@ class TopicComputer:
         self.db.disconnect()
         logger.info("Disconnected from database")
 
+    @contextmanager
+    def _connection(self, conn=None):
+        """
+        Yield the caller's connection if given, otherwise one from the pool
+
+        Lets run_topic_computation hold a single connection (and a single
+        write transaction) across every step of the workflow.
+        """
+        if conn is not None:
+            yield conn
+        else:
+            with self.db.get_connection() as pooled_conn:
+                yield pooled_conn
+
     def get_articles_for_topic_modeling(
         self,
         days: Optional[int] = None,
-        min_length: int = 100
+        min_length: int = 100,
+        unassigned_only: bool = False,
+        conn=None
     ) -> List[Dict]:
         """
         Retrieve articles for topic modeling
@@ -62,49 +248,75 @@ class TopicComputer:
         Args:
             days: Only include articles from last N days (None = all)
             min_length: Minimum article content length
+            unassigned_only: Skip articles that already have topic assignments
+            conn: Optional shared connection (defaults to one from the pool)
 
         Returns:
             List of article dicts with id, title, content
         """
         logger.info(f"Fetching articles for topic modeling (days={days}, min_length={min_length})")
 
+        # Content is truncated server-side: embedding models only see the
+        # first few hundred tokens, so the tail is never worth transferring
         query = """
-            SELECT id, title, content, published_date
+            SELECT id, title, LEFT(content, %s)
             FROM articles
             WHERE processing_status = 'completed'
               AND content IS NOT NULL
               AND LENGTH(content) >= %s
         """
 
-        params = [min_length]
+        params = [MAX_DOCUMENT_CHARS, min_length]
 
         if days:
             query += " AND published_date >= CURRENT_DATE - INTERVAL %s"
             params.append(f'{days} days')
 
+        if unassigned_only:
+            query += """
+              AND NOT EXISTS (
+                  SELECT 1 FROM article_topics at WHERE at.article_id = articles.id
+              )
+            """
+
         query += " ORDER BY published_date DESC"
 
-        with self.db.get_connection() as conn:
-            with conn.cursor() as cur:
+        # Server-side cursor streams rows in batches instead of buffering the
+        # whole result set (full article content) in libpq before conversion
+        with self._connection(conn) as conn:
+            with conn.cursor(name='topic_articles_cursor') as cur:
+                cur.itersize = 2000
                 cur.execute(query, params)
-                rows = cur.fetchall()
 
-                articles = []
-                for row in rows:
-                    articles.append({
-                        'id': row[0],
-                        'title': row[1],
-                        'content': row[2],
-                        'published_date': row[3]
-                    })
+                articles = [
+                    {'id': article_id, 'title': title, 'content': content}
+                    for article_id, title, content in cur
+                ]
+
+            # End the read transaction so a shared connection doesn't sit
+            # idle-in-transaction while the model trains
+            conn.commit()
+
+            logger.info(f"Retrieved {len(articles)} articles for topic modeling")
+            return articles
+
+    def _prepare_documents(self, documents: List[str]) -> List[str]:
+        """Clean documents and cut them to the embedding model's window"""
+        documents = self.topic_modeler.clean_documents(documents)
 
-                logger.info(f"Retrieved {len(articles)} articles for topic modeling")
-                return articles
+        # Drop text past the embedding model's window (~4 chars per token)
+        # so the tokenizer doesn't process a tail it would truncate anyway
+        if not self.fast_embeddings and self.embedding_model is not None:
+            max_chars = self.embedding_model.max_seq_length * 4
+            documents = [doc[:max_chars] for doc in documents]
+
+        return documents
 
     def compute_topics(
         self,
         articles: List[Dict],
-        use_consensus_summary: bool = False
+        use_consensus_summary: bool = False,
+        conn=None
     ) -> Dict:
         """
         Compute topics from articles using BERTopic
@@ -112,6 +324,7 @@ class TopicComputer:
         Args:
             articles: List of article dicts
             use_consensus_summary: Use consensus summary instead of full content
+            conn: Optional shared connection (defaults to one from the pool)
 
         Returns:
             Topic result dict with topics and article assignments
@@ -124,22 +337,23 @@ class TopicComputer:
 
         # Prepare documents
         if use_consensus_summary:
-            # Use consensus summaries instead of full content
-            documents = []
-            article_ids = []
-
-            for article in articles:
-                # Fetch consensus summary from extraction_results
-                with self.db.get_connection() as conn:
-                    with conn.cursor() as cur:
-                        cur.execute(
-                            "SELECT consensus_summary FROM extraction_results WHERE article_id = %s",
-                            (article['id'],)
-                        )
-                        result = cur.fetchone()
-                        if result and result[0]:
-                            documents.append(result[0])
-                            article_ids.append(article['id'])
+            # Use consensus summaries instead of full content, fetched in one query
+            ids = [a['id'] for a in articles]
+            with self._connection(conn) as conn:
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        SELECT article_id, consensus_summary
+                        FROM extraction_results
+                        WHERE article_id = ANY(%s)
+                          AND consensus_summary IS NOT NULL
+                          AND consensus_summary <> ''
+                    """, (ids,))
+                    summary_by_id = dict(cur.fetchall())
+                conn.commit()
+
+            # Keep the original article ordering
+            article_ids = [i for i in ids if i in summary_by_id]
+            documents = [summary_by_id[i] for i in article_ids]
 
             logger.info(f"Using {len(documents)} consensus summaries for topic modeling")
         else:
@@ -151,8 +365,14 @@ class TopicComputer:
             logger.error("No valid documents for topic modeling")
             return None
 
-        # Train topic model
-        topic_result = self.topic_modeler.train_topics(documents)
+        # Clean and embed once, then train topic model on the precomputed embeddings
+        documents = self._prepare_documents(documents)
+        embeddings = self.embed_documents(documents)
+        topic_result = self.topic_modeler.train_topics(
+            documents,
+            embeddings=embeddings,
+            pre_cleaned=True
+        )
 
         # Add article IDs to result
         topic_result.article_ids = article_ids
@@ -164,13 +384,15 @@ class TopicComputer:
 
         return topic_result
 
-    def store_topics(self, topic_result, corpus_size: int) -> int:
+    def store_topics(self, topic_result, corpus_size: int, articles: List[Dict], conn=None) -> int:
         """
         Store computed topics in database
 
         Args:
             topic_result: TopicResult from BERTopic
             corpus_size: Total number of documents in corpus
+            articles: Article dicts used for modeling (source of representative titles)
+            conn: Optional shared connection; when given, the caller commits
 
         Returns:
             Number of topics stored
@@ -178,92 +400,119 @@ class TopicComputer:
         logger.info("Storing topics in database")
 
         computed_at = datetime.now()
-        stored_count = 0
 
-        with self.db.get_connection() as conn:
-            with conn.cursor() as cur:
-                # Store each topic in corpus_topics
-                for topic in topic_result.topics:
-                    topic_id = topic['topic_id']
-                    topic_label = topic.get('name', f"Topic {topic_id}")
-                    keywords = topic.get('keywords', [])
-                    article_count = topic.get('count', 0)
-
-                    # Get representative documents (top 3 article titles)
-                    representative_docs = []
-                    for i, (doc_topic_id, prob) in enumerate(topic_result.document_topics):
-                        if doc_topic_id == topic_id and len(representative_docs) < 3:
-                            article_id = topic_result.article_ids[i]
-                            # Fetch article title
-                            cur.execute(
-                                "SELECT title FROM articles WHERE id = %s",
-                                (article_id,)
-                            )
-                            title_row = cur.fetchone()
-                            if title_row:
-                                representative_docs.append(title_row[0])
-
-                    # Insert into corpus_topics
-                    cur.execute("""
+        # Index titles and per-topic article ids once, in document order
+        title_by_id = {a['id']: a['title'] for a in articles}
+        docs_by_topic = defaultdict(list)
+        for (doc_topic_id, _), article_id in zip(topic_result.document_topics, topic_result.article_ids):
+            docs_by_topic[doc_topic_id].append(article_id)
+
+        topic_rows = []
+        for topic in topic_result.topics:
+            topic_id = topic['topic_id']
+            topic_label = topic.get('name', f"Topic {topic_id}")
+            keywords = topic.get('keywords', [])
+            article_count = topic.get('count', 0)
+
+            # Get representative documents (top 3 article titles)
+            representative_docs = [
+                title_by_id[article_id]
+                for article_id in docs_by_topic[topic_id]
+                if article_id in title_by_id
+            ][:3]
+
+            topic_rows.append((
+                topic_id,
+                topic_label,
+                keywords,
+                representative_docs,
+                article_count,
+                computed_at,
+                corpus_size
+            ))
+
+        with self._connection(conn) as shared_conn:
+            with shared_conn.cursor() as cur:
+                # Store all topics in corpus_topics in one statement
+                if topic_rows:
+                    execute_values(cur, """
                         INSERT INTO corpus_topics
                         (topic_id, topic_label, keywords, representative_docs, article_count, computed_at, corpus_size)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    """, (
-                        topic_id,
-                        topic_label,
-                        keywords,
-                        representative_docs,
-                        article_count,
-                        computed_at,
-                        corpus_size
-                    ))
+                        VALUES %s
+                    """, topic_rows, page_size=1000)
 
-                    stored_count += 1
+            if conn is None:
+                shared_conn.commit()
 
-                conn.commit()
+        stored_count = len(topic_rows)
 
         logger.info(f"Stored {stored_count} topics in corpus_topics table")
         return stored_count
 
-    def store_article_topic_assignments(self, topic_result) -> int:
+    def store_article_topic_assignments(self, topic_result, conn=None) -> int:
         """
         Store article-topic assignments in database
 
         Args:
             topic_result: TopicResult from BERTopic
+            conn: Optional shared connection; when given, the caller commits
 
         Returns:
             Number of assignments stored
         """
         logger.info("Storing article-topic assignments")
 
-        stored_count = 0
-
-        with self.db.get_connection() as conn:
-            with conn.cursor() as cur:
-                # Clear existing assignments (for fresh computation)
-                cur.execute("DELETE FROM article_topics")
+        rows = self._assignment_rows(topic_result.document_topics, topic_result.article_ids)
 
-                # Store each article-topic assignment
-                for i, (topic_id, probability) in enumerate(topic_result.document_topics):
-                    article_id = topic_result.article_ids[i]
+        with self._connection(conn) as shared_conn:
+            with shared_conn.cursor() as cur:
+                # Replace all assignments (fresh computation): TRUNCATE + COPY
+                # avoids per-row WAL and dead tuples, and the table is empty
+                # so no ON CONFLICT is needed. Readers wait on the TRUNCATE
+                # lock until commit rather than seeing an empty table.
+                cur.execute("TRUNCATE article_topics")
 
-                    # Only store if topic is not outlier (-1)
-                    if topic_id != -1:
-                        cur.execute("""
-                            INSERT INTO article_topics (article_id, topic_id, probability)
-                            VALUES (%s, %s, %s)
-                            ON CONFLICT (article_id, topic_id) DO UPDATE
-                            SET probability = EXCLUDED.probability
-                        """, (article_id, topic_id, probability))
+                if rows:
+                    buf = io.StringIO(''.join(
+                        f"{article_id}\t{topic_id}\t{probability!r}\n"
+                        for article_id, topic_id, probability in rows
+                    ))
+                    cur.copy_from(buf, 'article_topics', columns=('article_id', 'topic_id', 'probability'))
 
-                        stored_count += 1
+            if conn is None:
+                shared_conn.commit()
 
-                conn.commit()
+        stored_count = len(rows)
 
         logger.info(f"Stored {stored_count} article-topic assignments")
         return stored_count
 
+    @staticmethod
+    def _assignment_rows(document_topics, article_ids) -> List[tuple]:
+        """Build article_topics rows, skipping the outlier topic (-1)"""
+        return [
+            (article_id, int(topic_id), float(probability))
+            for (topic_id, probability), article_id in zip(document_topics, article_ids)
+            if topic_id != -1
+        ]
+
+    @staticmethod
+    def _upsert_article_topics(cur, rows: List[tuple]) -> None:
+        """
+        Upsert (article_id, topic_id, probability) rows into article_topics
+
+        Rows are mogrified client-side into one multi-VALUES statement per
+        UPSERT_CHUNK_ROWS, keeping ON CONFLICT semantics (unlike COPY) with
+        far fewer round trips than execute_values' 1000-row pages.
+        """
+        for start in range(0, len(rows), UPSERT_CHUNK_ROWS):
+            chunk = rows[start:start + UPSERT_CHUNK_ROWS]
+            cur.execute(
+                b"INSERT INTO article_topics (article_id, topic_id, probability) VALUES "
+                + b",".join(cur.mogrify("(%s,%s,%s)", row) for row in chunk)
+                + b" ON CONFLICT (article_id, topic_id) DO UPDATE SET probability = EXCLUDED.probability"
+            )
+
     def run_topic_computation(
         self,
         days: Optional[int] = None,
@@ -285,8 +534,25 @@ class TopicComputer:
         logger.info("TOPIC COMPUTATION START")
         logger.info("=" * 60)
 
+        # One connection for the whole workflow; both stores share a single
+        # transaction so readers never see new topics with stale assignments
+        with self.db.get_connection() as conn:
+            try:
+                return self._run_topic_computation(conn, days, use_summary, min_length)
+            except Exception:
+                conn.rollback()
+                raise
+
+    def _run_topic_computation(
+        self,
+        conn,
+        days: Optional[int],
+        use_summary: bool,
+        min_length: int
+    ) -> Dict:
+        """Workflow body for run_topic_computation, on a shared connection"""
         # Step 1: Fetch articles
-        articles = self.get_articles_for_topic_modeling(days=days, min_length=min_length)
+        articles = self.get_articles_for_topic_modeling(days=days, min_length=min_length, conn=conn)
 
         if not articles:
             logger.error("No articles available for topic modeling")
@@ -298,7 +564,7 @@ class TopicComputer:
             }
 
         # Step 2: Compute topics
-        topic_result = self.compute_topics(articles, use_consensus_summary=use_summary)
+        topic_result = self.compute_topics(articles, use_consensus_summary=use_summary, conn=conn)
 
         if not topic_result:
             logger.error("Topic computation failed")
@@ -310,10 +576,17 @@ class TopicComputer:
             }
 
         # Step 3: Store topics
-        topics_stored = self.store_topics(topic_result, len(articles))
+        topics_stored = self.store_topics(topic_result, len(articles), articles, conn=conn)
 
         # Step 4: Store article-topic assignments
-        assignments_stored = self.store_article_topic_assignments(topic_result)
+        assignments_stored = self.store_article_topic_assignments(topic_result, conn=conn)
+
+        conn.commit()
+
+        # Keep the model for incremental runs; fast embeddings are refit per
+        # corpus, so later articles couldn't be embedded in the same space
+        if not self.fast_embeddings:
+            self.topic_modeler.save_model(TOPIC_MODEL_DIR)
 
         logger.info("=" * 60)
         logger.info("TOPIC COMPUTATION COMPLETE")
@@ -331,6 +604,73 @@ class TopicComputer:
             'assignments_stored': assignments_stored
         }
 
+    def run_incremental_topic_assignment(self, days: int = 1, min_length: int = 100) -> Dict:
+        """
+        Assign recent, unassigned articles to the topics of the last full run
+
+        Loads the saved model and matches new articles to existing topics by
+        cosine similarity, without re-clustering. Meant to run daily between
+        (e.g. weekly) full run_topic_computation runs.
+
+        Args:
+            days: Only consider articles from last N days
+            min_length: Minimum article content length
+
+        Returns:
+            Summary statistics
+        """
+        logger.info("=" * 60)
+        logger.info("INCREMENTAL TOPIC ASSIGNMENT START")
+        logger.info("=" * 60)
+
+        if self.fast_embeddings:
+            return {
+                'success': False,
+                'error': 'Incremental assignment requires sentence-transformer embeddings',
+                'articles_processed': 0,
+                'assignments_stored': 0
+            }
+
+        if not TOPIC_MODEL_DIR.exists():
+            logger.error(f"No saved topic model at {TOPIC_MODEL_DIR}, run a full computation first")
+            return {
+                'success': False,
+                'error': 'No saved topic model',
+                'articles_processed': 0,
+                'assignments_stored': 0
+            }
+
+        articles = self.get_articles_for_topic_modeling(
+            days=days,
+            min_length=min_length,
+            unassigned_only=True
+        )
+
+        if not articles:
+            logger.info("No new articles to assign")
+            return {'success': True, 'articles_processed': 0, 'assignments_stored': 0}
+
+        self.topic_modeler.load_model(TOPIC_MODEL_DIR)
+
+        documents = self._prepare_documents([a['content'] for a in articles])
+        embeddings = self.embed_documents(documents)
+        document_topics = self.topic_modeler.assign_topics(documents, embeddings=embeddings)
+
+        rows = self._assignment_rows(document_topics, [a['id'] for a in articles])
+
+        with self.db.get_connection() as conn:
+            with conn.cursor() as cur:
+                self._upsert_article_topics(cur, rows)
+            conn.commit()
+
+        logger.info(f"Assigned {len(rows)} of {len(articles)} new articles to existing topics")
+
+        return {
+            'success': True,
+            'articles_processed': len(articles),
+            'assignments_stored': len(rows)
+        }
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -359,16 +699,44 @@ def main():
         default=100,
         help='Minimum article content length (default: 100 characters)'
     )
+    parser.add_argument(
+        '--fast-embeddings',
+        action='store_true',
+        help='Use hashing/TF-IDF/SVD embeddings instead of a sentence transformer (CPU-only hosts)'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Assign new articles to the saved model\'s topics instead of retraining (default --days 1)'
+    )
 
     args = parser.parse_args()
 
     # Initialize topic computer
-    computer = TopicComputer(min_topic_size=args.min_topic_size)
+    computer = TopicComputer(
+        min_topic_size=args.min_topic_size,
+        fast_embeddings=args.fast_embeddings
+    )
 
     try:
         # Connect to database
         computer.connect()
 
+        if args.incremental:
+            results = computer.run_incremental_topic_assignment(
+                days=args.days or 1,
+                min_length=args.min_length
+            )
+
+            if results['success']:
+                print("\n✅ Incremental topic assignment successful!")
+                print(f"   Articles processed: {results['articles_processed']}")
+                print(f"   Assignments stored: {results['assignments_stored']}")
+                sys.exit(0)
+            else:
+                print(f"\n❌ Incremental topic assignment failed: {results.get('error', 'Unknown error')}")
+                sys.exit(1)
+
         # Run topic computation
         results = computer.run_topic_computation(
             days=args.days,
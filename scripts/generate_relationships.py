@@ -6,8 +6,11 @@ Backfill relationships for existing articles
 
 import sys
 import os
+import io
+import csv
 import psycopg2
 import logging
+import numpy as np
 
 logging.basicConfig(
     level=logging.INFO,
@@ -15,6 +18,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Lookup indexes on entity_relationships that the bulk insert doesn't need
+# (ON CONFLICT only uses the unique_relationship constraint)
+BULK_LOAD_INDEXES = {
+    'idx_relationships_entity_a': 'entity_relationships(entity_a)',
+    'idx_relationships_entity_b': 'entity_relationships(entity_b)',
+}
+
 
 def get_db_connection():
     """Get database connection from environment variables"""
@@ -32,8 +42,36 @@ def get_db_connection():
         )
 
 
-def generate_relationships(days=180):
-    """Generate co-occurrence relationships for articles"""
+def drop_bulk_load_indexes(cur):
+    """Drop lookup indexes inside the insert transaction (restored on rollback)"""
+    for name in BULK_LOAD_INDEXES:
+        cur.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def rebuild_bulk_load_indexes(conn):
+    """Rebuild lookup indexes in one sorted pass each, then refresh planner stats"""
+    logger.info("Rebuilding entity_relationships indexes...")
+
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction block
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            for name, target in BULK_LOAD_INDEXES.items():
+                cur.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {target}")
+            cur.execute("ANALYZE entity_relationships")
+    finally:
+        conn.autocommit = False
+
+
+def generate_relationships(days=180, rebuild_indexes=False):
+    """
+    Generate co-occurrence relationships for articles
+
+    With rebuild_indexes, the entity lookup indexes are dropped for the bulk
+    insert and rebuilt afterwards. Only use it for cold backfills: the drop
+    locks entity_relationships against reads for the whole insert, and the
+    lookups run unindexed until the rebuild finishes.
+    """
     logger.info("=" * 80)
     logger.info("ENTITY RELATIONSHIP GENERATION")
     logger.info("=" * 80)
@@ -61,31 +99,70 @@ def generate_relationships(days=180):
 
             logger.info(f"\nGenerating co-occurrence relationships...")
 
+            # Stage the join output in a temp table (not WAL-logged), then
+            # dedup and conflict-check once when merging into the real table
+            cur.execute("""
+                CREATE TEMP TABLE rel_staging (
+                    article_id INTEGER,
+                    entity_a TEXT,
+                    entity_b TEXT,
+                    confidence FLOAT
+                ) ON COMMIT DROP
+            """)
+
+            # Narrow to recent articles and high-confidence facts, group each
+            # article's facts into entity-sorted arrays in one pass, then
+            # enumerate i < j pairs from the arrays instead of self-joining facts
             query = """
-            INSERT INTO entity_relationships (article_id, entity_a, entity_b, relationship_type, confidence)
-            SELECT DISTINCT
-                f1.article_id,
-                LEAST(f1.entity, f2.entity) as entity_a,
-                GREATEST(f1.entity, f2.entity) as entity_b,
-                'co-occurrence' as relationship_type,
-                (f1.confidence + f2.confidence) / 2.0 as confidence
-            FROM facts f1
-            JOIN facts f2 ON f1.article_id = f2.article_id
-            JOIN articles a ON a.id = f1.article_id
-            WHERE f1.entity < f2.entity
-              AND f1.confidence >= 0.6
-              AND f2.confidence >= 0.6
-              AND a.published_date >= CURRENT_DATE - INTERVAL %s
-              AND a.processing_status = 'completed'
-            ON CONFLICT (article_id, entity_a, entity_b, relationship_type) DO NOTHING
+            WITH recent AS (
+                SELECT id
+                FROM articles
+                WHERE processing_status = 'completed'
+                  AND published_date >= CURRENT_DATE - INTERVAL %s
+            ),
+            article_entities AS (
+                SELECT
+                    article_id,
+                    array_agg(entity ORDER BY entity) as entities,
+                    array_agg(confidence ORDER BY entity) as confidences
+                FROM facts
+                WHERE confidence >= 0.6
+                  AND article_id IN (SELECT id FROM recent)
+                GROUP BY article_id
+                HAVING COUNT(*) > 1
+            )
+            INSERT INTO rel_staging (article_id, entity_a, entity_b, confidence)
+            SELECT
+                ae.article_id,
+                ae.entities[i] as entity_a,  -- arrays are sorted, so already ordered
+                ae.entities[j] as entity_b,
+                (ae.confidences[i] + ae.confidences[j]) / 2.0 as confidence
+            FROM article_entities ae
+            CROSS JOIN LATERAL generate_subscripts(ae.entities, 1) as i
+            CROSS JOIN LATERAL generate_subscripts(ae.entities, 1) as j
+            WHERE i < j
+              AND ae.entities[i] < ae.entities[j]  -- Same entity under two types
             """
 
             cur.execute(query, (f'{days} days',))
+
+            if rebuild_indexes:
+                drop_bulk_load_indexes(cur)
+
+            cur.execute("""
+                INSERT INTO entity_relationships (article_id, entity_a, entity_b, relationship_type, confidence)
+                SELECT DISTINCT article_id, entity_a, entity_b, 'co-occurrence', confidence
+                FROM rel_staging
+                ON CONFLICT (article_id, entity_a, entity_b, relationship_type) DO NOTHING
+            """)
             new_rels = cur.rowcount
             conn.commit()
 
             logger.info(f"✓ Generated {new_rels} new relationships")
 
+            if rebuild_indexes:
+                rebuild_bulk_load_indexes(conn)
+
             cur.execute('SELECT COUNT(*) FROM entity_relationships')
             final_count = cur.fetchone()[0]
 
@@ -103,14 +180,141 @@ def generate_relationships(days=180):
         conn.close()
 
 
+def generate_relationships_client_side(days=180, rebuild_indexes=False):
+    """
+    Generate co-occurrence relationships, enumerating pairs in NumPy
+
+    Pulls (article_id, entity, confidence) for qualifying facts once, builds
+    each article's i<j pairs with np.triu_indices, and bulk-loads them with
+    COPY. Avoids the facts self-join's memory blow-up on articles with very
+    many entities.
+    """
+    logger.info("=" * 80)
+    logger.info("ENTITY RELATIONSHIP GENERATION (client-side pairs)")
+    logger.info("=" * 80)
+
+    conn = get_db_connection()
+
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT f.article_id, f.entity, f.confidence
+                FROM facts f
+                JOIN articles a ON a.id = f.article_id
+                WHERE f.confidence >= 0.6
+                  AND a.processing_status = 'completed'
+                  AND a.published_date >= CURRENT_DATE - INTERVAL %s
+                ORDER BY f.article_id
+            """, (f'{days} days',))
+            rows = cur.fetchall()
+
+            logger.info(f"  Qualifying facts (last {days} days): {len(rows)}")
+            if not rows:
+                return 0
+
+            article_ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+            entities = [r[1] for r in rows]
+            confidences = np.fromiter((r[2] for r in rows), dtype=np.float64, count=len(rows))
+            # Integer codes so same-entity pairs (one entity, several types) can be dropped cheaply
+            _, entity_codes = np.unique(np.array(entities, dtype=object), return_inverse=True)
+
+            # Rows are sorted by article_id, so each article is one contiguous slice
+            _, starts = np.unique(article_ids, return_index=True)
+            ends = np.append(starts[1:], len(rows))
+
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            pair_count = 0
+
+            for start, end in zip(starts, ends):
+                if end - start < 2:
+                    continue
+
+                i, j = np.triu_indices(end - start, 1)
+                i += start
+                j += start
+                keep = entity_codes[i] != entity_codes[j]
+                i, j = i[keep], j[keep]
+                pair_conf = (confidences[i] + confidences[j]) / 2.0
+
+                article_id = int(article_ids[start])
+                writer.writerows(
+                    (article_id, entities[a], entities[b], c)
+                    for a, b, c in zip(i.tolist(), j.tolist(), pair_conf.tolist())
+                )
+                pair_count += len(i)
+
+            logger.info(f"  Candidate pairs: {pair_count}")
+
+            # Order each pair with LEAST/GREATEST in SQL so it matches the
+            # database collation used by the SQL path
+            cur.execute("""
+                CREATE TEMP TABLE rel_pairs (
+                    article_id INTEGER,
+                    entity_1 TEXT,
+                    entity_2 TEXT,
+                    confidence FLOAT
+                ) ON COMMIT DROP
+            """)
+            buffer.seek(0)
+            cur.copy_expert("COPY rel_pairs FROM STDIN WITH (FORMAT csv)", buffer)
+
+            if rebuild_indexes:
+                drop_bulk_load_indexes(cur)
+
+            cur.execute("""
+                INSERT INTO entity_relationships (article_id, entity_a, entity_b, relationship_type, confidence)
+                SELECT DISTINCT
+                    article_id,
+                    LEAST(entity_1, entity_2),
+                    GREATEST(entity_1, entity_2),
+                    'co-occurrence',
+                    confidence
+                FROM rel_pairs
+                ON CONFLICT (article_id, entity_a, entity_b, relationship_type) DO NOTHING
+            """)
+            new_rels = cur.rowcount
+            conn.commit()
+
+            logger.info(f"✓ Generated {new_rels} new relationships")
+
+            if rebuild_indexes:
+                rebuild_bulk_load_indexes(conn)
+
+            logger.info("=" * 80)
+
+            return new_rels
+
+    except Exception as e:
+        logger.error(f"Failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser()
     parser.add_argument('--days', type=int, default=180)
+    parser.add_argument(
+        '--client-side',
+        action='store_true',
+        help='Enumerate entity pairs in NumPy instead of a SQL self-join'
+    )
+    parser.add_argument(
+        '--rebuild-indexes',
+        action='store_true',
+        help='Drop the entity lookup indexes for the insert and rebuild them after '
+             '(cold backfills only; blocks graph reads while it runs)'
+    )
     args = parser.parse_args()
 
     try:
-        generate_relationships(days=args.days)
+        if args.client_side:
+            generate_relationships_client_side(days=args.days, rebuild_indexes=args.rebuild_indexes)
+        else:
+            generate_relationships(days=args.days, rebuild_indexes=args.rebuild_indexes)
         sys.exit(0)
     except Exception as e:
         logger.error(f"Failed: {e}")
@@ -8,6 +8,11 @@ import sys
 import os
 import psycopg2
 import logging
+import numpy as np
+from datetime import date, timedelta
+from functools import lru_cache
+from psycopg2.extras import execute_values
+from scipy import sparse
 
 logging.basicConfig(
     level=logging.INFO,
@@ -16,6 +21,159 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Ids per DELETE transaction when clearing a relationship type
+DELETE_BATCH_IDS = 50_000
+
+
+def delete_relationships_in_batches(conn, relationship_type, batch_size=DELETE_BATCH_IDS):
+    """
+    Delete one relationship type in primary-key ranges, committing each range
+
+    Keeps each transaction's row locks and WAL bounded (and lets autovacuum
+    keep up) instead of one DELETE over millions of rows. Ranges walk the id
+    index, so no batch rescans rows an earlier one already deleted.
+    """
+    deleted = 0
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT MIN(id), MAX(id) FROM entity_relationships")
+        min_id, max_id = cur.fetchone()
+        if min_id is None:
+            return 0
+
+        for start in range(min_id, max_id + 1, batch_size):
+            cur.execute("""
+                DELETE FROM entity_relationships
+                WHERE id >= %s AND id < %s
+                  AND relationship_type = %s
+            """, (start, start + batch_size, relationship_type))
+            deleted += cur.rowcount
+            conn.commit()
+
+    return deleted
+
+
+def window_start(days):
+    """First date of the analysis window, bound as a plain date parameter"""
+    return date.today() - timedelta(days=days)
+
+
+@lru_cache(maxsize=None)
+def aggregated_relationships_query(min_co_occurrences, min_importance, max_article_entities):
+    """
+    Build STRATEGY 1's SQL, specialized for one set of thresholds
+
+    Thresholds are inlined as integer literals (only the window start stays a
+    parameter) and filters that can't change the result are left out:
+    - min_co_occurrences <= 1: every pair qualifies, so no per-pair stats or
+      importance lookups
+    - max_article_entities <= 0: no article is focused, so no density join
+
+    Entity importance (articles per entity) and article density (entities
+    per article) come from the mv_entity_importance / mv_article_density
+    materialized views, refreshed after batches (or with refresh_aggregates).
+    """
+    min_co_occurrences = int(min_co_occurrences)
+    min_importance = int(min_importance)
+    max_article_entities = int(max_article_entities)
+
+    filter_pairs = min_co_occurrences > 1
+    use_focus = filter_pairs and max_article_entities > 0
+
+    focused_column = ""
+    density_join = ""
+    if use_focus:
+        focused_column = f""",
+                COALESCE(ad.entity_count <= {max_article_entities}, FALSE) as focused  -- Focused article"""
+        density_join = """
+            -- LEFT JOIN: facts newer than the last view refresh still count
+            LEFT JOIN mv_article_density ad ON ad.article_id = ae.article_id"""
+
+    query = f"""
+        -- Step 1: Resolve the in-window articles first (partial index on
+        -- published_date), so facts are only read for those ids
+        WITH recent_articles AS MATERIALIZED (
+            SELECT id
+            FROM articles
+            WHERE published_date >= %s::date
+              AND processing_status = 'completed'
+        ),
+        -- Collect each recent article's facts once, as arrays sorted by
+        -- entity (confidences kept in the same order)
+        article_entities AS (
+            SELECT
+                f.article_id,
+                array_agg(f.entity ORDER BY f.entity) as entities,
+                array_agg(f.confidence ORDER BY f.entity) as confidences
+            FROM facts f
+            JOIN recent_articles ra ON ra.id = f.article_id
+            WHERE f.confidence >= 0.6
+            GROUP BY f.article_id
+            HAVING COUNT(*) > 1
+        ),
+        -- Step 2: Enumerate every pair once from the sorted arrays (i < j)
+        -- instead of self-joining facts; the filters below all read this
+        all_pairs AS MATERIALIZED (
+            SELECT
+                ae.article_id,
+                ae.entities[i] as entity_a,  -- arrays are sorted, so already ordered
+                ae.entities[j] as entity_b,
+                (ae.confidences[i] + ae.confidences[j]) / 2.0 as confidence{focused_column}
+            FROM article_entities ae
+            CROSS JOIN LATERAL generate_subscripts(ae.entities, 1) as i
+            CROSS JOIN LATERAL generate_subscripts(ae.entities, 1) as j{density_join}
+            WHERE i < j
+              AND ae.entities[i] < ae.entities[j]  -- Same entity under two types
+        )"""
+
+    if filter_pairs:
+        any_focused = "BOOL_OR(focused)" if use_focus else "FALSE"
+        query += f""",
+        -- Step 3: Per-pair article count, and whether any occurrence is in a focused article
+        pair_stats AS (
+            SELECT
+                entity_a,
+                entity_b,
+                COUNT(DISTINCT article_id) as article_count,
+                {any_focused} as any_focused
+            FROM all_pairs
+            GROUP BY entity_a, entity_b
+        ),
+        -- Step 4: Qualifying pairs, in one pass over pair_stats:
+        -- cross-article, OR single-article with an important entity,
+        -- OR single focused article (few entities = all are central)
+        qualifying_pairs AS (
+            SELECT ps.entity_a, ps.entity_b
+            FROM pair_stats ps
+            LEFT JOIN mv_entity_importance ei1 ON ps.entity_a = ei1.entity
+            LEFT JOIN mv_entity_importance ei2 ON ps.entity_b = ei2.entity
+            WHERE ps.article_count >= {min_co_occurrences}
+               OR (ps.article_count = 1 AND (
+                       ps.any_focused
+                       OR ei1.article_count >= {min_importance}
+                       OR ei2.article_count >= {min_importance}
+                   ))
+        )"""
+
+    qualifying_join = "\n        JOIN qualifying_pairs qp USING (entity_a, entity_b)" if filter_pairs else ""
+    query += f"""
+        -- Step 5: Insert ALL occurrences of qualifying pairs
+        INSERT INTO entity_relationships (
+            article_id, entity_a, entity_b, relationship_type, confidence
+        )
+        SELECT DISTINCT
+            ap.article_id,
+            ap.entity_a,
+            ap.entity_b,
+            'co-occurrence' as relationship_type,
+            ap.confidence
+        FROM all_pairs ap{qualifying_join}
+        ON CONFLICT (article_id, entity_a, entity_b, relationship_type) DO NOTHING
+        """
+
+    return query
+
+
 def get_db_connection():
     """Get database connection from environment variables"""
     database_url = os.getenv('DATABASE_URL')
@@ -33,7 +191,7 @@ def get_db_connection():
 
 
 def generate_aggregated_relationships(days=180, min_co_occurrences=2, min_importance=3,
-                                     max_article_entities=20):
+                                     max_article_entities=20, refresh_aggregates=False):
     """
     STRATEGY 1: Hybrid Aggregation (Cross-Article + Importance + Article Density)
 
@@ -54,6 +212,7 @@ def generate_aggregated_relationships(days=180, min_co_occurrences=2, min_import
         min_co_occurrences: Minimum articles for cross-article relationships
         min_importance: Minimum article mentions for entity to be "important"
         max_article_entities: Max entities for "focused article" (default 20)
+        refresh_aggregates: Refresh the entity importance / article density views first
     """
     logger.info("=" * 80)
     logger.info("STRATEGY 1: HYBRID AGGREGATION (Multi-Level Filtering)")
@@ -66,129 +225,24 @@ def generate_aggregated_relationships(days=180, min_co_occurrences=2, min_import
 
     try:
         with conn.cursor() as cur:
+            if refresh_aggregates:
+                logger.info("\nRefreshing fact aggregate views...")
+                cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_entity_importance")
+                cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_article_density")
+                conn.commit()
+
             # First, clear old relationships
             logger.info("\nClearing old co-occurrence relationships...")
-            cur.execute("DELETE FROM entity_relationships WHERE relationship_type = 'co-occurrence'")
-            deleted = cur.rowcount
+            deleted = delete_relationships_in_batches(conn, 'co-occurrence')
             logger.info(f"  Deleted {deleted} old relationships")
 
             # Create aggregated relationships
             logger.info(f"\nGenerating aggregated relationships (min {min_co_occurrences} co-occurrences)...")
 
-            query = """
-            -- Step 1: Calculate entity importance (how many articles they appear in)
-            WITH entity_importance AS (
-                SELECT
-                    entity,
-                    COUNT(DISTINCT article_id) as article_count
-                FROM facts
-                WHERE confidence >= 0.6
-                GROUP BY entity
-            ),
-            -- Step 1b: Calculate article density (how many entities per article)
-            article_density AS (
-                SELECT
-                    article_id,
-                    COUNT(DISTINCT entity) as entity_count
-                FROM facts
-                WHERE confidence >= 0.6
-                GROUP BY article_id
-            ),
-            -- Step 2: Identify pairs appearing in multiple articles
-            cross_article_pairs AS (
-                SELECT
-                    LEAST(f1.entity, f2.entity) as entity_a,
-                    GREATEST(f1.entity, f2.entity) as entity_b,
-                    COUNT(DISTINCT f1.article_id) as article_count
-                FROM facts f1
-                JOIN facts f2 ON f1.article_id = f2.article_id
-                JOIN articles a ON a.id = f1.article_id
-                WHERE f1.entity < f2.entity
-                  AND f1.confidence >= 0.6
-                  AND f2.confidence >= 0.6
-                  AND a.published_date >= CURRENT_DATE - INTERVAL %s
-                  AND a.processing_status = 'completed'
-                GROUP BY entity_a, entity_b
-                HAVING COUNT(DISTINCT f1.article_id) >= %s
-            ),
-            -- Step 3: Identify important single-article pairs
-            important_single_pairs AS (
-                SELECT
-                    LEAST(f1.entity, f2.entity) as entity_a,
-                    GREATEST(f1.entity, f2.entity) as entity_b,
-                    COUNT(DISTINCT f1.article_id) as article_count
-                FROM facts f1
-                JOIN facts f2 ON f1.article_id = f2.article_id
-                JOIN articles a ON a.id = f1.article_id
-                JOIN entity_importance ei1 ON f1.entity = ei1.entity
-                JOIN entity_importance ei2 ON f2.entity = ei2.entity
-                WHERE f1.entity < f2.entity
-                  AND f1.confidence >= 0.6
-                  AND f2.confidence >= 0.6
-                  AND a.published_date >= CURRENT_DATE - INTERVAL %s
-                  AND a.processing_status = 'completed'
-                  -- At least one entity must be important
-                  AND (ei1.article_count >= %s OR ei2.article_count >= %s)
-                GROUP BY entity_a, entity_b
-                HAVING COUNT(DISTINCT f1.article_id) = 1
-            ),
-            -- Step 4: Identify focused-article pairs (few entities = all are central)
-            focused_article_pairs AS (
-                SELECT
-                    LEAST(f1.entity, f2.entity) as entity_a,
-                    GREATEST(f1.entity, f2.entity) as entity_b
-                FROM facts f1
-                JOIN facts f2 ON f1.article_id = f2.article_id
-                JOIN articles a ON a.id = f1.article_id
-                JOIN article_density ad ON f1.article_id = ad.article_id
-                WHERE f1.entity < f2.entity
-                  AND f1.confidence >= 0.6
-                  AND f2.confidence >= 0.6
-                  AND a.published_date >= CURRENT_DATE - INTERVAL %s
-                  AND a.processing_status = 'completed'
-                  AND ad.entity_count <= %s  -- Focused article
-                GROUP BY entity_a, entity_b
-                HAVING COUNT(DISTINCT f1.article_id) = 1
-            ),
-            -- Step 5: Combine all types of qualifying pairs
-            qualifying_pairs AS (
-                SELECT entity_a, entity_b FROM cross_article_pairs
-                UNION
-                SELECT entity_a, entity_b FROM important_single_pairs
-                UNION
-                SELECT entity_a, entity_b FROM focused_article_pairs
-            )
-            -- Step 5: Insert ALL occurrences of qualifying pairs
-            INSERT INTO entity_relationships (
-                article_id, entity_a, entity_b, relationship_type, confidence
-            )
-            SELECT DISTINCT
-                f1.article_id,
-                LEAST(f1.entity, f2.entity) as entity_a,
-                GREATEST(f1.entity, f2.entity) as entity_b,
-                'co-occurrence' as relationship_type,
-                (f1.confidence + f2.confidence) / 2.0 as confidence
-            FROM facts f1
-            JOIN facts f2 ON f1.article_id = f2.article_id
-            JOIN articles a ON a.id = f1.article_id
-            JOIN qualifying_pairs qp ON (
-                LEAST(f1.entity, f2.entity) = qp.entity_a
-                AND GREATEST(f1.entity, f2.entity) = qp.entity_b
+            query = aggregated_relationships_query(
+                min_co_occurrences, min_importance, max_article_entities
             )
-            WHERE f1.entity < f2.entity
-              AND f1.confidence >= 0.6
-              AND f2.confidence >= 0.6
-              AND a.published_date >= CURRENT_DATE - INTERVAL %s
-              AND a.processing_status = 'completed'
-            ON CONFLICT (article_id, entity_a, entity_b, relationship_type) DO NOTHING
-            """
-
-            cur.execute(query, (
-                f'{days} days', min_co_occurrences,  # cross-article pairs
-                f'{days} days', min_importance, min_importance,  # important single pairs
-                f'{days} days', max_article_entities,  # focused article pairs
-                f'{days} days'  # final insert
-            ))
+            cur.execute(query, (window_start(days),))
             new_rels = cur.rowcount
             conn.commit()
 
@@ -222,6 +276,156 @@ def generate_aggregated_relationships(days=180, min_co_occurrences=2, min_import
         conn.close()
 
 
+def generate_aggregated_relationships_sparse(days=180, min_co_occurrences=2, min_importance=3,
+                                            max_article_entities=20, refresh_aggregates=False):
+    """
+    STRATEGY 1, computed client-side with sparse matrices
+
+    Same filters as generate_aggregated_relationships, but pulls the qualifying
+    (article_id, entity) facts once and builds the binary article x entity
+    matrix A:
+    - A.T @ A gives each pair's article count
+    - The same product over focused articles only flags pairs seen in one
+    - Row sums of A give article density; importance still comes from
+      mv_entity_importance (it counts the whole corpus, not just the window)
+
+    Use when articles x entities comfortably fits in memory. Where an entity
+    has facts under several types in one article, the highest confidence is
+    used for its pairs.
+    """
+    logger.info("=" * 80)
+    logger.info("STRATEGY 1: HYBRID AGGREGATION (sparse matrices)")
+    logger.info(f"Cross-article threshold: {min_co_occurrences}+ articles")
+    logger.info(f"Importance threshold: {min_importance}+ mentions")
+    logger.info(f"Focused article threshold: ≤{max_article_entities} entities")
+    logger.info("=" * 80)
+
+    conn = get_db_connection()
+
+    try:
+        with conn.cursor() as cur:
+            if refresh_aggregates:
+                logger.info("\nRefreshing fact aggregate views...")
+                cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_entity_importance")
+                cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_article_density")
+                conn.commit()
+
+            cur.execute("""
+                SELECT f.article_id, f.entity, MAX(f.confidence)
+                FROM facts f
+                JOIN articles a ON a.id = f.article_id
+                WHERE f.confidence >= 0.6
+                  AND a.published_date >= %s::date
+                  AND a.processing_status = 'completed'
+                GROUP BY f.article_id, f.entity
+                ORDER BY f.article_id
+            """, (window_start(days),))
+            rows = cur.fetchall()
+
+            logger.info(f"\n  Qualifying facts (last {days} days): {len(rows)}")
+            if not rows:
+                return 0
+
+            cur.execute(
+                "SELECT entity FROM mv_entity_importance WHERE article_count >= %s",
+                (min_importance,)
+            )
+            important_entities = [row[0] for row in cur.fetchall()]
+
+            # Integer encoders: article -> matrix row, entity -> matrix column
+            article_ids = np.fromiter((r[0] for r in rows), dtype=np.int64, count=len(rows))
+            confidences = np.fromiter((r[2] for r in rows), dtype=np.float64, count=len(rows))
+            article_keys, article_rows = np.unique(article_ids, return_inverse=True)
+            entity_names, entity_cols = np.unique(
+                np.array([r[1] for r in rows], dtype=object), return_inverse=True
+            )
+            n_articles, n_entities = len(article_keys), len(entity_names)
+
+            A = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.int32), (article_rows, entity_cols)),
+                shape=(n_articles, n_entities)
+            )
+
+            # Pair article counts (upper triangle: column codes i < j)
+            counts = sparse.triu(A.T @ A, k=1).tocoo()
+            pair_keys = counts.row.astype(np.int64) * n_entities + counts.col
+
+            # Pairs seen in at least one focused article
+            focused = np.asarray(A.sum(axis=1)).ravel() <= max_article_entities
+            A_focused = A[focused]
+            focused_counts = sparse.triu(A_focused.T @ A_focused, k=1).tocoo()
+            focused_keys = focused_counts.row.astype(np.int64) * n_entities + focused_counts.col
+            any_focused = np.isin(pair_keys, focused_keys)
+
+            important = np.isin(entity_names, np.array(important_entities, dtype=object))
+
+            qualifies = (counts.data >= min_co_occurrences) | (
+                (counts.data == 1)
+                & (any_focused | important[counts.row] | important[counts.col])
+            )
+            qualifying_keys = np.sort(pair_keys[qualifies])
+            logger.info(f"  Qualifying pairs: {len(qualifying_keys)} of {len(pair_keys)}")
+
+            # Emit every occurrence of a qualifying pair; rows are sorted by
+            # article_id, so each article is one contiguous slice
+            _, starts = np.unique(article_ids, return_index=True)
+            ends = np.append(starts[1:], len(rows))
+            values = []
+
+            for start, end in zip(starts, ends):
+                if end - start < 2 or len(qualifying_keys) == 0:
+                    continue
+
+                i, j = np.triu_indices(end - start, 1)
+                i += start
+                j += start
+                lo = np.minimum(entity_cols[i], entity_cols[j]).astype(np.int64)
+                hi = np.maximum(entity_cols[i], entity_cols[j])
+                keys = lo * n_entities + hi
+
+                pos = np.searchsorted(qualifying_keys, keys)
+                keep = qualifying_keys[np.minimum(pos, len(qualifying_keys) - 1)] == keys
+                pair_conf = (confidences[i[keep]] + confidences[j[keep]]) / 2.0
+
+                article_id = int(article_ids[start])
+                values.extend(
+                    (article_id, entity_names[a], entity_names[b],
+                     entity_names[a], entity_names[b], c)
+                    for a, b, c in zip(lo[keep].tolist(), hi[keep].tolist(), pair_conf.tolist())
+                )
+
+            logger.info("\nReplacing co-occurrence relationships...")
+            deleted = delete_relationships_in_batches(conn, 'co-occurrence')
+            logger.info(f"  Deleted {deleted} old relationships")
+
+            # Order each pair with LEAST/GREATEST in SQL so it matches the
+            # database collation used by the SQL strategy
+            inserted = execute_values(cur, """
+                INSERT INTO entity_relationships (
+                    article_id, entity_a, entity_b, relationship_type, confidence
+                )
+                VALUES %s
+                ON CONFLICT (article_id, entity_a, entity_b, relationship_type) DO NOTHING
+                RETURNING 1
+            """, values,
+                template="(%s, LEAST(%s::text, %s::text), GREATEST(%s::text, %s::text), 'co-occurrence', %s)",
+                page_size=10000, fetch=True)
+            new_rels = len(inserted)
+            conn.commit()
+
+            logger.info(f"✓ Generated {new_rels} meaningful relationships")
+            logger.info("  (Cross-article + importance-weighted)")
+
+            return new_rels
+
+    except Exception as e:
+        logger.error(f"Failed: {e}")
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 def generate_weighted_relationships(days=180):
     """
     STRATEGY 2: Weighted by Co-occurrence Frequency
@@ -236,48 +440,91 @@ def generate_weighted_relationships(days=180):
 
     try:
         with conn.cursor() as cur:
-            logger.info("\nClearing old weighted relationships...")
-            cur.execute("DELETE FROM entity_relationships WHERE relationship_type = 'weighted-cooccurrence'")
-
+            # Upsert qualifying pairs in place and delete only the rows that no
+            # longer qualify, in one statement (data-modifying CTEs share a
+            # snapshot), instead of deleting and reinserting every row
             query = """
-            WITH entity_pair_stats AS (
+            WITH recent_articles AS MATERIALIZED (
+                SELECT id
+                FROM articles
+                WHERE published_date >= %s::date
+                  AND processing_status = 'completed'
+            ),
+            article_entities AS (
                 SELECT
-                    LEAST(f1.entity, f2.entity) as entity_a,
-                    GREATEST(f1.entity, f2.entity) as entity_b,
-                    COUNT(DISTINCT f1.article_id) as co_occurrence_count,
-                    AVG((f1.confidence + f2.confidence) / 2.0) as avg_confidence,
-                    MIN(f1.article_id) as first_article_id
-                FROM facts f1
-                JOIN facts f2 ON f1.article_id = f2.article_id
-                JOIN articles a ON a.id = f1.article_id
-                WHERE f1.entity < f2.entity
-                  AND f1.confidence >= 0.6
-                  AND f2.confidence >= 0.6
-                  AND a.published_date >= CURRENT_DATE - INTERVAL %s
-                  AND a.processing_status = 'completed'
-                GROUP BY entity_a, entity_b
-            )
-            INSERT INTO entity_relationships (
-                article_id, entity_a, entity_b, relationship_type,
-                relationship_description, confidence
+                    f.article_id,
+                    array_agg(f.entity ORDER BY f.entity) as entities,
+                    array_agg(f.confidence ORDER BY f.entity) as confidences
+                FROM facts f
+                JOIN recent_articles ra ON ra.id = f.article_id
+                WHERE f.confidence >= 0.6
+                GROUP BY f.article_id
+                HAVING COUNT(*) > 1
+            ),
+            entity_pair_stats AS (
+                SELECT
+                    ae.entities[i] as entity_a,
+                    ae.entities[j] as entity_b,
+                    COUNT(DISTINCT ae.article_id) as co_occurrence_count,
+                    AVG((ae.confidences[i] + ae.confidences[j]) / 2.0) as avg_confidence,
+                    MIN(ae.article_id) as first_article_id
+                FROM article_entities ae
+                CROSS JOIN LATERAL generate_subscripts(ae.entities, 1) as i
+                CROSS JOIN LATERAL generate_subscripts(ae.entities, 1) as j
+                WHERE i < j
+                  AND ae.entities[i] < ae.entities[j]
+                GROUP BY 1, 2
+            ),
+            qualifying_pairs AS (
+                SELECT *
+                FROM entity_pair_stats
+                WHERE co_occurrence_count >= 2  -- At least 2 articles
+            ),
+            upserted AS (
+                INSERT INTO entity_relationships (
+                    article_id, entity_a, entity_b, relationship_type,
+                    relationship_description, confidence
+                )
+                SELECT
+                    first_article_id,
+                    entity_a,
+                    entity_b,
+                    'weighted-cooccurrence',
+                    'Appears together in ' || co_occurrence_count || ' article(s)',
+                    avg_confidence
+                FROM qualifying_pairs
+                ON CONFLICT (article_id, entity_a, entity_b, relationship_type) DO UPDATE SET
+                    confidence = EXCLUDED.confidence,
+                    relationship_description = EXCLUDED.relationship_description
+                WHERE (entity_relationships.confidence, entity_relationships.relationship_description)
+                      IS DISTINCT FROM (EXCLUDED.confidence, EXCLUDED.relationship_description)
+                RETURNING 1
+            ),
+            removed AS (
+                -- Rows are keyed by first_article_id too, so a pair whose first
+                -- article moved out of the window is replaced, not duplicated
+                DELETE FROM entity_relationships r
+                WHERE r.relationship_type = 'weighted-cooccurrence'
+                  AND NOT EXISTS (
+                      SELECT 1
+                      FROM qualifying_pairs qp
+                      WHERE qp.first_article_id = r.article_id
+                        AND qp.entity_a = r.entity_a
+                        AND qp.entity_b = r.entity_b
+                  )
+                RETURNING 1
             )
             SELECT
-                first_article_id,
-                entity_a,
-                entity_b,
-                'weighted-cooccurrence',
-                'Appears together in ' || co_occurrence_count || ' article(s)',
-                avg_confidence
-            FROM entity_pair_stats
-            WHERE co_occurrence_count >= 2  -- At least 2 articles
-            ON CONFLICT (article_id, entity_a, entity_b, relationship_type) DO NOTHING
+                (SELECT COUNT(*) FROM upserted),
+                (SELECT COUNT(*) FROM removed)
             """
 
-            cur.execute(query, (f'{days} days',))
-            new_rels = cur.rowcount
+            cur.execute(query, (window_start(days),))
+            new_rels, removed_rels = cur.fetchone()
             conn.commit()
 
-            logger.info(f"✓ Generated {new_rels} weighted relationships")
+            logger.info(f"  Removed {removed_rels} weighted relationships that no longer qualify")
+            logger.info(f"✓ Generated or updated {new_rels} weighted relationships")
 
             return new_rels
 
@@ -303,16 +550,23 @@ if __name__ == "__main__":
                        help='Max entities in article to consider it "focused" (default 20)')
     parser.add_argument('--strategy', choices=['aggregated', 'weighted', 'both'],
                        default='aggregated', help='Which strategy to use')
+    parser.add_argument('--refresh-aggregates', action='store_true',
+                       help='Refresh entity importance / article density views before generating')
+    parser.add_argument('--sparse', action='store_true',
+                       help='Compute the aggregated strategy with sparse matrices instead of SQL')
 
     args = parser.parse_args()
 
     try:
         if args.strategy in ['aggregated', 'both']:
-            generate_aggregated_relationships(
+            aggregate = (generate_aggregated_relationships_sparse if args.sparse
+                         else generate_aggregated_relationships)
+            aggregate(
                 days=args.days,
                 min_co_occurrences=args.min_cooccurrences,
                 min_importance=args.min_importance,
-                max_article_entities=args.max_article_entities
+                max_article_entities=args.max_article_entities,
+                refresh_aggregates=args.refresh_aggregates
             )
 
         if args.strategy in ['weighted', 'both']:
@@ -6,9 +6,14 @@ Combines proximity, PMI, dynamic thresholding, and confidence weighting
 
 import sys
 import os
+import io
+import csv
 import logging
-from typing import Dict, List, Optional
-from collections import defaultdict
+import traceback
+from contextlib import nullcontext
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -25,24 +30,103 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Articles (one aggregated row each) per server-side cursor round trip
+FETCH_BATCH_SIZE = 1000
+
+# Articles handed to the process pool at a time, per worker; bounds how many
+# articles' entities are in flight instead of submitting the whole corpus
+POOL_ARTICLES_PER_WORKER = 64
+
+# Articles whose relationships are replaced per transaction in generate_all
+STORE_BATCH_ARTICLES = 500
+
+# Relationship types this generator owns (and replaces on each run)
+PROXIMITY_RELATIONSHIP_TYPES = ('same-sentence', 'adjacent-sentence', 'near-proximity')
+
+# entity_relationships columns written by store_relationships, in row-tuple order
+RELATIONSHIP_COLUMNS = (
+    'article_id', 'entity_a', 'entity_b',
+    'relationship_type', 'relationship_description', 'confidence',
+    'pmi_score', 'npmi_score', 'raw_cooccurrence_count',
+    'proximity_weight', 'min_sentence_distance', 'avg_sentence_distance'
+)
+
 
 class IntelligentRelationshipGenerator:
     """
     Complete relationship generation pipeline with all intelligence layers
     """
 
-    def __init__(self, db: VermontSignalDatabase):
+    def __init__(self, db: Optional[VermontSignalDatabase]):
         """
         Initialize generator
 
         Args:
-            db: Database connection
+            db: Database connection (None for generation-only use in worker processes)
         """
         self.db = db
-        self.proximity_builder = ProximityMatrix(window_size=2)
+        self.proximity_builder = ProximityMatrix(window_size=2, keep_occurrences=False)
         self.pmi_calculator = PMICalculator(smoothing=1e-6, min_frequency_for_pmi=2)
         self.confidence_mode = ConfidenceMode.HARMONIC
 
+    # Shared WHERE clause for the positioned-facts queries (param: days)
+    POSITIONED_FACTS_FILTER = """
+        FROM facts f
+        JOIN articles a ON f.article_id = a.id
+        WHERE a.published_date >= CURRENT_DATE - INTERVAL '%s days'
+          AND a.processing_status = 'completed'
+          AND f.sentence_index IS NOT NULL
+    """
+
+    def iter_articles_with_entities(
+        self,
+        days: int = 30
+    ) -> Iterator[Tuple[int, List[Dict]]]:
+        """
+        Stream articles and their entities from database
+
+        Uses a server-side cursor, so only one batch of articles is held in
+        memory at a time.
+
+        Args:
+            days: Articles from last N days
+
+        Yields:
+            (article_id, list of entity dicts) in article_id order
+        """
+        # One row per article: entities are aggregated server-side, in
+        # sentence order, into a JSON array that psycopg2 decodes to dicts
+        query = """
+            SELECT
+                f.article_id,
+                a.title,
+                json_agg(
+                    json_build_object(
+                        'entity', f.entity,
+                        'type', f.entity_type,
+                        'confidence', COALESCE(NULLIF(f.confidence, 0), 0.8),
+                        'sentence_index', f.sentence_index,
+                        'paragraph_index', f.paragraph_index
+                    )
+                    ORDER BY f.sentence_index
+                )
+        """ + self.POSITIONED_FACTS_FILTER + """
+            GROUP BY f.article_id, a.title
+            ORDER BY f.article_id
+        """
+
+        with self.db.get_connection() as conn:
+            with conn.cursor(name='facts_stream') as cur:
+                cur.itersize = FETCH_BATCH_SIZE
+                cur.execute(query, (days,))
+
+                for article_id, title, entities in cur:
+                    for entity in entities:
+                        entity['article_title'] = title
+                    yield article_id, entities
+
+            conn.commit()
+
     def fetch_articles_with_entities(
         self,
         days: int = 30
@@ -56,47 +140,37 @@ class IntelligentRelationshipGenerator:
         Returns:
             Dict mapping article_id to list of entity dicts
         """
-        query = """
-            SELECT
-                f.article_id,
-                f.entity,
-                f.entity_type,
-                f.confidence,
-                f.sentence_index,
-                f.paragraph_index,
-                a.title
-            FROM facts f
-            JOIN articles a ON f.article_id = a.id
-            WHERE a.published_date >= CURRENT_DATE - INTERVAL '%s days'
-              AND a.processing_status = 'completed'
-              AND f.sentence_index IS NOT NULL
-            ORDER BY f.article_id, f.sentence_index
+        article_entities = dict(self.iter_articles_with_entities(days))
+
+        logger.info(f"Loaded {len(article_entities)} articles with positioned entities")
+        return article_entities
+
+    def fetch_corpus_frequencies(self, days: int = 30) -> Dict[str, int]:
         """
+        Count, per entity, the articles it appears in (same window as the fetch)
 
-        article_entities = defaultdict(list)
+        Args:
+            days: Articles from last N days
+
+        Returns:
+            Dict mapping entity name to article count
+        """
+        query = "SELECT f.entity, COUNT(DISTINCT f.article_id)" + self.POSITIONED_FACTS_FILTER + "GROUP BY f.entity"
 
         with self.db.get_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute(query, (days,))
+                corpus_freq = dict(cur.fetchall())
+            conn.commit()
 
-                for row in cur.fetchall():
-                    article_id = row[0]
-                    article_entities[article_id].append({
-                        'entity': row[1],
-                        'type': row[2],
-                        'confidence': float(row[3]) if row[3] else 0.8,
-                        'sentence_index': row[4],
-                        'paragraph_index': row[5],
-                        'article_title': row[6]
-                    })
-
-        logger.info(f"Loaded {len(article_entities)} articles with positioned entities")
-        return dict(article_entities)
+        logger.info(f"Loaded corpus frequencies for {len(corpus_freq)} entities")
+        return corpus_freq
 
     def generate_for_article(
         self,
         article_id: int,
-        entities: List[Dict]
+        entities: List[Dict],
+        corpus_freq: Optional[Dict[str, int]] = None
     ) -> List[Dict]:
         """
         Generate relationships for a single article
@@ -104,6 +178,8 @@ class IntelligentRelationshipGenerator:
         Args:
             article_id: Article ID
             entities: List of entity dicts with positions
+            corpus_freq: Optional articles-per-entity counts for the whole run,
+                         used to decide PMI vs proximity-only scoring
 
         Returns:
             List of relationship dicts ready for database insertion
@@ -130,10 +206,10 @@ class IntelligentRelationshipGenerator:
         # Step 3: Prepare PMI inputs from co-occurrence matrix
         pmi_inputs = {}
         for (entity_a, entity_b), cooc_data in co_matrix.items():
-            # Get average confidence from occurrences
-            if cooc_data.occurrences:
-                avg_conf_a = sum(o['confidence_a'] for o in cooc_data.occurrences) / len(cooc_data.occurrences)
-                avg_conf_b = sum(o['confidence_b'] for o in cooc_data.occurrences) / len(cooc_data.occurrences)
+            # Average confidence across occurrences (aggregated while building)
+            if cooc_data.occurrence_count:
+                avg_conf_a = cooc_data.avg_confidence_a
+                avg_conf_b = cooc_data.avg_confidence_b
             else:
                 avg_conf_a = avg_conf_b = 0.8
 
@@ -148,7 +224,8 @@ class IntelligentRelationshipGenerator:
         pmi_scores = self.pmi_calculator.calculate_pmi_batch(
             pmi_inputs,
             entity_freq,
-            total_sentences
+            total_sentences,
+            corpus_frequencies=corpus_freq
         )
 
         # Step 5: Build edge list with all metadata
@@ -213,98 +290,227 @@ class IntelligentRelationshipGenerator:
 
         return relationships
 
-    def store_relationships(self, relationships: List[Dict]):
+    def _prepare_store(self, cur):
+        """
+        Set up this connection's staging table and prepared merge, once
+
+        Both live for the session, so repeated stores on a pooled connection
+        skip the temp-table DDL and the merge's parse/plan. The table is
+        checked separately because a rolled-back transaction drops it while
+        the prepared statement survives.
+        """
+        cur.execute("""
+            SELECT
+                to_regclass('pg_temp.entity_relationships_stage') IS NOT NULL,
+                EXISTS (SELECT 1 FROM pg_prepared_statements WHERE name = 'merge_relationships')
+        """)
+        has_stage, has_merge = cur.fetchone()
+
+        columns = ', '.join(RELATIONSHIP_COLUMNS)
+
+        if not has_stage:
+            cur.execute(f"""
+                CREATE TEMP TABLE entity_relationships_stage ON COMMIT DELETE ROWS AS
+                SELECT {columns} FROM entity_relationships WITH NO DATA
+            """)
+
+        if not has_merge:
+            cur.execute(f"""
+                PREPARE merge_relationships AS
+                INSERT INTO entity_relationships ({columns})
+                SELECT {columns} FROM entity_relationships_stage
+                ON CONFLICT (article_id, entity_a, entity_b, relationship_type)
+                DO UPDATE SET
+                    confidence = EXCLUDED.confidence,
+                    pmi_score = EXCLUDED.pmi_score,
+                    npmi_score = EXCLUDED.npmi_score,
+                    raw_cooccurrence_count = EXCLUDED.raw_cooccurrence_count,
+                    proximity_weight = EXCLUDED.proximity_weight,
+                    min_sentence_distance = EXCLUDED.min_sentence_distance,
+                    avg_sentence_distance = EXCLUDED.avg_sentence_distance,
+                    updated_at = CURRENT_TIMESTAMP
+                -- Skip rewriting rows whose scores haven't changed (no new tuple/WAL)
+                WHERE (
+                    entity_relationships.confidence, entity_relationships.pmi_score,
+                    entity_relationships.npmi_score, entity_relationships.raw_cooccurrence_count,
+                    entity_relationships.proximity_weight, entity_relationships.min_sentence_distance,
+                    entity_relationships.avg_sentence_distance
+                ) IS DISTINCT FROM (
+                    EXCLUDED.confidence, EXCLUDED.pmi_score,
+                    EXCLUDED.npmi_score, EXCLUDED.raw_cooccurrence_count,
+                    EXCLUDED.proximity_weight, EXCLUDED.min_sentence_distance,
+                    EXCLUDED.avg_sentence_distance
+                )
+            """)
+
+    def store_relationships(
+        self,
+        relationships: List[Dict],
+        cur=None,
+        article_ids: Optional[List[int]] = None
+    ):
         """
         Store relationships in database
 
+        Rows are bulk-loaded with COPY into a temp staging table, then merged
+        into entity_relationships with a prepared INSERT ... SELECT ... ON CONFLICT.
+
         Args:
             relationships: List of relationship dicts
+            cur: Optional cursor of an open transaction (caller commits);
+                 without one, a pooled connection is used and committed
+            article_ids: Optional articles being replaced; their existing
+                 proximity relationships not in relationships are deleted
         """
-        if not relationships:
+        if not relationships and not article_ids:
             return
 
-        insert_query = """
-            INSERT INTO entity_relationships (
-                article_id, entity_a, entity_b,
-                relationship_type, relationship_description, confidence,
-                pmi_score, npmi_score, raw_cooccurrence_count,
-                proximity_weight, min_sentence_distance, avg_sentence_distance
-            )
-            VALUES (
-                %(article_id)s, %(entity_a)s, %(entity_b)s,
-                %(relationship_type)s, %(relationship_description)s, %(confidence)s,
-                %(pmi_score)s, %(npmi_score)s, %(raw_cooccurrence_count)s,
-                %(proximity_weight)s, %(min_sentence_distance)s, %(avg_sentence_distance)s
-            )
-            ON CONFLICT (article_id, entity_a, entity_b, relationship_type)
-            DO UPDATE SET
-                confidence = EXCLUDED.confidence,
-                pmi_score = EXCLUDED.pmi_score,
-                npmi_score = EXCLUDED.npmi_score,
-                raw_cooccurrence_count = EXCLUDED.raw_cooccurrence_count,
-                proximity_weight = EXCLUDED.proximity_weight,
-                min_sentence_distance = EXCLUDED.min_sentence_distance,
-                avg_sentence_distance = EXCLUDED.avg_sentence_distance,
-                updated_at = CURRENT_TIMESTAMP
-        """
-
-        with self.db.get_connection() as conn:
-            with conn.cursor() as cur:
-                for rel in relationships:
-                    cur.execute(insert_query, rel)
+        if cur is None:
+            with self.db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    self.store_relationships(relationships, cur, article_ids)
                 conn.commit()
+            return
+
+        self._prepare_store(cur)
+
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            tuple(rel[col] for col in RELATIONSHIP_COLUMNS) for rel in relationships
+        )
+        buffer.seek(0)
+        cur.copy_expert(
+            f"COPY entity_relationships_stage ({', '.join(RELATIONSHIP_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+
+        cur.execute("EXECUTE merge_relationships")
+
+        if article_ids:
+            cur.execute("""
+                DELETE FROM entity_relationships r
+                WHERE r.article_id = ANY(%s::int[])
+                  AND r.relationship_type = ANY(%s)
+                  AND NOT EXISTS (
+                      SELECT 1
+                      FROM entity_relationships_stage s
+                      WHERE s.article_id = r.article_id
+                        AND s.entity_a = r.entity_a
+                        AND s.entity_b = r.entity_b
+                        AND s.relationship_type = r.relationship_type
+                  )
+            """, (list(article_ids), list(PROXIMITY_RELATIONSHIP_TYPES)))
+            if cur.rowcount:
+                logger.info(f"Deleted {cur.rowcount} outdated relationships")
+
+        # Empty now rather than at commit so the caller can store again in the same transaction
+        cur.execute("TRUNCATE entity_relationships_stage")
 
         logger.info(f"Stored {len(relationships)} relationships in database")
 
-    def generate_all(self, days: int = 30, dry_run: bool = False):
+    def _store_batch(self, conn, article_ids: List[int], relationships: List[Dict]):
+        """Replace a batch of articles' relationships in one transaction"""
+        with conn.cursor() as cur:
+            self.store_relationships(relationships, cur, article_ids)
+        conn.commit()
+
+    def _generate_results(
+        self,
+        articles: Iterator[Tuple[int, List[Dict]]],
+        corpus_freq: Dict[str, int],
+        workers: Optional[int]
+    ) -> Iterator[Tuple[int, List[Dict], Optional[str]]]:
+        """
+        Generate relationships for a stream of articles, in order
+
+        Yields:
+            (article_id, relationships, error) with error None on success
+        """
+        workers = workers or os.cpu_count() or 1
+
+        if workers == 1:
+            for item in articles:
+                yield _generate_article(self, item, corpus_freq)
+            return
+
+        # Articles are independent and the scoring is pure-Python CPU work,
+        # so fan them out across processes (no DB handles in the workers)
+        logger.info(f"Generating relationships with {workers} worker processes")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(corpus_freq,)
+        ) as executor:
+            # Executor.map submits its whole input up front, so feed it in slices
+            batch_size = workers * POOL_ARTICLES_PER_WORKER
+            for batch in iter(lambda: list(islice(articles, batch_size)), []):
+                yield from executor.map(_generate_in_worker, batch, chunksize=16)
+
+    def generate_all(self, days: int = 30, dry_run: bool = False, workers: Optional[int] = None):
         """
         Generate relationships for all articles
 
         Args:
             days: Process articles from last N days
             dry_run: If True, don't store to database
+            workers: Worker processes for per-article generation (default: CPU count, 1 = in-process)
         """
         logger.info("=" * 80)
         logger.info("INTELLIGENT RELATIONSHIP GENERATION V3")
         logger.info("=" * 80)
 
-        if not dry_run:
-            # Clear old proximity-based relationships
-            logger.info("Clearing old proximity-based relationships...")
-            with self.db.get_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(
-                        "DELETE FROM entity_relationships "
-                        "WHERE relationship_type IN ('same-sentence', 'adjacent-sentence', 'near-proximity')"
-                    )
-                    deleted = cur.rowcount
-                    conn.commit()
-            logger.info(f"Deleted {deleted} old relationships")
-
-        # Load articles
-        article_entities = self.fetch_articles_with_entities(days)
+        # Corpus-wide entity frequencies, computed once for every article
+        corpus_freq = self.fetch_corpus_frequencies(days)
 
-        if not article_entities:
+        if not corpus_freq:
             logger.warning("No articles with positioned entities found!")
             return
 
-        # Process each article
+        # Stream articles and store them as they arrive, replacing each batch
+        # of articles' relationships in its own transaction. The article
+        # stream holds its own connection; writes share this one for the run
+        articles = self.iter_articles_with_entities(days)
         total_relationships = 0
         success_count = 0
         error_count = 0
+        stored_article_ids = []
+        batch_ids = []
+        batch_relationships = []
 
-        for article_id, entities in article_entities.items():
-            try:
-                relationships = self.generate_for_article(article_id, entities)
-
-                if not dry_run:
-                    self.store_relationships(relationships)
+        with (nullcontext() if dry_run else self.db.get_connection()) as conn:
+            for article_id, relationships, error in self._generate_results(articles, corpus_freq, workers):
+                if error is not None:
+                    logger.error(f"Failed to process article {article_id}: {error}")
+                    error_count += 1
+                    continue
 
                 total_relationships += len(relationships)
                 success_count += 1
-            except Exception as e:
-                logger.error(f"Failed to process article {article_id}: {e}", exc_info=True)
-                error_count += 1
+
+                if conn is None:
+                    continue
+
+                batch_ids.append(article_id)
+                batch_relationships.extend(relationships)
+                if len(batch_ids) >= STORE_BATCH_ARTICLES:
+                    self._store_batch(conn, batch_ids, batch_relationships)
+                    stored_article_ids.extend(batch_ids)
+                    batch_ids, batch_relationships = [], []
+
+            if conn is not None:
+                if batch_ids:
+                    self._store_batch(conn, batch_ids, batch_relationships)
+                    stored_article_ids.extend(batch_ids)
+
+                # Articles that left the window (or failed) keep no proximity relationships
+                with conn.cursor() as cur:
+                    cur.execute("""
+                        DELETE FROM entity_relationships
+                        WHERE relationship_type = ANY(%s)
+                          AND article_id <> ALL(%s::int[])
+                    """, (list(PROXIMITY_RELATIONSHIP_TYPES), stored_article_ids))
+                    logger.info(f"Deleted {cur.rowcount} relationships of articles not in this run")
+                conn.commit()
 
         logger.info("=" * 80)
         logger.info(f"COMPLETE: Generated {total_relationships} relationships")
@@ -314,6 +520,38 @@ class IntelligentRelationshipGenerator:
         logger.info("=" * 80)
 
 
+# Per-process generator and corpus frequencies, set once by _init_worker in each pool worker
+_worker_generator = None
+_worker_corpus_freq = None
+
+
+def _init_worker(corpus_freq):
+    """ProcessPoolExecutor initializer: build a DB-less generator for this process"""
+    global _worker_generator, _worker_corpus_freq
+    _worker_generator = IntelligentRelationshipGenerator(db=None)
+    _worker_corpus_freq = corpus_freq
+
+
+def _generate_article(generator, item, corpus_freq=None):
+    """
+    Generate one article's relationships, capturing failures
+
+    Returns:
+        (article_id, relationships, error) with error None on success
+    """
+    article_id, entities = item
+    try:
+        return article_id, generator.generate_for_article(article_id, entities, corpus_freq), None
+    except Exception:
+        # Tracebacks don't pickle, so return the formatted text
+        return article_id, [], traceback.format_exc()
+
+
+def _generate_in_worker(item):
+    """Picklable worker entry point for ProcessPoolExecutor.map"""
+    return _generate_article(_worker_generator, item, _worker_corpus_freq)
+
+
 def main():
     """Main entry point"""
     import argparse
@@ -323,6 +561,7 @@ def main():
     )
     parser.add_argument('--days', type=int, default=30, help='Process articles from last N days')
     parser.add_argument('--dry-run', action='store_true', help='Generate but do not store to database')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
 
     args = parser.parse_args()
 
@@ -333,7 +572,7 @@ def main():
     try:
         # Generate relationships
         generator = IntelligentRelationshipGenerator(db)
-        generator.generate_all(days=args.days, dry_run=args.dry_run)
+        generator.generate_all(days=args.days, dry_run=args.dry_run, workers=args.workers)
     finally:
         db.disconnect()
 
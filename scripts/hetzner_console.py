@@ -1,22 +1,32 @@
 #!/usr/bin/env python3
 """
 Request Hetzner Cloud console access
+
+Requires HETZNER_TOKEN (a Hetzner Cloud API token) in the environment;
+HETZNER_SERVER_ID selects the server.
 """
+import os
 import requests
 import sys
 
-HETZNER_TOKEN = "EDUqg20RTBb03W0wvtNMyD83PCzREabBmZOrVh7SX5622WQkdSrB2QdkG6LmTGS9"
-SERVER_ID = "110615717"
+HETZNER_TOKEN = os.getenv("HETZNER_TOKEN")
+SERVER_ID = os.getenv("HETZNER_SERVER_ID", "110615717")
+
+if not HETZNER_TOKEN:
+    print("✗ HETZNER_TOKEN not set")
+    print("  Create an API token in the Hetzner Cloud console and export HETZNER_TOKEN")
+    sys.exit(1)
 
-headers = {
+# One session so follow-up API calls reuse the connection and headers
+session = requests.Session()
+session.headers.update({
     "Authorization": f"Bearer {HETZNER_TOKEN}",
     "Content-Type": "application/json"
-}
+})
 
 # Request console access
-response = requests.post(
+response = session.post(
     f"https://api.hetzner.cloud/v1/servers/{SERVER_ID}/actions/request_console",
-    headers=headers,
     json={"type": "vnc"}
 )
 
@@ -1,15 +1,31 @@
-"""Simple export script to run on V1 app"""
+"""Simple export script to run on V1 app
+
+Streams articles as compact line-delimited JSON (one object per line) from a
+server-side cursor into v1_export.jsonl.gz, or the path given as the first
+argument ('-' writes uncompressed to stdout). Memory stays flat however large
+the corpus is.
+"""
+import gzip
 import psycopg2
 import json
 import os
+import sys
+
+OUTPUT_FILE = 'v1_export.jsonl.gz'
+
+# Rows per server-side cursor round trip
+FETCH_BATCH_SIZE = 1000
 
 db_url = os.getenv('DATABASE_URL')
 if not db_url:
     print("ERROR: DATABASE_URL not set")
     exit(1)
 
+output_file = sys.argv[1] if len(sys.argv) > 1 else OUTPUT_FILE
+
 conn = psycopg2.connect(db_url)
-cur = conn.cursor()
+cur = conn.cursor(name='export')
+cur.itersize = FETCH_BATCH_SIZE
 
 cur.execute("""
     SELECT id, title, url, content, summary, source, author,
@@ -19,20 +35,27 @@ cur.execute("""
     ORDER BY published_date DESC
 """)
 
-articles = []
-for row in cur.fetchall():
-    articles.append({
-        'id': row[0],
-        'title': row[1],
-        'url': row[2],
-        'content': row[3],
-        'summary': row[4],
-        'source': row[5],
-        'author': row[6],
-        'published_date': row[7],
-        'collected_date': row[8]
-    })
-
-print(json.dumps(articles, indent=2))
+out = sys.stdout if output_file == '-' else gzip.open(output_file, 'wt', encoding='utf-8')
+
+count = 0
+try:
+    for row in cur:
+        out.write(json.dumps({
+            'id': row[0],
+            'title': row[1],
+            'url': row[2],
+            'content': row[3],
+            'summary': row[4],
+            'source': row[5],
+            'author': row[6],
+            'published_date': row[7],
+            'collected_date': row[8]
+        }, separators=(',', ':')) + '\n')
+        count += 1
+finally:
+    if out is not sys.stdout:
+        out.close()
+
+print(f"Exported {count} articles to {output_file}", file=sys.stderr)
 cur.close()
 conn.close()
@@ -1,9 +1,47 @@
 """
 Export articles from V1 database for import into V2
+
+Streams articles as line-delimited JSON (one object per line) straight from
+Postgres with COPY, through a local `flyctl proxy` tunnel. The corpus is split
+into published_date quartiles that are copied on parallel connections, then
+stitched back together in order.
 """
-import json
+import os
+import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+
+PROXY_PORT = 15432
+OUTPUT_FILE = 'v1_articles_export.jsonl'
+PART_FILE = 'v1_articles_export.part{}.jsonl'
+
+# One COPY connection per published_date quartile
+EXPORT_WORKERS = 4
+
+# COPY ... FORMAT csv with control-character quote/delimiter emits each JSON
+# document verbatim (text format would double every backslash escape)
+EXPORT_SQL = r"""
+    COPY (
+        SELECT row_to_json(t)
+        FROM (
+            SELECT id, title, url, content, summary, source, author,
+                   published_date, collected_date
+            FROM articles
+            WHERE {where}
+            ORDER BY published_date DESC
+        ) t
+    ) TO STDOUT WITH (FORMAT csv, QUOTE E'\x01', DELIMITER E'\x02')
+"""
+
+QUARTILES_SQL = """
+    SELECT percentile_disc(ARRAY[0.25, 0.5, 0.75]) WITHIN GROUP (ORDER BY published_date)
+    FROM articles
+"""
+
 
 def get_database_connection_string():
     """Get DATABASE_URL from Fly.io secrets"""
@@ -29,63 +67,109 @@ def get_database_connection_string():
         print(f"Error getting database connection: {e}")
         return None
 
-def export_articles_via_ssh():
-    """Export articles using SSH and psql on the database server"""
-
-    # Query to export articles as JSON
-    query = """
-    SELECT json_agg(row_to_json(articles))
-    FROM (
-        SELECT id, title, url, content, summary, source, author,
-               published_date, collected_date
-        FROM articles
-        ORDER BY published_date DESC
-    ) articles;
+
+def start_proxy():
+    """Open a flyctl proxy tunnel to the V1 database"""
+    proxy = subprocess.Popen(
+        ['flyctl', 'proxy', f'{PROXY_PORT}:5432', '-a', 'vermont-signal-db'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    # Give the tunnel a moment to come up
+    time.sleep(3)
+    return proxy
+
+
+def date_partitions(dsn):
     """
+    Split articles into published_date ranges of roughly equal size
 
-    # Run query via SSH on database server
-    cmd = [
-        'flyctl', 'ssh', 'console', '-a', 'vermont-signal-db',
-        '-C', f'psql -U postgres -t -c "{query}"'
-    ]
+    Returns:
+        List of (where_clause, params), newest range first
+    """
+    conn = psycopg2.connect(dsn, connect_timeout=10)
+    try:
+        with conn.cursor() as cur:
+            cur.execute(QUARTILES_SQL)
+            bounds = [b for b in (cur.fetchone()[0] or []) if b is not None]
+    finally:
+        conn.close()
 
+    if not bounds:
+        return [("TRUE", ())]
+
+    # Half-open ranges so no article lands in two parts; undated articles
+    # sort last under DESC, so they go with the oldest range
+    partitions = [("published_date >= %s", (bounds[-1],))]
+    for lower, upper in zip(reversed(bounds[:-1]), reversed(bounds[1:])):
+        partitions.append(("published_date >= %s AND published_date < %s", (lower, upper)))
+    partitions.append(("published_date < %s OR published_date IS NULL", (bounds[0],)))
+    return partitions
+
+
+def export_partition(dsn, index, where, params):
+    """COPY one date range to its part file on a dedicated connection"""
+    conn = psycopg2.connect(dsn, connect_timeout=10)
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            timeout=60
-        )
+        with conn.cursor() as cur, open(PART_FILE.format(index), 'w', encoding='utf-8') as f:
+            where_sql = cur.mogrify(where, params).decode('utf-8')
+            cur.copy_expert(EXPORT_SQL.format(where=where_sql), f)
+            return cur.rowcount
+    finally:
+        conn.close()
 
-        output = result.stdout.strip()
 
-        if output:
-            # Parse JSON output
-            articles = json.loads(output)
+def export_articles_via_copy():
+    """Export articles with parallel COPY TO STDOUT over proxied psycopg2 connections"""
 
-            # Save to file
-            with open('v1_articles_export.json', 'w') as f:
-                json.dump(articles, f, indent=2, default=str)
+    dsn = os.getenv(
+        'V1_DATABASE_URL',
+        f"postgresql://postgres:{os.getenv('V1_DATABASE_PASSWORD', '')}@localhost:{PROXY_PORT}/vermont_signal"
+    )
 
-            print(f"✓ Exported {len(articles)} articles to v1_articles_export.json")
+    proxy = start_proxy()
+    part_files = []
+    try:
+        partitions = date_partitions(dsn)
+        part_files = [PART_FILE.format(i) for i in range(len(partitions))]
+
+        # psycopg2 releases the GIL during libpq I/O, so threads overlap the COPYs
+        with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as executor:
+            counts = list(executor.map(
+                lambda part: export_partition(dsn, part[0], *part[1]),
+                enumerate(partitions)
+            ))
+        exported = sum(counts)
+
+        # Parts are newest-first, so concatenating keeps published_date DESC order
+        with open(OUTPUT_FILE, 'wb') as out:
+            for part_file in part_files:
+                with open(part_file, 'rb') as part:
+                    shutil.copyfileobj(part, out)
+
+        if exported:
+            print(f"✓ Exported {exported} articles to {OUTPUT_FILE}")
             return True
         else:
             print("No articles found in V1 database")
             return False
 
-    except subprocess.TimeoutExpired:
-        print("Connection timed out")
-        return False
-    except json.JSONDecodeError as e:
-        print(f"Error parsing JSON: {e}")
-        print(f"Raw output: {result.stdout}")
+    except psycopg2.OperationalError as e:
+        print(f"Connection error: {e}")
+        print(f"Check the proxy: flyctl proxy {PROXY_PORT}:5432 -a vermont-signal-db")
         return False
     except Exception as e:
         print(f"Error exporting articles: {e}")
         return False
+    finally:
+        proxy.terminate()
+        proxy.wait()
+        for part_file in part_files:
+            if os.path.exists(part_file):
+                os.remove(part_file)
+
 
 if __name__ == '__main__':
     print("Exporting articles from V1 database...")
-    success = export_articles_via_ssh()
+    success = export_articles_via_copy()
     sys.exit(0 if success else 1)
@@ -2,10 +2,14 @@
 Export articles from V1 database via proxy connection
 """
 import psycopg2
+from psycopg2.extras import RealDictCursor
 import json
 import time
 import sys
 
+# Rows per server-side cursor round trip
+FETCH_BATCH_SIZE = 1000
+
 def export_articles():
     """Export articles using proxy connection"""
 
@@ -54,36 +58,34 @@ def export_articles():
             print("No articles to export")
             return False
 
-        # Export articles
+        # Export articles through a server-side cursor, so rows arrive
+        # FETCH_BATCH_SIZE at a time instead of the whole result set being
+        # buffered client-side; RealDictCursor rows already carry the
+        # column names and serialize as they are
         print("Exporting articles...")
-        cur.execute("""
-            SELECT id, title, url, content, summary, source, author,
-                   published_date, collected_date
-            FROM articles
-            ORDER BY published_date DESC
-        """)
-
-        rows = cur.fetchall()
-        articles = []
-
-        for row in rows:
-            articles.append({
-                'id': row[0],
-                'title': row[1],
-                'url': row[2],
-                'content': row[3],
-                'summary': row[4],
-                'source': row[5],
-                'author': row[6],
-                'published_date': row[7].isoformat() if row[7] else None,
-                'collected_date': row[8].isoformat() if row[8] else None
-            })
-
-        # Save to file
-        with open('v1_articles_export.json', 'w') as f:
-            json.dump(articles, f, indent=2)
-
-        print(f"✓ Exported {len(articles)} articles to v1_articles_export.json")
+        exported = 0
+        with conn, conn.cursor(name='v1_export', cursor_factory=RealDictCursor) as export_cur:
+            export_cur.itersize = FETCH_BATCH_SIZE
+            export_cur.execute("""
+                SELECT id, title, url, content, summary, source, author,
+                       published_date, collected_date
+                FROM articles
+                ORDER BY published_date DESC
+            """)
+
+            with open('v1_articles_export.json', 'w') as f:
+                f.write('[\n')
+                for i, row in enumerate(export_cur, 1):
+                    if i > 1:
+                        f.write(',\n')
+                    for key in ('published_date', 'collected_date'):
+                        if row[key]:
+                            row[key] = row[key].isoformat()
+                    f.write(json.dumps(row))
+                    exported = i
+                f.write('\n]\n')
+
+        print(f"✓ Exported {exported} articles to v1_articles_export.json")
 
         cur.close()
         conn.close()
@@ -1,53 +1,23 @@
 #!/usr/bin/env python3
 """
 Initialize Railway Database Schema from Local Machine
-Uses Railway environment variables via subprocess
+Reads the database URL from the Railway CLI once, then connects directly
 """
 
 import subprocess
 import sys
 import json
 
-def run_railway_command(python_code):
-    """Execute Python code in Railway environment"""
-    cmd = ['railway', 'run', 'python3', '-c', python_code]
+try:
+    import psycopg2
+except ImportError:
+    print("❌ psycopg2 not installed. Run: pip install psycopg2-binary")
+    sys.exit(1)
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
+# Schema SQL, wrapped in its own transaction so it all applies or none of it does
+SCHEMA_SQL = """
+BEGIN;
 
-        return result.returncode, result.stdout, result.stderr
-    except subprocess.TimeoutExpired:
-        return 1, "", "Command timed out"
-    except Exception as e:
-        return 1, "", str(e)
-
-def main():
-    print("🗄️  Initializing Vermont Signal V2 Database on Railway")
-    print("=" * 60)
-    print()
-
-    # Python code to run in Railway environment
-    init_code = '''
-import psycopg2
-import os
-
-# Get DATABASE_URL from Railway environment
-database_url = os.getenv("DATABASE_URL")
-if not database_url:
-    print("ERROR: DATABASE_URL not set")
-    exit(1)
-
-print("Connecting to Railway PostgreSQL...")
-conn = psycopg2.connect(database_url)
-print("✅ Connected successfully")
-
-# Schema SQL
-schema_sql = """
 CREATE TABLE IF NOT EXISTS articles (
     id SERIAL PRIMARY KEY,
     article_hash VARCHAR(64) UNIQUE NOT NULL,
@@ -148,43 +118,88 @@ CREATE TABLE IF NOT EXISTS article_topics (
     probability FLOAT,
     CONSTRAINT unique_article_topic UNIQUE (article_id, topic_id)
 );
+
+COMMIT;
 """
 
-print("Creating tables...")
-with conn.cursor() as cur:
-    cur.execute(schema_sql)
-    conn.commit()
-
-print("✅ Schema created successfully")
-
-# Verify tables
-with conn.cursor() as cur:
-    cur.execute("""
-        SELECT table_name FROM information_schema.tables
-        WHERE table_schema = 'public'
-        ORDER BY table_name
-    """)
-    tables = [row[0] for row in cur.fetchall()]
-    print(f"\\nTables created: {', '.join(tables)}")
-
-conn.close()
-print("\\n✅ Database initialization complete!")
-'''
-
-    print("Executing initialization via Railway environment...")
-    print("(This uses 'railway run' to access DATABASE_URL)")
+
+def get_railway_env():
+    """Read the linked service's variables with a single Railway CLI call"""
+    try:
+        output = subprocess.check_output(
+            ['railway', 'variables', '--json'],
+            text=True,
+            timeout=60
+        )
+    except subprocess.TimeoutExpired:
+        print("ERROR: Railway CLI timed out", file=sys.stderr)
+        return {}
+    except (subprocess.CalledProcessError, OSError) as e:
+        print(f"ERROR: Could not read Railway variables: {e}", file=sys.stderr)
+        return {}
+
+    try:
+        return json.loads(output)
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Railway CLI did not return JSON: {e}", file=sys.stderr)
+        return {}
+
+
+def init_schema(database_url):
+    """Create the schema over one local connection; returns True on success"""
+    try:
+        print("Connecting to Railway PostgreSQL...")
+        conn = psycopg2.connect(database_url)
+        print("✅ Connected successfully")
+    except psycopg2.Error as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return False
+
+    try:
+        print("Creating tables...")
+        # Autocommit: psycopg2 would otherwise send its own BEGIN and COMMIT as extra
+        # round trips; the explicit BEGIN/COMMIT in the schema keeps it to one
+        conn.autocommit = True
+        with conn.cursor() as cur:
+            cur.execute(SCHEMA_SQL)
+
+        print("✅ Schema created successfully")
+
+        # Verify tables
+        with conn.cursor() as cur:
+            cur.execute("""
+                SELECT table_name FROM information_schema.tables
+                WHERE table_schema = 'public'
+                ORDER BY table_name
+            """)
+            tables = [row[0] for row in cur.fetchall()]
+            print(f"\nTables created: {', '.join(tables)}")
+    except psycopg2.Error as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return False
+    finally:
+        conn.close()
+
+    print("\n✅ Database initialization complete!")
+    return True
+
+
+def main():
+    print("🗄️  Initializing Vermont Signal V2 Database on Railway")
+    print("=" * 60)
     print()
 
-    returncode, stdout, stderr = run_railway_command(init_code)
+    print("Reading database URL via 'railway variables'...")
+    env = get_railway_env()
 
-    if stdout:
-        print(stdout)
+    # The private DATABASE_URL only resolves inside Railway's network
+    database_url = env.get('DATABASE_PUBLIC_URL') or env.get('DATABASE_URL')
+    if not database_url:
+        print("ERROR: DATABASE_PUBLIC_URL / DATABASE_URL not set", file=sys.stderr)
 
-    if stderr and "DeprecationWarning" not in stderr:
-        print("Errors:", file=sys.stderr)
-        print(stderr, file=sys.stderr)
+    success = bool(database_url) and init_schema(database_url)
 
-    if returncode == 0:
+    if success:
         print()
         print("=" * 60)
         print("✅ Success! Database is ready.")
@@ -8,10 +8,19 @@ import logging
 import sys
 import re
 import os
+import json
+import hashlib
+import sqlite3
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Tuple
 from datetime import datetime, timedelta
 
+import numpy as np
+import pandas as pd
+
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -24,6 +33,103 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# V1 rows per server-side cursor round trip (rows carry full article content)
+V1_FETCH_BATCH_SIZE = 2000
+
+# Columns of the analysis query, in SELECT order
+V1_ANALYZE_COLUMNS = [
+    'id', 'title', 'content', 'url', 'source', 'published_date',
+    'tags', 'sentiment_score', 'sentiment_label'
+]
+
+# Processes scoring analysis chunks (the main process keeps streaming rows)
+ANALYZE_WORKERS = max(1, (os.cpu_count() or 2) - 1)
+
+# Filtered articles per batched V2 insert
+V2_INSERT_BATCH_SIZE = 500
+
+# Per-article fallback insert, prepared once per V2 session. Articles
+# already in V2 are skipped (no row returned), as in the batched insert
+V2_PREPARED_INSERT = 'migrate_insert_article'
+V2_PREPARE_INSERT_SQL = f"""
+    PREPARE {V2_PREPARED_INSERT} (varchar, text, text, text, text, text, text, timestamp) AS
+    INSERT INTO articles (
+        article_hash, title, url, content, summary,
+        source, author, published_date
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+    ON CONFLICT DO NOTHING
+    RETURNING id
+"""
+
+# Concurrent V2 batch writers; each holds one connection from v2_db's pool
+# (keep below its pool_size)
+V2_WRITE_WORKERS = 4
+
+# Streamed rows between progress log lines
+PROGRESS_LOG_INTERVAL = 1000
+
+
+def compile_pattern_union(patterns: List[str], flags: int = 0) -> re.Pattern:
+    """
+    Compile patterns into one alternation, searched in a single pass
+
+    Each pattern becomes a named group (p0, p1, ...) so the match's
+    lastgroup maps back to the pattern that hit. A leading (?i) is lifted
+    into re.IGNORECASE, since inline global flags must start the expression.
+    """
+    alternatives = []
+    for i, pattern in enumerate(patterns):
+        if pattern.startswith('(?i)'):
+            pattern = pattern[len('(?i)'):]
+            flags |= re.IGNORECASE
+        alternatives.append(f'(?P<p{i}>{pattern})')
+    return re.compile('|'.join(alternatives), flags)
+
+
+def matched_pattern(match: re.Match, patterns: List[str]) -> str:
+    """Source pattern of a compile_pattern_union match"""
+    return patterns[int(match.lastgroup[1:])]
+
+
+WORD_RE = re.compile(r'\S+')
+
+
+def count_words(text: str, limit: int) -> int:
+    """
+    Words in text as str.split() counts them, stopping at limit
+
+    Scans only as far as the limit-th word instead of building the full
+    token list, so the result is exact below limit and capped at it.
+    """
+    return sum(1 for _ in islice(WORD_RE.finditer(text), limit))
+
+
+def published_cutoff(days: int) -> datetime:
+    """
+    Start of the day N days ago, bound as a plain published_date range
+
+    Same cutoff as CURRENT_DATE - N days, but computed once client-side so
+    the planner sees a constant it can use for an index range scan.
+    """
+    return datetime.combine(datetime.now().date() - timedelta(days=days), datetime.min.time())
+
+
+def to_postgres_regex(patterns: List[str]) -> str:
+    """
+    Union of case-insensitive title patterns as a Postgres regex, for ~*
+
+    The patterns only use syntax both engines share, except Python's \\b
+    word boundary, which Postgres spells \\y.
+    """
+    alternatives = []
+    for pattern in patterns:
+        if pattern.startswith('(?i)'):
+            pattern = pattern[len('(?i)'):]
+        pattern = pattern.replace(r'\b', r'\y')
+        alternatives.append(f'(?:{pattern})')
+    return '|'.join(alternatives)
+
 
 class ArticleFilter:
     """Smart filtering for high-value articles"""
@@ -94,9 +200,13 @@ class ArticleFilter:
         r'(?i)^paid post',
         r'(?i)^partner content',
     ]
+    # Every pattern above is case-insensitive, so one IGNORECASE union is equivalent
+    EXCLUDE_TITLE_RE = compile_pattern_union(EXCLUDE_TITLE_PATTERNS)
+    EXCLUDE_TITLE_SQL_RE = to_postgres_regex(EXCLUDE_TITLE_PATTERNS)
 
-    # Tags that indicate low-value content
-    EXCLUDE_TAGS = {
+    # Tags that indicate low-value content (interned, like the per-article
+    # tags they're intersected with)
+    EXCLUDE_TAGS = frozenset(map(sys.intern, {
         'routine',
         'obituary',
         'obituaries',
@@ -125,10 +235,10 @@ class ArticleFilter:
         'honor_roll',
         'police_log',
         'fire_log',
-    }
+    }))
 
     # Tags that indicate high-value content (boost score)
-    PRIORITY_TAGS = {
+    PRIORITY_TAGS = frozenset(map(sys.intern, {
         'government policy',
         'state government',
         'federal_politics',
@@ -147,11 +257,38 @@ class ArticleFilter:
         'education policy',
         'housing',
         'transportation policy',
-    }
+    }))
+
+    # Title markers of investigative reporting (score boost)
+    INVESTIGATIVE_PATTERNS = [
+        r'\binvestigat(e|ion|ing)\b',
+        r'\breport finds\b',
+        r'\bexclusive\b',
+        r'\banalysis\b',
+    ]
+    INVESTIGATIVE_RE = compile_pattern_union(INVESTIGATIVE_PATTERNS, re.IGNORECASE)
 
     MIN_CONTENT_LENGTH = 800  # Characters (filters out very short articles)
     MIN_WORDS = 100  # Word count minimum
 
+    # Bump when should_import's checks or scoring change, so cached
+    # results from the old rules are not reused
+    REVISION = 1
+
+    @classmethod
+    def version(cls) -> str:
+        """Short hash of the filter rules, keying cached filter results"""
+        rules = json.dumps([
+            cls.REVISION,
+            cls.EXCLUDE_TITLE_PATTERNS,
+            sorted(cls.EXCLUDE_TAGS),
+            sorted(cls.PRIORITY_TAGS),
+            cls.INVESTIGATIVE_PATTERNS,
+            cls.MIN_CONTENT_LENGTH,
+            cls.MIN_WORDS,
+        ])
+        return hashlib.sha256(rules.encode()).hexdigest()[:16]
+
     @classmethod
     def should_import(cls, article: Dict) -> Tuple[bool, float, str]:
         """
@@ -163,43 +300,59 @@ class ArticleFilter:
         Returns:
             (should_import, score, reason)
         """
-        title = article.get('title', '')
-        content = article.get('content', '')
-        tags = article.get('tags', [])
+        return cls.evaluate(
+            article.get('title', ''),
+            article.get('content', ''),
+            article.get('tags', [])
+        )
 
-        # Convert tags to set for faster lookup
-        if isinstance(tags, str):
-            tags = [t.strip() for t in tags.split(',')]
-        tag_set = {tag.lower().strip() for tag in tags}
+    @classmethod
+    def evaluate(cls, title: str, content: str, tags) -> Tuple[bool, float, str]:
+        """
+        should_import on the fields it reads, for callers holding row tuples
+
+        Args:
+            title: Article title
+            content: Article body
+            tags: Tag list or comma-separated string (may be None)
+
+        Returns:
+            (should_import, score, reason)
+        """
+        tag_set = cls.tag_set(tags)
 
         reasons = []
         score = 50.0  # Base score
 
-        # Check title patterns (auto-exclude)
-        for pattern in cls.EXCLUDE_TITLE_PATTERNS:
-            if re.search(pattern, title):
-                return False, 0.0, f"Title matches exclude pattern: {pattern}"
-
-        # Check exclude tags (auto-exclude)
-        exclude_matches = tag_set & cls.EXCLUDE_TAGS
-        if exclude_matches:
-            return False, 0.0, f"Has exclude tags: {exclude_matches}"
+        # Cheapest rejections first: length and tag checks are O(1)/O(tags),
+        # so the title regex only runs on articles that could still pass
 
         # Check content length
         if not content or len(content) < cls.MIN_CONTENT_LENGTH:
             return False, 0.0, f"Content too short: {len(content)} chars"
 
+        # Check exclude tags (auto-exclude)
+        exclude_matches = tag_set & cls.EXCLUDE_TAGS
+        if exclude_matches:
+            return False, 0.0, f"Has exclude tags: {set(exclude_matches)}"
+
         # Check word count
-        word_count = len(content.split())
+        word_count = count_words(content, cls.MIN_WORDS)
         if word_count < cls.MIN_WORDS:
             return False, 0.0, f"Too few words: {word_count}"
 
+        # Check title patterns (auto-exclude)
+        match = cls.EXCLUDE_TITLE_RE.search(title)
+        if match:
+            pattern = matched_pattern(match, cls.EXCLUDE_TITLE_PATTERNS)
+            return False, 0.0, f"Title matches exclude pattern: {pattern}"
+
         # Boost score for priority tags
         priority_matches = tag_set & cls.PRIORITY_TAGS
         if priority_matches:
             boost = len(priority_matches) * 10
             score += boost
-            reasons.append(f"+{boost} priority tags: {priority_matches}")
+            reasons.append(f"+{boost} priority tags: {set(priority_matches)}")
 
         # Boost for longer content (more substantive)
         if len(content) > 3000:
@@ -215,17 +368,10 @@ class ArticleFilter:
             reasons.append("-10 short title")
 
         # Check for investigative markers
-        investigative_patterns = [
-            r'\binvestigat(e|ion|ing)\b',
-            r'\breport finds\b',
-            r'\bexclusive\b',
-            r'\banalysis\b',
-        ]
-        for pattern in investigative_patterns:
-            if re.search(pattern, title, re.IGNORECASE):
-                score += 15
-                reasons.append(f"+15 investigative: {pattern}")
-                break
+        match = cls.INVESTIGATIVE_RE.search(title)
+        if match:
+            score += 15
+            reasons.append(f"+15 investigative: {matched_pattern(match, cls.INVESTIGATIVE_PATTERNS)}")
 
         # Final decision
         should_import = score >= 50
@@ -233,6 +379,173 @@ class ArticleFilter:
 
         return should_import, score, reason
 
+    @staticmethod
+    def tag_set(tags) -> frozenset:
+        """Normalized, interned tags (list or comma-separated string)"""
+        if not tags:
+            return frozenset()
+        if isinstance(tags, str):
+            tags = tags.split(',')
+        return frozenset(sys.intern(tag.lower().strip()) for tag in tags)
+
+    @classmethod
+    def score_frame(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply should_import to a whole DataFrame of articles at once
+
+        Lengths, word counts and scores are computed column-wise; the same
+        checks run in the same order, so the result matches should_import
+        row for row.
+
+        Args:
+            df: Articles with title, content and tags columns
+
+        Returns:
+            DataFrame on df's index with should_import, score and
+            reason_key (should_import's reason up to the first ':')
+        """
+        title = df['title'].fillna('')
+        content = df['content'].fillna('')
+        tag_sets = df['tags'].map(cls.tag_set)
+
+        content_len = content.str.len()
+        title_len = title.str.len()
+        word_count = content.map(lambda text: count_words(text, cls.MIN_WORDS)).astype(int)
+
+        # Search with the compiled unions (str.contains would warn about
+        # their named groups, and runs the same per-row search anyway)
+        excluded_title = title.map(cls.EXCLUDE_TITLE_RE.search).notna()
+        excluded_tags = tag_sets.map(lambda tags: not tags.isdisjoint(cls.EXCLUDE_TAGS)).astype(bool)
+        too_short = content_len < cls.MIN_CONTENT_LENGTH
+        too_few_words = word_count < cls.MIN_WORDS
+
+        # Auto-exclusions, in should_import's order (first hit wins)
+        exclusions = [too_short, excluded_tags, too_few_words, excluded_title]
+        excluded = np.logical_or.reduce(exclusions)
+        reason_key = np.select(
+            exclusions,
+            ['Content too short', 'Has exclude tags',
+             'Too few words', 'Title matches exclude pattern'],
+            default=''
+        ).astype(object)
+
+        priority_count = tag_sets.map(lambda tags: len(tags & cls.PRIORITY_TAGS)).astype(int)
+        investigative = title.map(cls.INVESTIGATIVE_RE.search).notna()
+
+        score = (
+            50.0
+            + 10 * priority_count
+            + np.select([content_len > 3000, content_len > 2000], [15, 10], default=0)
+            - 10 * (title_len < 30)
+            + 15 * investigative
+        )
+        score = score.where(~excluded, 0.0).astype(float)
+        should_import = ~excluded & (score >= 50)
+
+        # Rows that pass the exclusions but score too low are rare; take
+        # their reason text from should_import itself
+        low_score = ~excluded & ~should_import
+        for i in np.flatnonzero(low_score.to_numpy()):
+            reason = cls.should_import(df.iloc[i].to_dict())[2]
+            reason_key[i] = reason.split(':')[0] if ':' in reason else reason
+
+        return pd.DataFrame({
+            'should_import': should_import.to_numpy(),
+            'score': score.to_numpy(),
+            'reason_key': reason_key,
+        }, index=df.index)
+
+
+class FilterCache:
+    """
+    Local SQLite cache of ArticleFilter results per V1 article
+
+    Results are keyed by (article_id, filter_version), so reruns only score
+    articles not yet seen under the current rules, and changing the rules
+    starts a fresh set.
+    """
+
+    # Article ids per lookup (stays under SQLite's bound-parameter limit)
+    LOOKUP_BATCH_SIZE = 500
+
+    def __init__(self, cache_dir: Path = None):
+        """
+        Initialize filter cache
+
+        Args:
+            cache_dir: Directory for cache database
+                      (default: vermont_news_analyzer/data/cache)
+        """
+        if cache_dir is None:
+            cache_dir = Path(__file__).parent.parent.parent / "vermont_news_analyzer" / "data" / "cache"
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = cache_dir / "filter_cache.db"
+        self.filter_version = ArticleFilter.version()
+
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS filter_cache (
+                article_id INTEGER NOT NULL,
+                filter_version TEXT NOT NULL,
+                score REAL NOT NULL,
+                keep INTEGER NOT NULL,
+                reason_key TEXT NOT NULL,
+                PRIMARY KEY (article_id, filter_version)
+            )
+        """)
+        self.conn.commit()
+
+        logger.info(f"Filter cache initialized: {self.db_path} (version {self.filter_version})")
+
+    def lookup(self, article_ids: List[int]) -> pd.DataFrame:
+        """
+        Cached results for the current filter version
+
+        Returns:
+            DataFrame indexed by article_id with should_import, score and
+            reason_key (as ArticleFilter.score_frame), for cached ids only
+        """
+        rows = []
+        for i in range(0, len(article_ids), self.LOOKUP_BATCH_SIZE):
+            batch = article_ids[i:i + self.LOOKUP_BATCH_SIZE]
+            placeholders = ','.join('?' * len(batch))
+            rows.extend(self.conn.execute(
+                f"""
+                SELECT article_id, keep, score, reason_key
+                FROM filter_cache
+                WHERE filter_version = ? AND article_id IN ({placeholders})
+                """,
+                [self.filter_version, *batch]
+            ))
+
+        cached = pd.DataFrame.from_records(
+            rows, columns=['article_id', 'should_import', 'score', 'reason_key']
+        ).set_index('article_id')
+        return cached.astype({'should_import': bool, 'score': float})
+
+    def store(self, article_ids: List[int], scored: pd.DataFrame):
+        """Cache score_frame results for article_ids (in scored's row order)"""
+        self.conn.executemany(
+            """
+            INSERT OR REPLACE INTO filter_cache
+                (article_id, filter_version, score, keep, reason_key)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            zip(
+                article_ids,
+                [self.filter_version] * len(article_ids),
+                scored['score'].tolist(),
+                scored['should_import'].tolist(),
+                scored['reason_key'].tolist()
+            )
+        )
+        self.conn.commit()
+
+    def close(self):
+        """Close the cache database"""
+        self.conn.close()
+
 
 class V1toV2Migrator:
     """Migrates high-value articles from V1 to V2"""
@@ -265,7 +578,8 @@ class V1toV2Migrator:
     def analyze_v1_articles(
         self,
         date_filter_days: int = None,
-        limit: int = None
+        limit: int = None,
+        filter_cache: FilterCache = None
     ) -> Dict:
         """
         Analyze V1 articles and show import statistics
@@ -273,6 +587,9 @@ class V1toV2Migrator:
         Args:
             date_filter_days: Only analyze articles from last N days
             limit: Limit analysis to N articles (for testing)
+            filter_cache: Reuse cached filter results; only articles
+                         missing from the cache have their content fetched
+                         and scored
 
         Returns:
             Dict with analysis statistics
@@ -281,10 +598,11 @@ class V1toV2Migrator:
         logger.info("ANALYZING V1 ARTICLES")
         logger.info("=" * 80)
 
-        # Build query
-        query = """
+        # Build query (with a cache, content is fetched later, for misses only)
+        query = f"""
             SELECT
-                id, title, content, url, source, published_date,
+                id, title, {'NULL' if filter_cache else 'content'} AS content,
+                url, source, published_date,
                 tags, sentiment_score, sentiment_label
             FROM articles
             WHERE content IS NOT NULL
@@ -294,8 +612,8 @@ class V1toV2Migrator:
         params = []
 
         if date_filter_days:
-            query += " AND published_date >= CURRENT_DATE - INTERVAL '%s days'"
-            params.append(date_filter_days)
+            query += " AND published_date >= %s"
+            params.append(published_cutoff(date_filter_days))
 
         query += " ORDER BY published_date DESC"
 
@@ -303,75 +621,150 @@ class V1toV2Migrator:
             query += " LIMIT %s"
             params.append(limit)
 
-        # Fetch articles
-        with self.v1_conn.cursor() as cur:
-            cur.execute(query, params)
-            rows = cur.fetchall()
-
-        logger.info(f"Fetched {len(rows)} articles from V1")
-
         # Analyze each article
         stats = {
-            'total': len(rows),
+            'total': 0,
             'importable': 0,
             'filtered': 0,
-            'reasons': {},
-            'sources': {},
+            'reasons': Counter(),
+            'sources': defaultdict(lambda: {'total': 0, 'imported': 0, 'filtered': 0}),
             'high_value': [],
-            'filtered_examples': []
+            'filtered_examples': [],
+            'cached': 0
         }
 
-        for row in rows:
-            article = {
-                'id': row[0],
-                'title': row[1],
-                'content': row[2],
-                'url': row[3],
-                'source': row[4],
-                'published_date': row[5],
-                'tags': row[6] if row[6] else [],
-                'sentiment_score': row[7],
-                'sentiment_label': row[8]
-            }
+        # Stream articles through a server-side cursor instead of buffering
+        # every row (content included) in client memory; chunks are scored
+        # in worker processes while streaming continues, and folded into
+        # the stats in order
+        pending = deque()
 
-            should_import, score, reason = ArticleFilter.should_import(article)
-
-            # Track sources
-            source = article['source']
-            if source not in stats['sources']:
-                stats['sources'][source] = {'total': 0, 'imported': 0, 'filtered': 0}
-
-            stats['sources'][source]['total'] += 1
-
-            if should_import:
-                stats['importable'] += 1
-                stats['sources'][source]['imported'] += 1
-
-                # Track high-value articles
-                if score >= 70:
-                    stats['high_value'].append({
-                        'id': article['id'],
-                        'title': article['title'][:80],
-                        'score': score,
-                        'source': source
-                    })
-            else:
-                stats['filtered'] += 1
-                stats['sources'][source]['filtered'] += 1
-
-                # Track filter reasons
-                reason_key = reason.split(':')[0] if ':' in reason else reason
-                stats['reasons'][reason_key] = stats['reasons'].get(reason_key, 0) + 1
-
-                # Save examples of filtered articles
-                if len(stats['filtered_examples']) < 10:
-                    stats['filtered_examples'].append({
-                        'title': article['title'][:80],
-                        'reason': reason
-                    })
+        with ProcessPoolExecutor(max_workers=ANALYZE_WORKERS) as pool, \
+                self.v1_conn.cursor(name='v1_analyze_stream') as cur:
+            cur.execute(query, params)
+
+            while True:
+                rows = cur.fetchmany(V1_FETCH_BATCH_SIZE)
+                if not rows:
+                    break
+                df = pd.DataFrame.from_records(rows, columns=V1_ANALYZE_COLUMNS)
+                if filter_cache is None:
+                    cached, to_score = None, df
+                else:
+                    cached, to_score = self._load_cached(df, filter_cache, stats)
+                pending.append((df, cached, pool.submit(ArticleFilter.score_frame, to_score)))
+
+                # Bound the chunks in flight (each holds article content)
+                if len(pending) > ANALYZE_WORKERS * 2:
+                    self._finish_chunk(*pending.popleft(), filter_cache, stats)
+
+            while pending:
+                self._finish_chunk(*pending.popleft(), filter_cache, stats)
+
+        # End the read transaction that held the cursor
+        self.v1_conn.rollback()
+
+        logger.info(f"Analyzed {stats['total']} articles from V1")
+        if filter_cache is not None:
+            logger.info(f"Reused cached filter results for {stats['cached']} articles")
 
         return stats
 
+    def _fetch_v1_content(self, article_ids: List[int]) -> Dict[int, str]:
+        """Content of the given V1 articles, by id"""
+        with self.v1_conn.cursor() as cur:
+            cur.execute(
+                "SELECT id, content FROM articles WHERE id = ANY(%s)",
+                (article_ids,)
+            )
+            return dict(cur.fetchall())
+
+    def _load_cached(self, df: pd.DataFrame, filter_cache: FilterCache, stats: Dict) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Cached scores for a chunk fetched without content
+
+        Misses get their content fetched (filled into df).
+
+        Returns:
+            (cached scores on df's index, NaN for misses; rows still to score)
+        """
+        cached = filter_cache.lookup(df['id'].tolist())
+        hit = df['id'].isin(cached.index)
+        stats['cached'] += int(hit.sum())
+
+        scored = cached.reindex(df['id'])
+        scored.index = df.index
+
+        if not hit.all():
+            miss_ids = df.loc[~hit, 'id']
+            df.loc[~hit, 'content'] = miss_ids.map(self._fetch_v1_content(miss_ids.tolist()))
+
+        return scored, df[~hit]
+
+    def _finish_chunk(self, df: pd.DataFrame, cached: pd.DataFrame, future: Future,
+                      filter_cache: FilterCache, stats: Dict):
+        """Merge a chunk's worker scores with its cached ones and fold it into stats"""
+        fresh = future.result()
+
+        if cached is None:
+            scored = fresh
+        else:
+            if len(fresh):
+                filter_cache.store(df.loc[fresh.index, 'id'].tolist(), fresh)
+                cached.loc[fresh.index] = fresh
+            scored = cached.astype({'should_import': bool, 'score': float})
+
+        self._analyze_chunk(df, scored, stats)
+
+    def _analyze_chunk(self, df: pd.DataFrame, scored: pd.DataFrame, stats: Dict):
+        """Fold one scored chunk of V1 rows into analyze stats"""
+        df = df.join(scored)
+        imported = df['should_import']
+
+        stats['total'] += len(df)
+        stats['importable'] += int(imported.sum())
+        stats['filtered'] += int((~imported).sum())
+
+        # Per-source counts
+        per_source = df.groupby('source', dropna=False, sort=False)['should_import'].agg(
+            total='size', imported='sum'
+        )
+        for source, row in per_source.iterrows():
+            source = None if pd.isna(source) else source
+            source_stats = stats['sources'][source]
+            source_stats['total'] += int(row['total'])
+            source_stats['imported'] += int(row['imported'])
+            source_stats['filtered'] += int(row['total'] - row['imported'])
+
+        # Track high-value articles
+        high_value = df[imported & (df['score'] >= 70)]
+        stats['high_value'].extend(
+            {
+                'id': article.id,
+                'title': article.title[:80],
+                'score': article.score,
+                'source': None if pd.isna(article.source) else article.source
+            }
+            for article in high_value.itertuples(index=False)
+        )
+
+        # Track filter reasons
+        filtered = df[~imported]
+        stats['reasons'].update(filtered['reason_key'].tolist())
+
+        # Save examples of filtered articles (full reason text)
+        room = 10 - len(stats['filtered_examples'])
+        examples = filtered.head(max(room, 0))
+        if examples['content'].isna().any():
+            examples = examples.assign(
+                content=examples['id'].map(self._fetch_v1_content(examples['id'].tolist()))
+            )
+        for article in examples.to_dict('records'):
+            stats['filtered_examples'].append({
+                'title': article['title'][:80],
+                'reason': ArticleFilter.should_import(article)[2]
+            })
+
     def import_articles(
         self,
         date_filter_days: int = None,
@@ -391,90 +784,238 @@ class V1toV2Migrator:
         logger.info(f"IMPORTING ARTICLES ({'DRY RUN' if dry_run else 'LIVE'})")
         logger.info("=" * 80)
 
-        # Build query
+        # Build query. The length and title checks run in the database so
+        # rejected rows (and their content) never cross the wire; they are no
+        # stricter than should_import, which still checks each row. Word count
+        # stays in Python: Postgres \s misses whitespace str.split() splits on
+        # (e.g. NBSP), and tag exclusion needs the normalized tags
         query = """
             SELECT
                 id, title, content, url, source, author, published_date,
-                summary, tags, sentiment_score, sentiment_label
+                summary, tags
             FROM articles
             WHERE content IS NOT NULL
-              AND LENGTH(content) > 100
+              AND LENGTH(content) >= %s
+              AND COALESCE(title, '') !~* %s
         """
 
-        params = []
+        params = [
+            ArticleFilter.MIN_CONTENT_LENGTH,
+            ArticleFilter.EXCLUDE_TITLE_SQL_RE
+        ]
 
         if date_filter_days:
-            query += " AND published_date >= CURRENT_DATE - INTERVAL '%s days'"
-            params.append(date_filter_days)
+            query += " AND published_date >= %s"
+            params.append(published_cutoff(date_filter_days))
 
         query += " ORDER BY published_date DESC"
 
-        # Fetch articles
-        with self.v1_conn.cursor() as cur:
-            cur.execute(query, params)
-            rows = cur.fetchall()
-
-        logger.info(f"Processing {len(rows)} articles from V1...")
+        logger.info("Processing articles from V1 (after database-side filtering)...")
 
         stats = {
-            'total': len(rows),
+            'total': 0,
             'imported': 0,
             'filtered': 0,
             'skipped_duplicate': 0,
             'errors': 0
         }
+        batch = []
+        pending = deque()
 
-        for i, row in enumerate(rows, 1):
-            article = {
-                'id': row[0],
-                'title': row[1],
-                'content': row[2],
-                'url': row[3],
-                'source': row[4],
-                'author': row[5],
-                'published_date': row[6],
-                'summary': row[7],
-                'tags': row[8] if row[8] else [],
-                'sentiment_score': row[9],
-                'sentiment_label': row[10]
-            }
+        # A cold import (empty V2 articles table) loads without the
+        # secondary indexes and rebuilds each once at the end, instead of
+        # updating every btree per inserted row
+        dropped_indexes = [] if dry_run else self._drop_secondary_indexes_if_empty()
 
-            # Apply filter
-            should_import, score, reason = ArticleFilter.should_import(article)
-
-            if not should_import:
-                stats['filtered'] += 1
-                continue
-
-            # Import to V2
-            if not dry_run:
-                try:
-                    article_id = self.v2_db.store_article({
-                        'title': article['title'],
-                        'url': article['url'],
-                        'content': article['content'],
-                        'summary': article['summary'],
-                        'source': article['source'],
-                        'author': article['author'],
-                        'published_date': article['published_date']
-                    })
-
-                    stats['imported'] += 1
-
-                    if i % 50 == 0:
-                        logger.info(f"Progress: {i}/{len(rows)} processed, {stats['imported']} imported")
-
-                except Exception as e:
-                    if 'duplicate' in str(e).lower() or 'unique' in str(e).lower():
-                        stats['skipped_duplicate'] += 1
+        try:
+            # Stream articles through a server-side cursor instead of buffering
+            # every row (content included) in client memory; full batches are
+            # written to V2 on worker threads while streaming continues
+            with ThreadPoolExecutor(max_workers=V2_WRITE_WORKERS) as executor, \
+                    self.v1_conn.cursor(name='v1_import_stream') as cur:
+                cur.itersize = V1_FETCH_BATCH_SIZE
+                cur.execute(query, params)
+
+                for i, row in enumerate(cur, 1):
+                    stats['total'] = i
+                    if i % PROGRESS_LOG_INTERVAL == 0 and logger.isEnabledFor(logging.INFO):
+                        logger.info("Progress: %d processed, %d imported", i, stats['imported'])
+                    v1_id, title, content, url, source, author, published_date, summary, tags = row
+
+                    # Apply filter
+                    should_import, score, reason = ArticleFilter.evaluate(title, content, tags)
+
+                    if not should_import:
+                        stats['filtered'] += 1
+                        continue
+
+                    # Import to V2, in batches
+                    if not dry_run:
+                        batch.append({
+                            'v1_id': v1_id,
+                            'title': title,
+                            'url': url,
+                            'content': content,
+                            'summary': summary,
+                            'source': source,
+                            'author': author,
+                            'published_date': published_date
+                        })
+
+                        if len(batch) >= V2_INSERT_BATCH_SIZE:
+                            pending.append(executor.submit(self._write_batch, batch))
+                            batch = []
+
+                            # Bound the batches in flight (each holds article content)
+                            if len(pending) > V2_WRITE_WORKERS * 2:
+                                self._add_counts(stats, pending.popleft().result())
                     else:
-                        stats['errors'] += 1
-                        logger.error(f"Failed to import article {article['id']}: {e}")
-            else:
-                stats['imported'] += 1
+                        stats['imported'] += 1
+
+                if batch:
+                    pending.append(executor.submit(self._write_batch, batch))
+
+                while pending:
+                    self._add_counts(stats, pending.popleft().result())
+        finally:
+            if dropped_indexes:
+                self._restore_indexes(dropped_indexes)
+
+        # End the read transaction that held the cursor
+        self.v1_conn.rollback()
+
+        logger.info(f"Processed {stats['total']} articles from V1")
 
         return stats
 
+    def _drop_secondary_indexes_if_empty(self) -> List[Tuple[str, str]]:
+        """
+        Drop the V2 articles table's non-unique indexes if it has no rows
+
+        Unique indexes stay, since the inserts' ON CONFLICT relies on them.
+
+        Returns:
+            (index name, CREATE INDEX definition) for each dropped index
+        """
+        with self.v2_db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT EXISTS (SELECT 1 FROM articles)")
+                if cur.fetchone()[0]:
+                    return []
+
+                cur.execute("""
+                    SELECT i.relname, pg_get_indexdef(i.oid)
+                    FROM pg_index x
+                    JOIN pg_class i ON i.oid = x.indexrelid
+                    WHERE x.indrelid = 'articles'::regclass
+                      AND NOT x.indisunique
+                      AND NOT x.indisprimary
+                """)
+                indexes = cur.fetchall()
+
+                if indexes:
+                    cur.execute(
+                        "DROP INDEX IF EXISTS " + ', '.join(name for name, _ in indexes)
+                    )
+                conn.commit()
+
+        if indexes:
+            logger.info(
+                f"Empty V2 articles table: dropped {len(indexes)} indexes for the bulk load "
+                f"({', '.join(name for name, _ in indexes)})"
+            )
+        return indexes
+
+    def _restore_indexes(self, indexes: List[Tuple[str, str]]):
+        """Recreate indexes dropped for a bulk load, then refresh planner stats"""
+        logger.info(f"Rebuilding {len(indexes)} V2 articles indexes...")
+
+        with self.v2_db.get_connection() as conn:
+            with conn.cursor() as cur:
+                for _, definition in indexes:
+                    cur.execute(definition)
+                conn.commit()
+
+        # ANALYZE can't share the transaction block with other statements
+        with self.v2_db.get_connection() as conn:
+            conn.autocommit = True
+            try:
+                with conn.cursor() as cur:
+                    cur.execute("ANALYZE articles")
+            finally:
+                conn.autocommit = False
+
+        logger.info("✓ V2 articles indexes rebuilt")
+
+    def _write_batch(self, batch: List[Dict]) -> Dict:
+        """
+        Write a batch of filtered articles to V2 (runs on a worker thread)
+
+        If the batched insert fails, the batch is retried one article at a
+        time so a single bad row only costs that row.
+
+        Returns:
+            Counts to add to the import statistics
+        """
+        counts = {'imported': 0, 'skipped_duplicate': 0, 'errors': 0}
+
+        try:
+            counts['imported'] = self.v2_db.store_articles(batch, update_existing=False)
+            counts['skipped_duplicate'] = len(batch) - counts['imported']
+        except Exception as e:
+            logger.warning(f"Batch insert failed ({e}); retrying {len(batch)} articles individually")
+            self._store_individually(batch, counts)
+
+        return counts
+
+    def _store_individually(self, batch: List[Dict], counts: Dict):
+        """
+        Insert articles one at a time on a single V2 connection
+
+        The insert is prepared once per session and executed per article,
+        each in its own transaction so a bad row only costs that row.
+        """
+        with self.v2_db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "SELECT 1 FROM pg_prepared_statements WHERE name = %s",
+                    (V2_PREPARED_INSERT,)
+                )
+                if cur.fetchone() is None:
+                    cur.execute(V2_PREPARE_INSERT_SQL)
+                conn.commit()
+
+                for article in batch:
+                    try:
+                        cur.execute(f"EXECUTE {V2_PREPARED_INSERT} (%s, %s, %s, %s, %s, %s, %s, %s)", (
+                            VermontSignalDatabase._article_hash(article),
+                            article['title'],
+                            article['url'],
+                            article.get('content'),
+                            article.get('summary'),
+                            article.get('source'),
+                            article.get('author'),
+                            article.get('published_date')
+                        ))
+                        inserted = cur.fetchone() is not None
+                        conn.commit()
+                    except Exception as e:
+                        conn.rollback()
+                        counts['errors'] += 1
+                        logger.error(f"Failed to import article {article['v1_id']}: {e}")
+                        continue
+
+                    if inserted:
+                        counts['imported'] += 1
+                    else:
+                        counts['skipped_duplicate'] += 1
+
+    @staticmethod
+    def _add_counts(stats: Dict, counts: Dict):
+        """Fold a batch's counts into the import statistics"""
+        for key, value in counts.items():
+            stats[key] += value
+
     def close(self):
         """Close database connections"""
         if self.v1_conn:
@@ -523,6 +1064,12 @@ def main():
         help='Limit analysis to N articles (for testing)'
     )
 
+    parser.add_argument(
+        '--no-filter-cache',
+        action='store_true',
+        help='Re-score every article in --analyze instead of reusing cached filter results'
+    )
+
     parser.add_argument(
         '--v1-host',
         default='localhost',
@@ -567,6 +1114,7 @@ def main():
 
     # Initialize migrator
     migrator = V1toV2Migrator(v1_config)
+    filter_cache = None
 
     try:
         migrator.connect_v1()
@@ -574,9 +1122,13 @@ def main():
 
         if args.analyze:
             # Analyze articles
+            if not args.no_filter_cache:
+                filter_cache = FilterCache()
+
             stats = migrator.analyze_v1_articles(
                 date_filter_days=args.days,
-                limit=args.limit
+                limit=args.limit,
+                filter_cache=filter_cache
             )
 
             # Print analysis
@@ -636,6 +1188,8 @@ def main():
 
     finally:
         migrator.close()
+        if filter_cache is not None:
+            filter_cache.close()
 
     return 0
 
@@ -5,13 +5,19 @@ Exports from V1, imports to V2 via API endpoints (no direct DB access needed)
 
 import psycopg2
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import sys
 import re
 import json
+import os
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple
 from datetime import datetime
+from itertools import islice
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -23,62 +29,122 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# V1 article ids per server-side cursor round trip (full rows are then
+# fetched for each chunk of ids)
+V1_FETCH_BATCH_SIZE = 500
+
+# Filtered articles per bulk import request (the endpoint takes up to 500)
+API_IMPORT_BATCH_SIZE = 100
+
+# Concurrent import requests to the V2 API (one kept-alive connection each)
+API_IMPORT_WORKERS = 4
+
+# Streamed rows between progress log lines
+PROGRESS_LOG_INTERVAL = 1000
+
+# Retries for transient gateway errors; safe for the bulk import POST
+# because it skips URLs that already exist
+API_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=[502, 503, 504],
+    allowed_methods=None,
+    raise_on_status=False
+)
+
+WORD_RE = re.compile(r'\S+')
+
+
+def count_words(text: str, limit: int) -> int:
+    """Words in text as str.split() counts them, stopping at limit"""
+    return sum(1 for _ in islice(WORD_RE.finditer(text), limit))
+
 
 class ArticleFilter:
     """Smart filtering for high-value articles"""
 
-    # Filter patterns for low-value content
+    # Filter patterns for low-value content (matched case-insensitively)
     EXCLUDE_TITLE_PATTERNS = [
         # Obituaries
-        r'(?i)^obituar(y|ies):',
-        r'(?i)\bobituar(y|ies)\b',
-        r'(?i)in memoriam',
+        r'^obituar(y|ies):',
+        r'\bobituar(y|ies)\b',
+        r'in memoriam',
 
         # School/Education listings
-        r'(?i)^school notes?:',
-        r'(?i)^dean\'?s list',
-        r'(?i)^honor roll',
+        r'^school notes?:',
+        r'^dean\'?s list',
+        r'^honor roll',
 
         # Events and Calendar
-        r'(?i)^calendar:',
-        r'(?i)^events?:',
-        r'(?i)^week(ly|end) roundup',
-        r'(?i)^community calendar',
-        r'(?i)^upcoming events?',
+        r'^calendar:',
+        r'^events?:',
+        r'^week(ly|end) roundup',
+        r'^community calendar',
+        r'^upcoming events?',
 
         # Legal/Public Notices
-        r'(?i)^public notices?',
-        r'(?i)^legal notices?',
+        r'^public notices?',
+        r'^legal notices?',
 
         # Routine Reports
-        r'(?i)construction report for the week',
-        r'(?i)^police (log|report|blotter)',
-        r'(?i)^fire (log|report)',
+        r'construction report for the week',
+        r'^police (log|report|blotter)',
+        r'^fire (log|report)',
 
         # Briefs and Digests
-        r'(?i)^briefs?:',
-        r'(?i)^digest:',
-        r'(?i)^in brief',
+        r'^briefs?:',
+        r'^digest:',
+        r'^in brief',
 
         # Opinion and Commentary
-        r'(?i)^opinion:',
-        r'(?i)^commentary:',
-        r'(?i)^editorial:',
-        r'(?i)^letter to',
-        r'(?i)^op-ed:',
+        r'^opinion:',
+        r'^commentary:',
+        r'^editorial:',
+        r'^letter to',
+        r'^op-ed:',
 
         # Reviews
-        r'(?i)^review:',
-        r'(?i)\b(book|movie|restaurant|album) review\b',
+        r'^review:',
+        r'\b(book|movie|restaurant|album) review\b',
 
         # Sponsored
-        r'(?i)^sponsored',
-        r'(?i)^advertorial',
+        r'^sponsored',
+        r'^advertorial',
     ]
+    # The anchored 'label:' patterns above as literals, looked up by the
+    # lowercased title text up to its first colon; only the remaining
+    # patterns need the regex
+    EXCLUDE_TITLE_LABELS = frozenset({
+        'obituary:', 'obituaries:', 'school note:', 'school notes:',
+        'calendar:', 'event:', 'events:', 'brief:', 'briefs:', 'digest:',
+        'opinion:', 'commentary:', 'editorial:', 'op-ed:', 'review:',
+    })
+    EXCLUDE_TITLE_RESIDUAL_RE = re.compile(
+        '|'.join(
+            f'(?:{p})' for p in EXCLUDE_TITLE_PATTERNS
+            if not re.fullmatch(r"\^[a-z' -]+(?:\(\w+\|\w+\)|s\?)?:", p)
+        ),
+        re.IGNORECASE
+    )
+
+    # Title markers of investigative reporting (score boost)
+    INVESTIGATIVE_PATTERNS = [
+        r'\binvestigat(?:e|ion|ing)\b',
+        r'\breport finds\b',
+        r'\bexclusive\b',
+    ]
+    INVESTIGATIVE_RE = re.compile(
+        '|'.join(f'(?:{p})' for p in INVESTIGATIVE_PATTERNS), re.IGNORECASE
+    )
 
     MIN_CONTENT_LENGTH = 800
     MIN_WORDS = 100
 
+    # The exclude alternation for Postgres ~* (whose word boundary is \y)
+    EXCLUDE_TITLE_SQL_RE = '|'.join(
+        f'(?:{p})' for p in EXCLUDE_TITLE_PATTERNS
+    ).replace(r'\b', r'\y')
+
     @classmethod
     def should_import(cls, article: Dict) -> Tuple[bool, float, str]:
         """Determine if article should be imported"""
@@ -88,20 +154,23 @@ class ArticleFilter:
         score = 50.0
         reasons = []
 
-        # Check title patterns
-        for pattern in cls.EXCLUDE_TITLE_PATTERNS:
-            if re.search(pattern, title):
-                return False, 0.0, f"Title matches exclude pattern"
-
-        # Check content length
+        # Cheapest checks first: length, then word count, then title regex
         if not content or len(content) < cls.MIN_CONTENT_LENGTH:
             return False, 0.0, f"Content too short: {len(content)} chars"
 
         # Check word count
-        word_count = len(content.split())
+        word_count = count_words(content, cls.MIN_WORDS)
         if word_count < cls.MIN_WORDS:
             return False, 0.0, f"Too few words: {word_count}"
 
+        # Check title patterns: a set lookup for 'label:' prefixes, then
+        # the regex for the rest
+        label, colon, _ = title.lower().partition(':')
+        if colon and label + colon in cls.EXCLUDE_TITLE_LABELS:
+            return False, 0.0, "Title matches exclude pattern"
+        if cls.EXCLUDE_TITLE_RESIDUAL_RE.search(title):
+            return False, 0.0, "Title matches exclude pattern"
+
         # Boost for longer content
         if len(content) > 3000:
             score += 15
@@ -115,21 +184,112 @@ class ArticleFilter:
             score -= 10
 
         # Check for investigative markers
-        investigative_patterns = [
-            r'\binvestigat(e|ion|ing)\b',
-            r'\breport finds\b',
-            r'\bexclusive\b',
-        ]
-        for pattern in investigative_patterns:
-            if re.search(pattern, title, re.IGNORECASE):
-                score += 15
-                break
+        if cls.INVESTIGATIVE_RE.search(title):
+            score += 15
 
         should_import = score >= 50
         reason = '; '.join(reasons) if reasons else 'base score'
         return should_import, score, reason
 
 
+def iter_v1_articles(v1_conn, days: int):
+    """
+    Stream V1 articles from the last N days that pass the cheap filters
+
+    A server-side cursor first walks just the ids of articles whose length
+    and title clear ArticleFilter's checks, evaluated in the database; full
+    rows are then fetched for each chunk of ids. Rows rejected there never
+    send their content (or summary) over the wire. The checks are no
+    stricter than should_import, which still decides each row.
+
+    Yields:
+        (id, title, content, url, source, author, published_date, summary)
+    """
+    ids_query = """
+        SELECT id
+        FROM articles
+        WHERE content IS NOT NULL
+          AND LENGTH(content) >= %s
+          AND published_date >= CURRENT_DATE - INTERVAL '%s days'
+          AND COALESCE(title, '') !~* %s
+        ORDER BY published_date DESC
+    """
+
+    rows_query = """
+        SELECT id, title, content, url, source, author, published_date, summary
+        FROM articles
+        WHERE id = ANY(%s)
+        ORDER BY published_date DESC
+    """
+
+    with v1_conn.cursor(name='v1_export') as id_cur, v1_conn.cursor() as row_cur:
+        id_cur.execute(ids_query, (
+            ArticleFilter.MIN_CONTENT_LENGTH,
+            days,
+            ArticleFilter.EXCLUDE_TITLE_SQL_RE
+        ))
+
+        while True:
+            ids = [row[0] for row in id_cur.fetchmany(V1_FETCH_BATCH_SIZE)]
+            if not ids:
+                break
+
+            row_cur.execute(rows_query, (ids,))
+            yield from row_cur
+
+
+def import_batch(session: requests.Session, v2_api_url: str, batch: List[Dict]) -> Dict:
+    """
+    POST a batch of articles to the V2 bulk import endpoint (runs on a worker thread)
+
+    Returns:
+        Counts to add to the migration statistics
+    """
+    counts = {'imported': 0, 'skipped_duplicate': 0, 'errors': 0}
+
+    try:
+        response = session.post(
+            f"{v2_api_url}/api/admin/import-articles-batch",
+            json=[
+                {
+                    'title': article['title'],
+                    'url': article['url'],
+                    'content': article['content'],
+                    'summary': article['summary'],
+                    'source': article['source'],
+                    'author': article['author'],
+                    'published_date': article['published_date']
+                }
+                for article in batch
+            ],
+            timeout=60
+        )
+
+        if response.status_code == 200:
+            for result in response.json()['results']:
+                if result['status'] == 'success':
+                    counts['imported'] += 1
+                elif result['status'] == 'skipped':
+                    counts['skipped_duplicate'] += 1
+        else:
+            counts['errors'] += len(batch)
+            logger.error(
+                f"API error for articles {batch[0]['id']}..{batch[-1]['id']}: {response.status_code}"
+            )
+
+    except Exception as e:
+        counts['errors'] += len(batch)
+        logger.error(f"Failed to import articles {batch[0]['id']}..{batch[-1]['id']}: {e}")
+
+    return counts
+
+
+def add_counts(stats: Dict, counts: Dict):
+    """Fold a batch's counts into the migration statistics"""
+    for key, value in counts.items():
+        stats[key] += value
+
+
 def migrate_via_api(
     v1_host: str,
     v1_port: int,
@@ -173,33 +333,35 @@ def migrate_via_api(
         logger.error(f"✗ Failed to connect to V1: {e}")
         return
 
-    # Fetch articles from V1
-    query = """
-        SELECT id, title, content, url, source, author, published_date, summary
-        FROM articles
-        WHERE content IS NOT NULL
-          AND LENGTH(content) > 100
-          AND published_date >= CURRENT_DATE - INTERVAL '%s days'
-        ORDER BY published_date DESC
-    """
-
-    with v1_conn.cursor() as cur:
-        cur.execute(query, (days,))
-        rows = cur.fetchall()
-
-    logger.info(f"Fetched {len(rows)} articles from V1")
-
     stats = {
-        'total': len(rows),
+        'total': 0,
         'imported': 0,
         'filtered': 0,
         'skipped_duplicate': 0,
         'errors': 0,
-        'filter_reasons': {}
+        'filter_reasons': Counter()
     }
 
-    # Process each article
-    for i, row in enumerate(rows, 1):
+    # One session so requests reuse kept-alive connections (pool sized to
+    # the workers) and retry transient 5xx responses; admin endpoints need
+    # the API key as a bearer token
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=API_IMPORT_WORKERS, max_retries=API_RETRY)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    if os.getenv('ADMIN_API_KEY'):
+        session.headers['Authorization'] = f"Bearer {os.getenv('ADMIN_API_KEY')}"
+
+    executor = ThreadPoolExecutor(max_workers=API_IMPORT_WORKERS)
+    batch = []
+    pending = deque()
+
+    # Stream articles that clear the database-side checks; memory stays
+    # bounded and imports start with the first chunk
+    for i, row in enumerate(iter_v1_articles(v1_conn, days), 1):
+        stats['total'] = i
+        if i % PROGRESS_LOG_INTERVAL == 0 and logger.isEnabledFor(logging.INFO):
+            logger.info("Progress: %d processed, %d imported", i, stats['imported'])
         article = {
             'id': row[0],
             'title': row[1],
@@ -217,45 +379,34 @@ def migrate_via_api(
         if not should_import:
             stats['filtered'] += 1
             reason_key = reason.split(':')[0] if ':' in reason else reason
-            stats['filter_reasons'][reason_key] = stats['filter_reasons'].get(reason_key, 0) + 1
+            stats['filter_reasons'][reason_key] += 1
             continue
 
-        # Import to V2
+        # Import to V2 in batches, posted on worker threads while
+        # streaming continues
         if not dry_run:
-            try:
-                response = requests.post(
-                    f"{v2_api_url}/api/admin/import-article",
-                    json={
-                        'title': article['title'],
-                        'url': article['url'],
-                        'content': article['content'],
-                        'summary': article['summary'],
-                        'source': article['source'],
-                        'author': article['author'],
-                        'published_date': article['published_date']
-                    },
-                    timeout=10
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    if result['status'] == 'success':
-                        stats['imported'] += 1
-                    elif result['status'] == 'skipped':
-                        stats['skipped_duplicate'] += 1
-                else:
-                    stats['errors'] += 1
-                    logger.error(f"API error for article {article['id']}: {response.status_code}")
-
-                if i % 50 == 0:
-                    logger.info(f"Progress: {i}/{len(rows)} processed, {stats['imported']} imported")
-
-            except Exception as e:
-                stats['errors'] += 1
-                logger.error(f"Failed to import article {article['id']}: {e}")
+            batch.append(article)
+
+            if len(batch) >= API_IMPORT_BATCH_SIZE:
+                pending.append(executor.submit(import_batch, session, v2_api_url, batch))
+                batch = []
+
+                # Bound the requests in flight (each holds article content)
+                if len(pending) > API_IMPORT_WORKERS * 2:
+                    add_counts(stats, pending.popleft().result())
         else:
             stats['imported'] += 1
 
+    if batch:
+        pending.append(executor.submit(import_batch, session, v2_api_url, batch))
+
+    while pending:
+        add_counts(stats, pending.popleft().result())
+
+    executor.shutdown()
+    session.close()
+
+    logger.info(f"Fetched {stats['total']} articles from V1 (after database-side filtering)")
     v1_conn.close()
 
     # Print results
@@ -270,7 +421,7 @@ def migrate_via_api(
 
     if stats['filter_reasons']:
         logger.info("\nTop Filter Reasons:")
-        for reason, count in sorted(stats['filter_reasons'].items(), key=lambda x: -x[1])[:10]:
+        for reason, count in stats['filter_reasons'].most_common(10):
             logger.info(f"  {reason}: {count}")
 
     if dry_run:
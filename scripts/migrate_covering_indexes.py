@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Apply the covering/partial indexes used by relationship generation
+
+init_schema() only creates missing indexes, so databases that already have
+idx_facts_article_entity_conf (without INCLUDE) need it rebuilt. Indexes are
+built CONCURRENTLY so writes to facts/articles are not blocked.
+
+Usage:
+    python scripts/migrate_covering_indexes.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from vermont_news_analyzer.modules.database import VermontSignalDatabase
+
+# (index name, definition) - definitions must match schema.sql / init_schema
+INDEXES = [
+    (
+        'idx_facts_article_entity_conf',
+        "facts(article_id, entity) INCLUDE (confidence) WHERE confidence >= 0.6"
+    ),
+    (
+        'idx_articles_pubdate_status',
+        "articles(published_date) WHERE processing_status = 'completed'"
+    ),
+]
+
+
+def index_is_current(cur, name, definition):
+    """Check whether an index exists, is valid, and covers what the definition says"""
+    cur.execute("""
+        SELECT pg_get_indexdef(i.indexrelid), i.indisvalid
+        FROM pg_index i
+        JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE c.relname = %s
+    """, (name,))
+    row = cur.fetchone()
+    if not row:
+        return False
+
+    indexdef, is_valid = row
+    # Old idx_facts_article_entity_conf lacks INCLUDE; a failed CONCURRENTLY build is invalid
+    return is_valid and ('INCLUDE' in indexdef) == ('INCLUDE' in definition)
+
+
+def main():
+    print("🗄️  Applying covering indexes")
+    print("=" * 60)
+
+    db = VermontSignalDatabase()
+    db.connect()
+
+    try:
+        with db.get_connection() as conn:
+            # CREATE/DROP INDEX CONCURRENTLY can't run inside a transaction block
+            conn.autocommit = True
+            try:
+                with conn.cursor() as cur:
+                    for name, definition in INDEXES:
+                        if index_is_current(cur, name, definition):
+                            print(f"   ✅ {name} (already up to date)")
+                            continue
+
+                        print(f"   🔨 Building {name}...")
+                        cur.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+                        cur.execute(f"CREATE INDEX CONCURRENTLY {name} ON {definition}")
+                        print(f"   ✅ {name}")
+
+                    print("\n   Refreshing planner statistics...")
+                    cur.execute("ANALYZE facts")
+                    cur.execute("ANALYZE articles")
+            finally:
+                conn.autocommit = False
+    finally:
+        db.disconnect()
+
+    print("\n" + "=" * 60)
+    print("✅ Index migration complete")
+    print("\nVerify with EXPLAIN (ANALYZE, BUFFERS) on the relationship queries:")
+    print("  expect 'Index Only Scan using idx_facts_article_entity_conf' with Heap Fetches: 0")
+    print("  (run VACUUM facts first if the visibility map is stale)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,10 @@ Demonstrates proximity-weighted co-occurrence calculation
 """
 
 import sys
-sys.path.insert(0, '/Users/mike/Library/Mobile Documents/com~apple~CloudDocs/Projects/Vermont-Signal')
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from vermont_news_analyzer.modules.proximity_matrix import ProximityMatrix
 
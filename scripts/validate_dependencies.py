@@ -4,14 +4,20 @@ Validate critical dependencies before starting worker
 Exit with non-zero code if any critical dependencies are missing
 """
 
+import argparse
+import json
 import sys
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
-def validate_spacy():
-    """Validate spaCy installation and models"""
+def validate_spacy(deep: bool = False):
+    """Validate spaCy installation and models
+
+    By default only the installed package metadata is checked; loading the
+    transformer model (~500 MB, several seconds) happens only with deep=True.
+    """
     try:
         import spacy
         logger.info("✓ spaCy installed")
@@ -23,9 +29,19 @@ def validate_spacy():
             logger.error(f"  Installed models: {models}")
             return False
 
-        # Try to load the model
-        nlp = spacy.load('en_core_web_trf')
-        logger.info("✓ spaCy model 'en_core_web_trf' loaded successfully")
+        # Confirm the pipeline provides NER from the model's meta.json
+        meta_path = spacy.util.get_package_path('en_core_web_trf') / 'meta.json'
+        with open(meta_path) as f:
+            pipeline = json.load(f).get('pipeline', [])
+        if 'ner' not in pipeline:
+            logger.error(f"✗ spaCy model 'en_core_web_trf' has no 'ner' component: {pipeline}")
+            return False
+        logger.info(f"✓ spaCy model 'en_core_web_trf' installed ({', '.join(pipeline)})")
+
+        if deep:
+            # Try to load the model
+            spacy.load('en_core_web_trf')
+            logger.info("✓ spaCy model 'en_core_web_trf' loaded successfully")
         return True
 
     except ImportError:
@@ -109,12 +125,19 @@ def validate_ml_libraries():
 
 def main():
     """Run all validation checks"""
+    parser = argparse.ArgumentParser(description='Validate worker dependencies')
+    parser.add_argument('--deep', action='store_true',
+                        help='Load the spaCy model instead of only checking its metadata')
+    args = parser.parse_args()
+
     logger.info("=" * 70)
     logger.info("VALIDATING DEPENDENCIES")
     logger.info("=" * 70)
 
+    # Run sequentially: concurrent imports of the same heavy package (torch,
+    # transformers) can fail half-initialized and read as "not installed"
     checks = {
-        'spaCy': validate_spacy(),
+        'spaCy': validate_spacy(deep=args.deep),
         'Transformers': validate_transformers(),
         'LLM Clients': validate_llm_clients(),
         'Database': validate_database(),
@@ -4,9 +4,11 @@ Standalone test for topic filtering logic
 Tests the filtering logic without importing full modules
 """
 
+import re
+
 
 # Replicate the CUSTOM_STOP_WORDS set
-CUSTOM_STOP_WORDS = {
+CUSTOM_STOP_WORDS = frozenset({
     # Common reporting verbs
     'said', 'says', 'told', 'asked', 'announced', 'reported', 'stated',
     'explained', 'noted', 'added', 'continued', 'began', 'started',
@@ -43,7 +45,14 @@ CUSTOM_STOP_WORDS = {
     'article', 'story', 'report', 'news', 'according', 'including',
     # Common Vermont terms that are too generic
     'vermont', 'vt',
-}
+})
+
+
+HTML_INDICATORS = (
+    'href', 'class', 'style', 'rel', 'alt', 'src', 'div',
+    'span', 'img', 'fig', 'wp', 'block', 'attachment',
+)
+HTML_INDICATOR_RE = re.compile('|'.join(HTML_INDICATORS))
 
 
 def is_meaningful_keyword(keyword):
@@ -52,20 +61,15 @@ def is_meaningful_keyword(keyword):
         return False
     if not keyword.isalpha():
         return False
-    if keyword.lower() in CUSTOM_STOP_WORDS:
-        return False
-
-    html_indicators = [
-        'href', 'class', 'style', 'rel', 'alt', 'src', 'div',
-        'span', 'img', 'fig', 'wp', 'block', 'attachment',
-    ]
 
     keyword_lower = keyword.lower()
-    for indicator in html_indicators:
-        if indicator in keyword_lower:
-            return False
+    if keyword_lower in CUSTOM_STOP_WORDS:
+        return False
+
+    if HTML_INDICATOR_RE.search(keyword_lower):
+        return False
 
-    if keyword != keyword.lower() and keyword != keyword.title():
+    if keyword != keyword_lower and keyword != keyword.title():
         return False
 
     return True
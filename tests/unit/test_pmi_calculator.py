@@ -157,6 +157,32 @@ def test_pmi_batch_calculation(calculator):
     assert pmi_scores[('D', 'E')].npmi is None
 
 
+def test_pmi_batch_corpus_frequencies_decide_scoring(calculator):
+    """Corpus-wide frequencies, when given, decide PMI vs proximity-only scoring"""
+    cooc_matrix = {
+        ('A', 'B'): {'count': 1, 'confidence_a': 0.9, 'confidence_b': 0.9, 'proximity_weight': 3.0},
+        ('C', 'D'): {'count': 2, 'confidence_a': 0.9, 'confidence_b': 0.9, 'proximity_weight': 2.0}
+    }
+
+    # Within the article, A and B are rare while C and D are frequent
+    entity_frequencies = {'A': 1, 'B': 1, 'C': 3, 'D': 3}
+
+    # Across the corpus it's the other way round
+    corpus_frequencies = {'A': 12, 'B': 7, 'C': 1, 'D': 4}
+
+    pmi_scores = calculator.calculate_pmi_batch(
+        cooc_matrix,
+        entity_frequencies,
+        total_documents=5,
+        corpus_frequencies=corpus_frequencies
+    )
+
+    assert not pmi_scores[('A', 'B')].is_rare_entity
+    assert pmi_scores[('A', 'B')].pmi is not None
+    assert pmi_scores[('C', 'D')].is_rare_entity
+    assert pmi_scores[('C', 'D')].pmi is None
+
+
 def test_pmi_filtering(calculator):
     """Test PMI threshold filtering"""
     pmi_scores = {
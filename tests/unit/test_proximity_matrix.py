@@ -215,3 +215,38 @@ def test_occurrence_details_stored():
     assert occurrence['weight'] == 3.0
     assert occurrence['confidence_a'] == 0.9
     assert occurrence['confidence_b'] == 0.8
+
+
+def test_aggregates_without_occurrence_records():
+    """Test that averages are kept when occurrence records are not stored"""
+    entities = [
+        {'entity': 'A', 'type': 'X', 'sentence_index': 0, 'confidence': 0.9},
+        {'entity': 'B', 'type': 'X', 'sentence_index': 0, 'confidence': 0.7},
+        {'entity': 'B', 'type': 'X', 'sentence_index': 1, 'confidence': 0.5},
+    ]
+
+    matrix_builder = ProximityMatrix(window_size=1, keep_occurrences=False)
+    co_matrix = matrix_builder.build_matrix(entities, article_id=123)
+
+    ab_pair = co_matrix[('A', 'B')]
+    assert len(ab_pair.occurrences) == 0
+    assert ab_pair.occurrence_count == 4  # Each direction counted once
+    assert ab_pair.avg_distance == 0.5
+    assert ab_pair.avg_confidence_a == pytest.approx(0.75)
+    assert ab_pair.avg_confidence_b == pytest.approx(0.75)
+
+
+def test_input_order_does_not_change_matrix(sample_entities):
+    """Test that mentions are scanned by sentence regardless of input order"""
+    matrix_builder = ProximityMatrix(window_size=1)
+    in_order = matrix_builder.build_matrix(sample_entities, article_id=1)
+    shuffled = matrix_builder.build_matrix(sample_entities[::-1], article_id=1)
+
+    assert in_order.keys() == shuffled.keys()
+    for pair, data in in_order.items():
+        assert shuffled[pair].total_weight == data.total_weight
+        assert shuffled[pair].occurrence_count == data.occurrence_count
+        assert sorted(shuffled[pair].occurrences['sentence_index']) == \
+            sorted(data.occurrences['sentence_index'])
+    assert ('Alice', 'David') in in_order
+    assert ('Bob', 'David') not in in_order  # Two sentences apart
@@ -289,6 +289,12 @@ class BatchProcessor:
                 logger.error(f"✗ Relationship generation failed: {e}")
                 # Don't fail the batch if relationship generation fails
 
+            # Keep the entity importance / article density views current with the new facts
+            try:
+                self.db.refresh_fact_aggregates()
+            except Exception as e:
+                logger.error(f"✗ Fact aggregate refresh failed: {e}")
+
         # Final summary
         logger.info("\n" + "=" * 80)
         logger.info("BATCH PROCESSING COMPLETE")
@@ -8,7 +8,7 @@ import hashlib
 import logging
 import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
@@ -171,6 +171,31 @@ class RSSCollector:
         Returns:
             List of article dicts with title, url, content, source, etc.
         """
+        return list(self.iter_feed(feed_url, retry_count))
+
+    def count_feed(self, feed_url: str) -> int:
+        """
+        Count articles that would be collected from a feed without retaining them
+
+        Args:
+            feed_url: RSS feed URL
+
+        Returns:
+            Number of articles passing the Vermont and low-value filters
+        """
+        return sum(1 for _ in self.iter_feed(feed_url))
+
+    def iter_feed(self, feed_url: str, retry_count: int = 0) -> Iterator[Dict]:
+        """
+        Fetch and parse RSS feed, yielding filtered article dicts one at a time
+
+        Args:
+            feed_url: RSS feed URL
+            retry_count: Current retry attempt (for exponential backoff)
+
+        Yields:
+            Article dicts with title, url, content, source, etc.
+        """
         try:
             logger.info(f"Fetching feed: {feed_url}")
             feed = feedparser.parse(feed_url)
@@ -186,11 +211,12 @@ class RSSCollector:
                             f"Retrying in {wait_time}s... (attempt {retry_count + 1}/3)"
                         )
                         time.sleep(wait_time)
-                        return self.fetch_feed(feed_url, retry_count + 1)
+                        yield from self.iter_feed(feed_url, retry_count + 1)
+                        return
                     else:
                         logger.error(f"Rate limited on {feed_url}. Skipping.")
                         self.feed_status.update(feed_url, success=False, error="Rate limited (429)")
-                        return []
+                        return
                 else:
                     # Other feed parsing error
                     logger.warning(f"Feed parsing warning for {feed_url}: {feed.bozo_exception}")
@@ -200,7 +226,7 @@ class RSSCollector:
             # Check if this feed requires Vermont filtering
             requires_filtering = feed_url in FILTERED_FEEDS
 
-            articles = []
+            article_count = 0
             vt_filtered_count = 0
             filter_stats = {
                 'new_hampshire_article': 0,
@@ -281,7 +307,8 @@ class RSSCollector:
                 # Generate hash for deduplication
                 article['article_hash'] = self.generate_article_hash(url, title)
 
-                articles.append(article)
+                article_count += 1
+                yield article
 
             # Log filtering results
             if requires_filtering and vt_filtered_count > 0:
@@ -292,13 +319,11 @@ class RSSCollector:
                 filter_summary = ", ".join([f"{count} {reason}" for reason, count in filter_stats.items() if count > 0])
                 logger.info(f"Filtered {total_filtered} low-value articles from {feed_url}: {filter_summary}")
 
-            logger.debug(f"Fetched {len(articles)} articles from {feed_url}")
-            return articles
+            logger.debug(f"Fetched {article_count} articles from {feed_url}")
 
         except Exception as e:
             logger.error(f"Error fetching feed {feed_url}: {e}")
             self.feed_status.update(feed_url, success=False, error=str(e))
-            return []
 
     def store_articles(self, articles: List[Dict], feed_url: str) -> int:
         """
@@ -7,7 +7,7 @@ import psycopg2
 from psycopg2 import pool
 from psycopg2.extras import execute_values, Json
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import os
 import json
@@ -79,8 +79,14 @@ class VermontSignalDatabase:
         """
         Establish database connection pool
 
-        Creates a ThreadedConnectionPool with minconn=2, maxconn=pool_size
+        Creates a ThreadedConnectionPool with minconn=2, maxconn=pool_size.
+        Calling it again while the pool is open reuses that pool (and its
+        warm connections) instead of opening, and leaking, a second one.
         """
+        if self.connection_pool is not None and not self.connection_pool.closed:
+            logger.debug("Database connection pool already open; reusing it")
+            return
+
         try:
             if self.database_url:
                 # Create pool using DATABASE_URL (Railway/Heroku style)
@@ -107,6 +113,7 @@ class VermontSignalDatabase:
         """Close all connections in the pool"""
         if self.connection_pool:
             self.connection_pool.closeall()
+            self.connection_pool = None
             logger.info("Database connection pool closed")
 
     @contextmanager
@@ -166,6 +173,8 @@ class VermontSignalDatabase:
         CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source);
         CREATE INDEX IF NOT EXISTS idx_articles_status ON articles(processing_status);
         CREATE INDEX IF NOT EXISTS idx_articles_hash ON articles(article_hash);
+        CREATE INDEX IF NOT EXISTS idx_articles_completed_published ON articles(published_date DESC) INCLUDE (id, title) WHERE processing_status = 'completed' AND content IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS idx_articles_pubdate_status ON articles(published_date) WHERE processing_status = 'completed';
 
 
         -- V2 Ensemble Extraction Results
@@ -241,9 +250,28 @@ class VermontSignalDatabase:
         CREATE INDEX IF NOT EXISTS idx_facts_entity_type ON facts(entity_type);
         CREATE INDEX IF NOT EXISTS idx_facts_confidence ON facts(confidence);
         CREATE INDEX IF NOT EXISTS idx_facts_wikidata ON facts(wikidata_id);
+        CREATE INDEX IF NOT EXISTS idx_facts_article_entity_conf ON facts(article_id, entity) INCLUDE (confidence) WHERE confidence >= 0.6;
         CREATE INDEX IF NOT EXISTS idx_facts_sentence ON facts(article_id, sentence_index) WHERE sentence_index IS NOT NULL;
         CREATE INDEX IF NOT EXISTS idx_facts_paragraph ON facts(article_id, paragraph_index) WHERE paragraph_index IS NOT NULL;
 
+        -- Corpus-wide fact aggregates for relationship generation
+        -- (refreshed after each batch run; unique indexes allow REFRESH ... CONCURRENTLY)
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_entity_importance AS
+        SELECT entity, COUNT(DISTINCT article_id) as article_count
+        FROM facts
+        WHERE confidence >= 0.6
+        GROUP BY entity;
+
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_entity_importance_entity ON mv_entity_importance(entity);
+
+        CREATE MATERIALIZED VIEW IF NOT EXISTS mv_article_density AS
+        SELECT article_id, COUNT(DISTINCT entity) as entity_count
+        FROM facts
+        WHERE confidence >= 0.6
+        GROUP BY article_id;
+
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_article_density_article ON mv_article_density(article_id);
+
 
         -- Entity Relationships (for network graph)
         CREATE TABLE IF NOT EXISTS entity_relationships (
@@ -340,6 +368,14 @@ class VermontSignalDatabase:
             logger.error(f"Schema initialization failed: {e}")
             raise
 
+    @staticmethod
+    def _article_hash(article_data: Dict) -> str:
+        """Article hash for deduplication (url + title)"""
+        import hashlib
+
+        hash_content = f"{article_data['url']}||{article_data['title']}"
+        return hashlib.sha256(hash_content.encode()).hexdigest()
+
     def store_article(self, article_data: Dict) -> int:
         """
         Store or update article
@@ -350,11 +386,8 @@ class VermontSignalDatabase:
         Returns:
             article_id: Database ID of stored article
         """
-        import hashlib
-
         # Generate article hash for deduplication
-        hash_content = f"{article_data['url']}||{article_data['title']}"
-        article_hash = hashlib.sha256(hash_content.encode()).hexdigest()
+        article_hash = self._article_hash(article_data)
 
         insert_sql = """
             INSERT INTO articles (
@@ -393,6 +426,108 @@ class VermontSignalDatabase:
             logger.error(f"Failed to store article: {e}")
             raise
 
+    def store_articles(
+        self,
+        articles: List[Dict],
+        page_size: int = 500,
+        update_existing: bool = True
+    ) -> int:
+        """
+        Store or update many articles in batched round trips
+
+        Same upsert as store_article, sent with execute_values in one
+        transaction. Articles repeating a URL keep the last occurrence, as
+        sequential store_article calls would (one statement can't update
+        the same row twice).
+
+        Args:
+            articles: List of dicts with title, url, content, source, etc.
+            page_size: Rows per INSERT statement
+            update_existing: Update articles already stored; if False they
+                            are left untouched and not counted
+
+        Returns:
+            Number of articles stored
+        """
+        return len(self._store_articles(articles, page_size, update_existing))
+
+    def insert_articles(self, articles: List[Dict], page_size: int = 500) -> Dict[str, int]:
+        """
+        Insert the articles not stored yet, in batched round trips
+
+        As store_articles(update_existing=False), but reports which
+        articles were inserted.
+
+        Args:
+            articles: List of dicts with title, url, content, source, etc.
+            page_size: Rows per INSERT statement
+
+        Returns:
+            Dict mapping URL to article ID for each newly inserted article
+        """
+        return {url: article_id for article_id, url in self._store_articles(articles, page_size, False)}
+
+    def _store_articles(
+        self,
+        articles: List[Dict],
+        page_size: int,
+        update_existing: bool
+    ) -> List[Tuple[int, str]]:
+        """Shared batched insert behind store_articles; returns (id, url) per stored row"""
+        rows_by_url = {}
+        for article_data in articles:
+            rows_by_url[article_data['url']] = (
+                self._article_hash(article_data),
+                article_data['title'],
+                article_data['url'],
+                article_data.get('content'),
+                article_data.get('summary'),
+                article_data.get('source'),
+                article_data.get('author'),
+                article_data.get('published_date')
+            )
+
+        if not rows_by_url:
+            return []
+
+        if update_existing:
+            on_conflict = """
+            ON CONFLICT (url)
+            DO UPDATE SET
+                title = EXCLUDED.title,
+                content = EXCLUDED.content,
+                summary = EXCLUDED.summary
+            """
+        else:
+            # Any unique conflict (url or article_hash) skips the row
+            on_conflict = "ON CONFLICT DO NOTHING"
+
+        insert_sql = f"""
+            INSERT INTO articles (
+                article_hash, title, url, content, summary,
+                source, author, published_date
+            )
+            VALUES %s
+            {on_conflict}
+            RETURNING id, url
+        """
+
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    stored = execute_values(
+                        cur, insert_sql, list(rows_by_url.values()),
+                        page_size=page_size, fetch=True
+                    )
+                    conn.commit()
+
+            logger.info(f"Stored {len(stored)} articles")
+            return stored
+
+        except Exception as e:
+            logger.error(f"Failed to store articles: {e}")
+            raise
+
     def store_extraction_result(
         self,
         article_id: int,
@@ -760,6 +895,22 @@ class VermontSignalDatabase:
 
                 return articles
 
+    def has_unprocessed_articles(self) -> bool:
+        """Check whether any articles are waiting for V2 processing (EXISTS probe, no row fetch)"""
+        query = """
+            SELECT EXISTS (
+                SELECT 1
+                FROM articles
+                WHERE processing_status = 'pending'
+                  AND content IS NOT NULL
+            )
+        """
+
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query)
+                return cur.fetchone()[0]
+
     def mark_article_processed(
         self,
         article_id: int,
@@ -822,3 +973,23 @@ class VermontSignalDatabase:
         except Exception as e:
             logger.error(f"Failed to generate co-occurrence relationships: {e}")
             raise
+
+    def refresh_fact_aggregates(self):
+        """
+        Refresh the corpus-wide fact aggregate materialized views
+
+        Refreshes mv_entity_importance and mv_article_density CONCURRENTLY, so
+        relationship generation can keep reading them during the refresh.
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_entity_importance")
+                    cur.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_article_density")
+                    conn.commit()
+
+            logger.info("Refreshed fact aggregate materialized views")
+
+        except Exception as e:
+            logger.error(f"Failed to refresh fact aggregates: {e}")
+            raise
@@ -441,9 +441,13 @@ class OutputFusion:
             'timestamp': output.timestamp
         }
 
-        # Save to file
+        # Save to file: serialize compactly in one call (the C encoder; an
+        # indented json.dump runs the pure-Python encoder and issues a write
+        # per fragment) and write the result at once
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(output_dict, f, indent=2, ensure_ascii=False)
+        output_path.write_text(
+            json.dumps(output_dict, ensure_ascii=False, separators=(',', ':')),
+            encoding='utf-8'
+        )
 
         logger.info(f"Output saved successfully: {output_path}")
@@ -4,6 +4,8 @@ Uses spaCy for NER and BERTopic for topic modeling as independent validation
 """
 
 import logging
+import re
+from functools import lru_cache
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -28,6 +30,13 @@ try:
 except ImportError:
     SKLEARN_AVAILABLE = False
 
+try:
+    from cuml.manifold import UMAP as cuUMAP
+    from cuml.cluster import HDBSCAN as cuHDBSCAN
+    CUML_AVAILABLE = True
+except ImportError:
+    CUML_AVAILABLE = False
+
 sys.path.append(str(Path(__file__).parent.parent))
 from config import NLPConfig, PipelineConfig
 
@@ -218,7 +227,7 @@ class TopicModeler:
 
     # Comprehensive stop words for Vermont news analysis
     # Includes common verbs, temporal words, generic nouns that don't represent topics
-    CUSTOM_STOP_WORDS = {
+    CUSTOM_STOP_WORDS = frozenset({
         # Common reporting verbs
         'said', 'says', 'told', 'asked', 'announced', 'reported', 'stated',
         'explained', 'noted', 'added', 'continued', 'began', 'started',
@@ -271,24 +280,52 @@ class TopicModeler:
 
         # Modifiers that aren't topics themselves
         'like', 'new', 'just', 'now', 'well', 'good', 'best', 'better',
-    }
+    })
+
+    # Common HTML/web prefixes and substrings left behind in scraped text
+    HTML_INDICATORS = (
+        'href', 'class', 'style', 'rel', 'alt', 'src', 'div',
+        'span', 'img', 'fig', 'wp', 'block', 'attachment',
+        'noreferrer', 'noopener', 'nofollow', 'blockquote',
+        'figcaption', 'probationli', 'classwp', 'styleheight',
+        'tdtda', 'hrefhttp', 'pthe', 'pq'
+    )
+    # All indicators in one alternation, so a keyword is scanned once
+    HTML_INDICATOR_RE = re.compile('|'.join(HTML_INDICATORS))
 
     # Minimum c-TF-IDF score threshold for keywords (lowered to be less aggressive)
     MIN_TFIDF_SCORE = 0.01
 
-    def __init__(self, min_topic_size: int = None):
+    def __init__(self, min_topic_size: int = None, embedding_model=None):
         """
         Initialize topic modeler
 
         Args:
             min_topic_size: Minimum documents per topic (defaults to config)
+            embedding_model: Optional preloaded SentenceTransformer shared with the caller
+                             (BERTopic loads its default model when None)
         """
         if not BERTOPIC_AVAILABLE:
             raise ImportError("bertopic not installed")
 
         self.min_topic_size = min_topic_size or NLPConfig.BERTOPIC_MIN_TOPIC_SIZE
+        self.embedding_model = embedding_model
         self.model = None
 
+        # GPU dimensionality reduction and clustering when RAPIDS cuML is installed;
+        # None lets BERTopic fall back to its CPU UMAP/HDBSCAN defaults
+        if CUML_AVAILABLE:
+            self.umap_model = cuUMAP(n_components=5, n_neighbors=15, min_dist=0.0)
+            self.hdbscan_model = cuHDBSCAN(
+                min_cluster_size=self.min_topic_size,
+                gen_min_span_tree=True,
+                prediction_data=True
+            )
+            logger.info("Using cuML GPU UMAP/HDBSCAN for topic modeling")
+        else:
+            self.umap_model = None
+            self.hdbscan_model = None
+
     def _clean_html(self, text: str) -> str:
         """
         Clean HTML tags and artifacts from text
@@ -335,11 +372,28 @@ class TopicModeler:
 
         return text.strip()
 
-    def _is_meaningful_keyword(self, keyword: str) -> bool:
+    def clean_documents(self, documents: List[str]) -> List[str]:
+        """
+        Clean HTML from a batch of documents
+
+        Args:
+            documents: Raw article texts
+
+        Returns:
+            Cleaned texts, in the same order
+        """
+        return [self._clean_html(doc) for doc in documents]
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _is_meaningful_keyword(keyword: str) -> bool:
         """
         Check if keyword is meaningful for topic representation
         Filters out HTML artifacts, stop words, and generic terms
 
+        Memoized: the same stop words and generic terms come up in nearly
+        every topic, and the answer depends only on the keyword.
+
         Args:
             keyword: Keyword to check
 
@@ -361,24 +415,15 @@ class TopicModeler:
         keyword_lower = keyword.lower()
 
         # Check against custom stop words
-        if keyword_lower in self.CUSTOM_STOP_WORDS:
+        if keyword_lower in TopicModeler.CUSTOM_STOP_WORDS:
             return False
 
         # Common HTML/web prefixes and substrings
-        html_indicators = [
-            'href', 'class', 'style', 'rel', 'alt', 'src', 'div',
-            'span', 'img', 'fig', 'wp', 'block', 'attachment',
-            'noreferrer', 'noopener', 'nofollow', 'blockquote',
-            'figcaption', 'probationli', 'classwp', 'styleheight',
-            'tdtda', 'hrefhttp', 'pthe', 'pq'
-        ]
-
-        for indicator in html_indicators:
-            if indicator in keyword_lower:
-                return False
+        if TopicModeler.HTML_INDICATOR_RE.search(keyword_lower):
+            return False
 
         # Contains mixed case indicating concatenated HTML (e.g. classwpBlock)
-        if keyword != keyword.lower() and keyword != keyword.title():
+        if keyword != keyword_lower and keyword != keyword.title():
             return False
 
         return True
@@ -463,7 +508,9 @@ class TopicModeler:
     def train_topics(
         self,
         documents: List[str],
-        custom_labels: Optional[List[str]] = None
+        custom_labels: Optional[List[str]] = None,
+        embeddings=None,
+        pre_cleaned: bool = False
     ) -> TopicResult:
         """
         Train topic model on document corpus
@@ -471,6 +518,8 @@ class TopicModeler:
         Args:
             documents: List of article texts
             custom_labels: Optional labels for documents
+            embeddings: Optional precomputed document embeddings (skips BERTopic's own encoding)
+            pre_cleaned: Documents were already passed through clean_documents()
 
         Returns:
             TopicResult with topics and assignments
@@ -479,8 +528,11 @@ class TopicModeler:
         logger.info(f"Training BERTopic model on {len(documents)} documents")
 
         # Clean HTML from documents
-        cleaned_documents = [self._clean_html(doc) for doc in documents]
-        logger.info("Cleaned HTML artifacts from documents")
+        if pre_cleaned:
+            cleaned_documents = documents
+        else:
+            cleaned_documents = self.clean_documents(documents)
+            logger.info("Cleaned HTML artifacts from documents")
 
         # Configure vectorizer for better topic representation
         vectorizer_model = CountVectorizer(
@@ -491,6 +543,9 @@ class TopicModeler:
 
         # Initialize BERTopic
         self.model = BERTopic(
+            embedding_model=self.embedding_model,
+            umap_model=self.umap_model,
+            hdbscan_model=self.hdbscan_model,
             min_topic_size=self.min_topic_size,
             vectorizer_model=vectorizer_model,
             calculate_probabilities=True,
@@ -498,7 +553,7 @@ class TopicModeler:
         )
 
         # Fit model using cleaned documents
-        topics, probabilities = self.model.fit_transform(cleaned_documents)
+        topics, probabilities = self.model.fit_transform(cleaned_documents, embeddings)
 
         # Get topic information
         topic_info = self.model.get_topic_info()
@@ -551,12 +606,48 @@ class TopicModeler:
             }
         )
 
-    def assign_topics(self, documents: List[str]) -> List[Tuple[int, float]]:
+    def save_model(self, path) -> None:
+        """
+        Persist the trained model with safetensors serialization
+
+        The embedding model is not saved; pass the same one to load_model().
+
+        Args:
+            path: Directory to write the model to
+        """
+
+        if self.model is None:
+            raise ValueError("Model not trained. Call train_topics() first.")
+
+        self.model.save(
+            str(path),
+            serialization="safetensors",
+            save_ctfidf=True,
+            save_embedding_model=False
+        )
+        logger.info(f"Saved BERTopic model to {path}")
+
+    def load_model(self, path) -> None:
+        """
+        Load a model saved with save_model()
+
+        A safetensors-loaded model has no UMAP/HDBSCAN, so assign_topics()
+        matches documents to topics by cosine similarity to topic embeddings.
+
+        Args:
+            path: Directory the model was saved to
+        """
+
+        self.model = BERTopic.load(str(path), embedding_model=self.embedding_model)
+        logger.info(f"Loaded BERTopic model from {path}")
+
+    def assign_topics(self, documents: List[str], embeddings=None) -> List[Tuple[int, float]]:
         """
         Assign topics to new documents using trained model
 
         Args:
             documents: List of new article texts
+            embeddings: Optional precomputed document embeddings
 
         Returns:
             List of (topic_id, probability) tuples
@@ -568,8 +659,12 @@ class TopicModeler:
 
         logger.info(f"Assigning topics to {len(documents)} new documents")
 
-        topics, probabilities = self.model.transform(documents)
-        document_topics = list(zip(topics, probabilities.max(axis=1).tolist()))
+        topics, probabilities = self.model.transform(documents, embeddings)
+
+        # Full probability matrix when calculate_probabilities is set, else one score per document
+        if probabilities.ndim > 1:
+            probabilities = probabilities.max(axis=1)
+        document_topics = list(zip(topics, probabilities.tolist()))
 
         return document_topics
 
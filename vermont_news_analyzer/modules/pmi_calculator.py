@@ -120,7 +120,8 @@ class PMICalculator:
         total_documents: int,
         confidence_a: float = 1.0,
         confidence_b: float = 1.0,
-        proximity_weight: float = 0.0
+        proximity_weight: float = 0.0,
+        use_pmi: Optional[bool] = None
     ) -> PMIScore:
         """
         Calculate PMI score for an entity pair with hybrid scoring
@@ -135,6 +136,7 @@ class PMICalculator:
             confidence_a: Confidence score for entity_a (0-1)
             confidence_b: Confidence score for entity_b (0-1)
             proximity_weight: Proximity weight for rare entity fallback
+            use_pmi: Precomputed PMI-vs-proximity decision (default: from entity_freq_a/b)
 
         Returns:
             PMIScore object with all calculated metrics
@@ -145,7 +147,8 @@ class PMICalculator:
         p_y = (entity_freq_b + self.smoothing) / (total_documents + self.smoothing)
 
         # Check if we should use PMI or proximity-only scoring
-        use_pmi = self.should_use_pmi(entity_freq_a, entity_freq_b)
+        if use_pmi is None:
+            use_pmi = self.should_use_pmi(entity_freq_a, entity_freq_b)
 
         if use_pmi:
             # Full PMI calculation
@@ -201,7 +204,8 @@ class PMICalculator:
         self,
         cooccurrence_matrix: Dict[Tuple[str, str], Dict],
         entity_frequencies: Dict[str, int],
-        total_documents: int
+        total_documents: int,
+        corpus_frequencies: Optional[Dict[str, int]] = None
     ) -> Dict[Tuple[str, str], PMIScore]:
         """
         Calculate PMI for multiple entity pairs with hybrid scoring
@@ -211,6 +215,9 @@ class PMICalculator:
                                 Expected keys: 'count', 'confidence_a', 'confidence_b', 'proximity_weight'
             entity_frequencies: Dict mapping entity names to document frequencies
             total_documents: Total number of documents
+            corpus_frequencies: Optional corpus-wide article counts per entity (computed
+                                once per run); when given, these decide PMI vs proximity-only
+                                scoring instead of entity_frequencies
 
         Returns:
             Dict mapping entity pairs to PMIScore objects
@@ -230,6 +237,14 @@ class PMICalculator:
             freq_a = entity_frequencies.get(entity_a, 1)  # Default to 1 if not found
             freq_b = entity_frequencies.get(entity_b, 1)
 
+            if corpus_frequencies is not None:
+                use_pmi = self.should_use_pmi(
+                    corpus_frequencies.get(entity_a, 1),
+                    corpus_frequencies.get(entity_b, 1)
+                )
+            else:
+                use_pmi = None
+
             # Calculate PMI (hybrid)
             pmi_score = self.calculate_pmi(
                 entity_a, entity_b,
@@ -237,7 +252,8 @@ class PMICalculator:
                 freq_a, freq_b,
                 total_documents,
                 conf_a, conf_b,
-                proximity_weight
+                proximity_weight,
+                use_pmi=use_pmi
             )
 
             pmi_scores[(entity_a, entity_b)] = pmi_score
@@ -8,8 +8,25 @@ from collections import defaultdict
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# One record per occurrence (article_id is -1 when the matrix is built without one)
+OCCURRENCE_DTYPE = np.dtype([
+    ('article_id', 'i8'),
+    ('sentence_index', 'i4'),
+    ('distance', 'i2'),
+    ('weight', 'f4'),
+    ('confidence_a', 'f8'),
+    ('confidence_b', 'f8'),
+])
+
+# Shared by every pair built without occurrence records (read-only, so no
+# caller can grow one pair's records into another's)
+NO_OCCURRENCES = np.empty(0, dtype=OCCURRENCE_DTYPE)
+NO_OCCURRENCES.flags.writeable = False
+
 
 @dataclass
 class CooccurrenceData:
@@ -17,13 +34,26 @@ class CooccurrenceData:
     entity_a: str
     entity_b: str
     total_weight: float
-    occurrences: List[Dict] = field(default_factory=list)
+    occurrences: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=OCCURRENCE_DTYPE))
     min_distance: int = 999
     max_distance: int = 0
     avg_distance: float = 0.0
     same_sentence_count: int = 0
     adjacent_sentence_count: int = 0
     near_proximity_count: int = 0
+    # Running aggregates, so averages don't need the per-occurrence records
+    occurrence_count: int = 0
+    confidence_a_sum: float = 0.0
+    confidence_b_sum: float = 0.0
+    distance_sum: int = 0
+
+    @property
+    def avg_confidence_a(self) -> float:
+        return self.confidence_a_sum / self.occurrence_count if self.occurrence_count else 0.0
+
+    @property
+    def avg_confidence_b(self) -> float:
+        return self.confidence_b_sum / self.occurrence_count if self.occurrence_count else 0.0
 
 
 class ProximityMatrix:
@@ -36,7 +66,7 @@ class ProximityMatrix:
     - Near proximity (distance=2+): weight 1
     """
 
-    def __init__(self, window_size: int = 2):
+    def __init__(self, window_size: int = 2, keep_occurrences: bool = True):
         """
         Initialize proximity matrix builder
 
@@ -45,8 +75,12 @@ class ProximityMatrix:
                         0 = same sentence only
                         1 = same or adjacent sentences (±1)
                         2 = within ±2 sentences (default)
+            keep_occurrences: Store per-occurrence records on each pair.
+                        Counts and averages are kept either way, so bulk
+                        callers can turn this off to hold O(pairs) memory
         """
         self.window_size = window_size
+        self.keep_occurrences = keep_occurrences
 
     def build_matrix(
         self,
@@ -74,94 +108,116 @@ class ProximityMatrix:
             logger.warning(f"Article {article_id}: No entities with position data")
             return {}
 
-        # Group entities by sentence
-        entities_by_sentence = defaultdict(list)
-        for entity in valid_entities:
-            sent_idx = entity['sentence_index']
-            entities_by_sentence[sent_idx].append(entity)
+        # Mentions as parallel arrays, in scan order: by sentence, then input order
+        order = np.argsort(
+            np.array([e['sentence_index'] for e in valid_entities], dtype=np.int64),
+            kind='stable'
+        )
+        names = np.array([e['entity'] for e in valid_entities], dtype=object)[order]
+        sentences = np.array([e['sentence_index'] for e in valid_entities], dtype=np.int64)[order]
+        confidences = np.array([e.get('confidence', 1.0) for e in valid_entities], dtype=np.float64)[order]
+
+        # Entity codes follow sorted names, so a pair's smaller code is its
+        # alphabetically first entity
+        entity_names, codes = np.unique(names, return_inverse=True)
+
+        # Every ordered mention pair within the window, in scan order. With
+        # mentions sorted by sentence, each mention's partners are one
+        # contiguous range [lo, hi)
+        lo = np.searchsorted(sentences, sentences - self.window_size, side='left')
+        hi = np.searchsorted(sentences, sentences + self.window_size, side='right')
+        partner_counts = hi - lo
+        idx_a = np.repeat(np.arange(len(sentences)), partner_counts)
+        idx_b = (
+            np.arange(partner_counts.sum())
+            - np.repeat(np.cumsum(partner_counts) - partner_counts, partner_counts)
+            + np.repeat(lo, partner_counts)
+        )
 
-        # Build co-occurrence matrix
-        co_matrix = {}
+        # Skip self-connections
+        distinct = codes[idx_a] != codes[idx_b]
+        idx_a, idx_b = idx_a[distinct], idx_b[distinct]
+
+        # Sentence distance and proximity weight
+        # Weight: 3 for same sentence, 2 for adjacent, 1 for within window
+        distance = np.abs(sentences[idx_a] - sentences[idx_b])
+        weight = np.select([distance == 0, distance == 1], [3.0, 2.0], default=1.0)
+
+        # Group occurrences by ordered (alphabetical) pair, numbering pairs
+        # in order of first occurrence
+        pair_a = np.minimum(codes[idx_a], codes[idx_b])
+        pair_b = np.maximum(codes[idx_a], codes[idx_b])
+        _, first, group = np.unique(
+            pair_a * len(entity_names) + pair_b, return_index=True, return_inverse=True
+        )
+        by_first = np.argsort(first)
+        pair_rank = np.empty(len(first), dtype=np.int64)
+        pair_rank[by_first] = np.arange(len(first))
+        group = pair_rank[group.ravel()]
+        n_pairs = len(first)
+
+        # Per-pair aggregates (bincount adds in occurrence order)
+        occurrence_count = np.bincount(group, minlength=n_pairs)
+        total_weight = np.bincount(group, weights=weight, minlength=n_pairs)
+        same_sentence = np.bincount(group[distance == 0], minlength=n_pairs)
+        adjacent_sentence = np.bincount(group[distance == 1], minlength=n_pairs)
+        near_proximity = np.bincount(group[distance > 1], minlength=n_pairs)
+        distance_sum = np.bincount(group, weights=distance, minlength=n_pairs).astype(np.int64)
+        confidence_a_sum = np.bincount(group, weights=confidences[idx_a], minlength=n_pairs)
+        confidence_b_sum = np.bincount(group, weights=confidences[idx_b], minlength=n_pairs)
+        min_distance = np.full(n_pairs, 999, dtype=np.int64)
+        np.minimum.at(min_distance, group, distance)
+        max_distance = np.zeros(n_pairs, dtype=np.int64)
+        np.maximum.at(max_distance, group, distance)
+
+        # Occurrence details, as one record array split per pair
+        if self.keep_occurrences:
+            records = np.empty(len(group), dtype=OCCURRENCE_DTYPE)
+            records['article_id'] = article_id if article_id is not None else -1
+            records['sentence_index'] = sentences[idx_a]
+            records['distance'] = distance
+            records['weight'] = weight
+            records['confidence_a'] = confidences[idx_a]
+            records['confidence_b'] = confidences[idx_b]
+            occurrences = np.split(
+                records[np.argsort(group, kind='stable')],
+                np.cumsum(occurrence_count)[:-1]
+            )
+        else:
+            occurrences = [NO_OCCURRENCES] * n_pairs
 
-        # Get sorted sentence indices
-        sentence_indices = sorted(entities_by_sentence.keys())
-
-        # For each sentence
-        for i, sent_idx in enumerate(sentence_indices):
-            entities_i = entities_by_sentence[sent_idx]
-
-            # Define window bounds
-            window_start = max(0, i - self.window_size)
-            window_end = min(len(sentence_indices), i + self.window_size + 1)
-
-            # For each entity in current sentence
-            for entity_a in entities_i:
-                # Look at entities in window
-                for j in range(window_start, window_end):
-                    sent_idx_j = sentence_indices[j]
-
-                    for entity_b in entities_by_sentence[sent_idx_j]:
-                        # Skip self-connections
-                        if entity_a['entity'] == entity_b['entity']:
-                            continue
-
-                        # Create ordered pair (alphabetical to avoid duplicates)
-                        pair = tuple(sorted([entity_a['entity'], entity_b['entity']]))
-
-                        # Calculate sentence distance
-                        distance = abs(sent_idx - sent_idx_j)
-
-                        # Skip if outside window
-                        if distance > self.window_size:
-                            continue
-
-                        # Calculate proximity weight
-                        # Weight: 3 for same sentence, 2 for adjacent, 1 for within window
-                        if distance == 0:
-                            weight = 3.0
-                        elif distance == 1:
-                            weight = 2.0
-                        else:
-                            weight = 1.0
-
-                        # Initialize or update co-occurrence data
-                        if pair not in co_matrix:
-                            co_matrix[pair] = CooccurrenceData(
-                                entity_a=pair[0],
-                                entity_b=pair[1],
-                                total_weight=0,
-                                occurrences=[],
-                                min_distance=999,
-                                max_distance=0
-                            )
-
-                        co_data = co_matrix[pair]
-                        co_data.total_weight += weight
-                        co_data.min_distance = min(co_data.min_distance, distance)
-                        co_data.max_distance = max(co_data.max_distance, distance)
-
-                        # Count by proximity category
-                        if distance == 0:
-                            co_data.same_sentence_count += 1
-                        elif distance == 1:
-                            co_data.adjacent_sentence_count += 1
-                        else:
-                            co_data.near_proximity_count += 1
-
-                        # Store occurrence details
-                        co_data.occurrences.append({
-                            'article_id': article_id,
-                            'sentence_index': sent_idx,
-                            'distance': distance,
-                            'weight': weight,
-                            'confidence_a': entity_a.get('confidence', 1.0),
-                            'confidence_b': entity_b.get('confidence', 1.0)
-                        })
-
-        # Calculate average distances
-        for pair, data in co_matrix.items():
-            if data.occurrences:
-                data.avg_distance = sum(o['distance'] for o in data.occurrences) / len(data.occurrences)
+        # Build co-occurrence matrix. Columns are converted to Python lists
+        # up front: indexing NumPy arrays element by element here would cost
+        # more than everything above
+        co_matrix = {}
+        first_occurrences = first[by_first]
+        for (code_a, code_b, pair_total_weight, pair_min_distance, pair_max_distance,
+             pair_same, pair_adjacent, pair_near, pair_count,
+             pair_confidence_a_sum, pair_confidence_b_sum, pair_distance_sum,
+             pair_occurrences) in zip(
+            pair_a[first_occurrences].tolist(), pair_b[first_occurrences].tolist(),
+            total_weight.tolist(), min_distance.tolist(), max_distance.tolist(),
+            same_sentence.tolist(), adjacent_sentence.tolist(), near_proximity.tolist(),
+            occurrence_count.tolist(), confidence_a_sum.tolist(), confidence_b_sum.tolist(),
+            distance_sum.tolist(), occurrences
+        ):
+            pair = (entity_names[code_a], entity_names[code_b])
+            co_matrix[pair] = CooccurrenceData(
+                entity_a=pair[0],
+                entity_b=pair[1],
+                total_weight=pair_total_weight,
+                occurrences=pair_occurrences,
+                min_distance=pair_min_distance,
+                max_distance=pair_max_distance,
+                avg_distance=pair_distance_sum / pair_count,
+                same_sentence_count=pair_same,
+                adjacent_sentence_count=pair_adjacent,
+                near_proximity_count=pair_near,
+                occurrence_count=pair_count,
+                confidence_a_sum=pair_confidence_a_sum,
+                confidence_b_sum=pair_confidence_b_sum,
+                distance_sum=pair_distance_sum
+            )
 
         logger.info(
             f"Article {article_id}: Built co-occurrence matrix with "